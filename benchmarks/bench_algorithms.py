@@ -0,0 +1,53 @@
+""" Calendar algorithms with and without the precomputed year table.
+
+Example:
+    python -m benchmarks.bench_algorithms
+
+"""
+
+import random
+from temporal.algorithms import (build_year_table, clear_year_table,
+                                 date_to_days, day_of_week_from_date,
+                                 is_leap, year_start)
+from benchmarks.common import report
+
+ROWS = 100_000
+
+
+def main() -> None:
+    rng = random.Random(2024)
+    years = [rng.randint(1950, 2100) for _ in range(ROWS)]
+    dates = [(year, rng.randint(1, 12), rng.randint(1, 28)) for year in years]
+
+    def leap():
+        for year in years:
+            is_leap(year)
+
+    def start():
+        for year in years:
+            year_start(year)
+
+    def start_date_to_days():
+        for year in years:
+            date_to_days(year, 1, 1)
+
+    def weekday():
+        for year, month, day in dates:
+            day_of_week_from_date(year, month, day)
+
+    report('date_to_days(year, 1, 1)', start_date_to_days, ROWS)
+    for label in ('table', 'arithmetic'):
+        if label == 'table':
+            table = build_year_table()
+            print(f'year table {table.first}-{table.last}: '
+                  f'{table.memory_footprint()} bytes')
+        else:
+            clear_year_table()
+        report(f'is_leap ({label})', leap, ROWS)
+        report(f'year_start ({label})', start, ROWS)
+        report(f'day_of_week_from_date ({label})', weekday, ROWS)
+    build_year_table()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+""" Constructions per second for each Date constructor.
+
+Example:
+    python -m benchmarks.bench_construction
+
+"""
+
+import random
+from temporal.algorithms import days_to_date, to_iso, to_ordinal
+from temporal.types import Date
+from benchmarks.common import report
+
+ROWS = 50_000
+
+
+def main() -> None:
+    rng = random.Random(2024)
+    fields = [days_to_date(rng.randint(693900, 767000)) for _ in range(ROWS)]
+    ordinals = [to_ordinal(*date) for date in fields]
+    iso_days = [to_iso(*date) for date in fields]
+    timestamps = [rng.randint(0, 4_000_000_000) for _ in range(ROWS)]
+    weeks = [(rng.randint(1950, 2050), rng.randint(1, 52), rng.randint(1, 7))
+             for _ in range(ROWS)]
+
+    def init():
+        for year, month, day in fields:
+            Date(year, month, day)
+
+    def from_ordinal():
+        for ordinal in ordinals:
+            Date.from_ordinal(ordinal)
+
+    def from_timestamp():
+        for seconds in timestamps:
+            Date.from_timestamp(seconds)
+
+    def from_iso_date():
+        for days in iso_days:
+            Date.from_iso_date(days)
+
+    def from_iso_calendar():
+        for year, week, day in weeks:
+            Date.from_iso_calendar(year, week, day)
+
+    report('Date(year, month, day)', init, ROWS)
+    report('Date.from_ordinal', from_ordinal, ROWS)
+    report('Date.from_timestamp', from_timestamp, ROWS)
+    report('Date.from_iso_date', from_iso_date, ROWS)
+    report('Date.from_iso_calendar', from_iso_calendar, ROWS)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+""" Sorting, hashing and calendar queries on large Date collections.
+
+Example:
+    python -m benchmarks.bench_date
+
+"""
+
+import random
+from temporal.types import Date
+from benchmarks.common import report
+
+ROWS = 100_000
+
+
+def main() -> None:
+    rng = random.Random(2024)
+    dates = [Date._from_days(rng.randint(693900, 767000))
+             for _ in range(ROWS)]
+    lookup = dict.fromkeys(dates, 0)
+
+    def sort():
+        sorted(dates)
+
+    def dict_lookup():
+        for date in dates:
+            lookup[date]
+
+    def weekday():
+        for date in dates:
+            date.weekday()
+
+    report('sorted(dates)', sort, ROWS)
+    report('dict lookup', dict_lookup, ROWS)
+    report('Date.weekday', weekday, ROWS)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+""" Scaling of the process-pool parser and formatter with the worker count.
+
+Example:
+    python -m benchmarks.bench_parallel
+
+"""
+
+import os
+import tempfile
+from temporal.parallel import format_days, parse_buffer, parse_file
+from temporal.parsers import parse_iso_column
+from benchmarks.bench_parsers import make_dates
+from benchmarks.common import report
+
+ROWS = 2_000_000
+CHUNK_SIZE = 1024 * 1024
+
+
+def main() -> None:
+    buffer = ('\n'.join(make_dates(ROWS)) + '\n').encode('ascii')
+    days, _ = parse_iso_column(buffer)
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as file:
+        file.write(buffer)
+    try:
+        report('parse_iso_column(bytes)', lambda: parse_iso_column(buffer),
+               ROWS, repeat=3)
+        for workers in counts:
+            report(f'parse_buffer(workers={workers})',
+                   lambda: parse_buffer(buffer, workers, CHUNK_SIZE),
+                   ROWS, repeat=3)
+        for workers in counts:
+            report(f'parse_file(workers={workers})',
+                   lambda: parse_file(file.name, workers, CHUNK_SIZE),
+                   ROWS, repeat=3)
+        for workers in counts:
+            report(f'format_days(workers={workers})',
+                   lambda: format_days(days, '%Y-%m-%d', workers, 100_000),
+                   ROWS, repeat=3)
+    finally:
+        os.unlink(file.name)
+
+
+if __name__ == '__main__':
+    main()
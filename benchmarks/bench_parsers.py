@@ -0,0 +1,53 @@
+""" Throughput of the bulk ISO-8601 parser against the scalar parsers.
+
+Example:
+    python -m benchmarks.bench_parsers
+
+"""
+
+import random
+import iso_parser
+from temporal.algorithms import date_to_days, days_to_date
+from temporal.parsers import iso_calendar, parse_iso_column, parse_iso_dates
+from benchmarks.common import report
+
+ROWS = 100_000
+
+
+def make_dates(rows: int = ROWS, seed: int = 2024):
+    "Seeded YYYY-MM-DD strings between 1900 and 2100."
+    rng = random.Random(seed)
+    first = date_to_days(1900, 1, 1)
+    last = date_to_days(2100, 12, 31)
+    return [
+        '{:04}-{:02}-{:02}'.format(*days_to_date(rng.randint(first, last)))
+        for _ in range(rows)]
+
+
+def main() -> None:
+    lines = make_dates()
+    buffer = '\n'.join(lines).encode('ascii')
+
+    def scalar_iso_calendar():
+        for line in lines:
+            date_to_days(*iso_calendar(line))
+
+    def scalar_iso_format():
+        for line in lines:
+            date_to_days(*iso_parser.iso_format(line))
+
+    report('iso_calendar + date_to_days', scalar_iso_calendar, ROWS)
+    report('iso_parser.iso_format + date_to_days', scalar_iso_format, ROWS)
+    report('parse_iso_dates(list of str)', lambda: parse_iso_dates(lines),
+           ROWS)
+    report('parse_iso_dates(bytes)', lambda: parse_iso_dates(buffer), ROWS)
+    report('parse_iso_column(list of str)', lambda: parse_iso_column(lines),
+           ROWS)
+    basic = [line.replace('-', '') for line in lines]
+    report('parse_iso_dates(YYYYMMDD)', lambda: parse_iso_dates(basic), ROWS)
+    report('parse_iso_column(YYYYMMDD)', lambda: parse_iso_column(basic),
+           ROWS)
+
+
+if __name__ == '__main__':
+    main()
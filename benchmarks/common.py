@@ -0,0 +1,59 @@
+""" Shared timing helpers for the benchmark scripts.
+
+Each benchmark is a zero argument callable that processes a known number of
+rows. Run the scripts from the repository root, e.g.:
+    python -m benchmarks.bench_parsers
+
+"""
+
+import timeit
+import tracemalloc
+
+
+def measure(func, rows: int, repeat: int = 5, number: int = 1) -> float:
+    """Times func and returns its best throughput in rows per second.
+
+    Args:
+        func: Zero argument callable processing rows items per call.
+        rows: Number of items handled by one call of func.
+        repeat: Number of timing rounds, the fastest one is reported.
+        number: Calls of func per timing round.
+
+    Returns:
+        Rows processed per second in the fastest round.
+    """
+
+    best = min(timeit.repeat(func, repeat=repeat, number=number))
+    return rows * number / best
+
+
+def report(name: str, func, rows: int, **kwargs) -> float:
+    "Measures func and prints one aligned result line."
+    rate = measure(func, rows, **kwargs)
+    print(f'{name:<40} {rate:>14,.0f} rows/s')
+    return rate
+
+
+def peak_memory(func) -> int:
+    "Returns the peak number of bytes allocated by Python during one call."
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_case(func, rows: int, repeat: int = 5, number: int = 1) -> dict:
+    """Measures func for machine readable results.
+
+    Timing and memory tracing run separately, as tracemalloc slows down
+    every allocation.
+
+    Returns:
+        A dict of rows, ops_per_sec, ns_per_op and peak_bytes.
+    """
+
+    rate = measure(func, rows, repeat=repeat, number=number)
+    return {'rows': rows, 'ops_per_sec': rate, 'ns_per_op': 1e9 / rate,
+            'peak_bytes': peak_memory(func)}
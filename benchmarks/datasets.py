@@ -0,0 +1,57 @@
+""" Seeded datasets shared by the benchmark suite.
+
+Every dataset is a list of day counts since 0000-03-01 built from a fixed
+seed, so two runs of the suite measure exactly the same inputs:
+    typical: uniform dates between 1950 and 2050.
+    edge: leap days, month and year boundaries, century years and dates
+        with zero or negative proleptic ordinals.
+    bulk: a large column of typical dates.
+
+"""
+
+import random
+from temporal.algorithms import date_to_days
+
+SEED = 2024
+
+TYPICAL_ROWS = 20_000
+EDGE_ROWS = 20_000
+BULK_ROWS = 500_000
+
+_TYPICAL_FIRST = date_to_days(1950, 1, 1)
+_TYPICAL_LAST = date_to_days(2050, 12, 31)
+
+
+def typical(rows: int = TYPICAL_ROWS, seed: int = SEED) -> list:
+    "Uniform dates between 1950 and 2050."
+    rng = random.Random(seed)
+    return [rng.randint(_TYPICAL_FIRST, _TYPICAL_LAST) for _ in range(rows)]
+
+
+def _edge_pool() -> list:
+    pool = []
+    for year in (1600, 1700, 1900, 1999, 2000, 2023, 2024, 2100, 2400):
+        pool += [date_to_days(year, 1, 1), date_to_days(year, 2, 28),
+                 date_to_days(year, 3, 1), date_to_days(year, 12, 31)]
+        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            pool.append(date_to_days(year, 2, 29))
+    for year in (1, 9999):
+        pool += [date_to_days(year, 1, 1), date_to_days(year, 12, 31)]
+    # 0001-01-01 is ordinal 1 and day count 306, below are ordinals <= 0.
+    pool += range(-2000, 306, 97)
+    return pool
+
+
+def edge(rows: int = EDGE_ROWS, seed: int = SEED) -> list:
+    "Dates drawn from leap days, year boundaries and negative ordinals."
+    rng = random.Random(seed)
+    pool = _edge_pool()
+    return [rng.choice(pool) for _ in range(rows)]
+
+
+def bulk(rows: int = BULK_ROWS, seed: int = SEED) -> list:
+    "A large column of typical dates."
+    return typical(rows, seed)
+
+
+DATASETS = {'typical': typical, 'edge': edge, 'bulk': bulk}
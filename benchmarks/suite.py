@@ -0,0 +1,375 @@
+""" Benchmark suite over the public entry points, with regression checks.
+
+Every case runs against every dataset of benchmarks.datasets and results
+are written as JSON, keyed by 'case[dataset]'. compare reads two such
+files and flags every case whose throughput dropped by more than the
+threshold, exiting with status 1 when there is one.
+
+Example:
+    python -m benchmarks.suite run -o baseline.json
+    python -m benchmarks.suite run -o current.json --baseline baseline.json
+    python -m benchmarks.suite compare baseline.json current.json
+
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import iso_parser
+from temporal.algorithms import (days_to_date, days_to_iso_week,
+                                 days_to_year, to_iso, year_start)
+from temporal.arrays import DateArray
+from temporal.constants import UNIX_EPOCH_DAYS
+from temporal.parsers import (format_many, iso_calendar, iso_format,
+                              iso_ordinal, iso_time_to_microseconds,
+                              iso_to_days, iso_week, parse_iso_column,
+                              parse_iso_dates, parse_iso_duration,
+                              parse_iso_durations, parse_iso_times, strftime)
+from temporal.types import Date
+from benchmarks.common import measure_case
+from benchmarks.datasets import DATASETS, SEED
+
+DEFAULT_THRESHOLD = 0.10
+
+
+def _iso_strings(days):
+    "YYYY-MM-DD text for the dates that have a four digit year."
+    return ['{:04}-{:02}-{:02}'.format(*fields)
+            for fields in map(days_to_date, days)
+            if 1 <= fields[0] <= 9999]
+
+
+def _iso_weeks(days):
+    "YYYY-Www-D text for the dates whose ISO year has four digits."
+    weeks = map(days_to_iso_week, days)
+    return ['{:04}-W{:02}-{}'.format(*week) for week in weeks
+            if 1 <= week[0] <= 9999]
+
+
+def _iso_ordinals(days):
+    "YYYYDDD text for the dates that have a four digit year."
+    return [f'{year:04}{n - year_start(year) + 1:03}'
+            for n, year in zip(days, map(days_to_year, days))
+            if 1 <= year <= 9999]
+
+
+def _iso_times(days):
+    "hh:mm:ss.ffffff and hh:mm:ss text, one per row of the dataset."
+    rng = random.Random(SEED)
+    times = []
+    for _ in days:
+        text = (f'{rng.randrange(24):02}:{rng.randrange(60):02}:'
+                f'{rng.randrange(60):02}')
+        if rng.random() < 0.5:
+            text += f'.{rng.randrange(1_000_000):06}'
+        times.append(text)
+    return times
+
+
+def _iso_durations(days):
+    "Durations from a small pool of shapes, one per row of the dataset."
+    rng = random.Random(SEED)
+    shapes = ('P{}D', 'PT{}H', 'PT{}M', 'P{}DT{}H', 'PT{}H{}M{}S', 'P{}W',
+              'P{}Y{}M{}DT{}H{}M{}S')
+    durations = []
+    for _ in days:
+        shape = rng.choice(shapes)
+        values = [rng.randrange(1, 100) for _ in range(shape.count('{}'))]
+        durations.append(shape.format(*values))
+    return durations
+
+
+def _dates(days):
+    return [Date._from_days(n) for n in days]
+
+
+def case_init(days):
+    fields = [days_to_date(n) for n in days]
+
+    def run():
+        for year, month, day in fields:
+            Date(year, month, day)
+    return run, len(fields)
+
+
+def case_from_ordinal(days):
+    # Day count 305 is ordinal 0, which is not a valid ordinal.
+    ordinals = [n - 305 for n in days if n != 305]
+
+    def run():
+        for ordinal in ordinals:
+            Date.from_ordinal(ordinal)
+    return run, len(ordinals)
+
+
+def case_from_timestamp(days):
+    seconds = [(n - UNIX_EPOCH_DAYS) * 86400 + 43200 for n in days]
+
+    def run():
+        for value in seconds:
+            Date.from_timestamp(value)
+    return run, len(seconds)
+
+
+def case_from_iso_date(days):
+    values = [to_iso(*days_to_date(n)) for n in days]
+
+    def run():
+        for value in values:
+            Date.from_iso_date(value)
+    return run, len(values)
+
+
+def case_as_strftime(days):
+    dates = [date for date in _dates(days) if 1000 <= date.year <= 9999]
+
+    def run():
+        for date in dates:
+            date.as_strftime('%d %b %Y')
+    return run, len(dates)
+
+
+def case_strftime(days):
+    dates = [date for date in _dates(days) if 1000 <= date.year <= 9999]
+
+    def run():
+        for date in dates:
+            strftime(date, '%Y-%m-%d')
+    return run, len(dates)
+
+
+def case_format_many(days):
+    dates = [date for date in _dates(days) if 1000 <= date.year <= 9999]
+    return (lambda: format_many(dates, '%Y-%m-%d')), len(dates)
+
+
+def case_week(days):
+    dates = _dates(days)
+
+    def run():
+        for date in dates:
+            date.week()
+    return run, len(dates)
+
+
+def case_weekday_column(days):
+    column = DateArray(days)
+    return column.weekday, len(column)
+
+
+def case_iso_to_days(days):
+    lines = _iso_strings(days)
+
+    def run():
+        for line in lines:
+            iso_to_days(line)
+    return run, len(lines)
+
+
+def case_parse_iso_dates(days):
+    lines = _iso_strings(days)
+    return (lambda: parse_iso_dates(lines)), len(lines)
+
+
+def case_parse_iso_dates_bytes(days):
+    lines = _iso_strings(days)
+    buffer = '\n'.join(lines).encode('ascii')
+    return (lambda: parse_iso_dates(buffer)), len(lines)
+
+
+def case_parse_iso_column(days):
+    lines = _iso_strings(days)
+    return (lambda: parse_iso_column(lines)), len(lines)
+
+
+def _scalar_case(function, lines):
+    def run():
+        for line in lines:
+            function(line)
+    return run, len(lines)
+
+
+def case_parsers_iso_format(days):
+    return _scalar_case(iso_format, _iso_strings(days))
+
+
+def case_iso_calendar(days):
+    return _scalar_case(iso_calendar, _iso_strings(days))
+
+
+def case_iso_week(days):
+    return _scalar_case(iso_week, _iso_weeks(days))
+
+
+def case_iso_ordinal(days):
+    return _scalar_case(iso_ordinal, _iso_ordinals(days))
+
+
+def case_iso_time_to_microseconds(days):
+    return _scalar_case(iso_time_to_microseconds, _iso_times(days))
+
+
+def case_parse_iso_times(days):
+    lines = _iso_times(days)
+    return (lambda: parse_iso_times(lines)), len(lines)
+
+
+def case_parse_iso_duration(days):
+    return _scalar_case(parse_iso_duration, _iso_durations(days))
+
+
+def case_parse_iso_durations(days):
+    lines = _iso_durations(days)
+    return (lambda: parse_iso_durations(lines)), len(lines)
+
+
+def case_iso_parser(days):
+    lines = _iso_strings(days)
+
+    def run():
+        for line in lines:
+            iso_parser.iso_format(line)
+    return run, len(lines)
+
+
+CASES = {
+    'Date(year, month, day)': case_init,
+    'Date.from_ordinal': case_from_ordinal,
+    'Date.from_timestamp': case_from_timestamp,
+    'Date.from_iso_date': case_from_iso_date,
+    'Date.as_strftime': case_as_strftime,
+    'Date.week': case_week,
+    'DateArray.weekday': case_weekday_column,
+    'parsers.strftime': case_strftime,
+    'parsers.format_many': case_format_many,
+    'parsers.iso_to_days': case_iso_to_days,
+    'parsers.parse_iso_dates': case_parse_iso_dates,
+    'parsers.parse_iso_dates(bytes)': case_parse_iso_dates_bytes,
+    'parsers.parse_iso_column': case_parse_iso_column,
+    'parsers.iso_format': case_parsers_iso_format,
+    'parsers.iso_calendar': case_iso_calendar,
+    'parsers.iso_week': case_iso_week,
+    'parsers.iso_ordinal': case_iso_ordinal,
+    'parsers.iso_time_to_microseconds': case_iso_time_to_microseconds,
+    'parsers.parse_iso_times': case_parse_iso_times,
+    'parsers.parse_iso_duration': case_parse_iso_duration,
+    'parsers.parse_iso_durations': case_parse_iso_durations,
+    'iso_parser.iso_format': case_iso_parser,
+}
+
+
+def run(datasets=None, pattern: str = None, repeat: int = 5) -> dict:
+    """Runs the selected cases on the selected datasets.
+
+    Args:
+        datasets: Names of DATASETS to use, all of them by default.
+        pattern: Only run cases whose name contains this text.
+        repeat: Timing rounds per case, the fastest one is kept.
+
+    Returns:
+        A dict with run metadata under 'meta' and a dict of measure_case
+        results per 'case[dataset]' under 'results'.
+    """
+
+    results = {}
+    for dataset in datasets or DATASETS:
+        days = DATASETS[dataset]()
+        for name, build in CASES.items():
+            if pattern and pattern not in name:
+                continue
+            func, rows = build(days)
+            key = f'{name}[{dataset}]'
+            results[key] = result = measure_case(func, rows, repeat=repeat)
+            print(f'{key:<48} {result["ops_per_sec"]:>14,.0f} ops/s '
+                  f'{result["ns_per_op"]:>10,.1f} ns/op '
+                  f'{result["peak_bytes"] / 1024:>10,.0f} KiB')
+    meta = {'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': repeat}
+    return {'meta': meta, 'results': results}
+
+
+def compare(baseline: dict, current: dict,
+            threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Compares the throughput of two runs case by case.
+
+    Args:
+        baseline: Results returned by run, or loaded from its JSON file.
+        current: Results of the run to check.
+        threshold: Relative throughput drop that counts as a regression,
+            0.10 for 10 percent.
+
+    Returns:
+        A list of (key, baseline ops/s, current ops/s, relative change)
+        tuples for the regressed cases.
+    """
+
+    regressions = []
+    before = baseline['results']
+    for key, result in current['results'].items():
+        if key not in before:
+            print(f'{key:<48} {"new":>14}')
+            continue
+        old = before[key]['ops_per_sec']
+        new = result['ops_per_sec']
+        change = new / old - 1
+        flag = ''
+        if change < -threshold:
+            flag = '  REGRESSION'
+            regressions.append((key, old, new, change))
+        print(f'{key:<48} {old:>14,.0f} -> {new:>14,.0f} ops/s '
+              f'{change:>+8.1%}{flag}')
+    return regressions
+
+
+def _load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('-o', '--output', help='write JSON results here')
+    run_parser.add_argument('-d', '--dataset', action='append',
+                            choices=sorted(DATASETS), help='repeatable')
+    run_parser.add_argument('-k', '--filter', help='substring of case names')
+    run_parser.add_argument('-r', '--repeat', type=int, default=5)
+    run_parser.add_argument('--baseline', help='compare against this file')
+    run_parser.add_argument('--threshold', type=float,
+                            default=DEFAULT_THRESHOLD)
+    compare_parser = commands.add_parser('compare',
+                                         help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float,
+                                default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        current = run(args.dataset, args.filter, args.repeat)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(current, file, indent=2, sort_keys=True)
+        if not args.baseline:
+            return 0
+        baseline = _load(args.baseline)
+    else:
+        baseline = _load(args.baseline)
+        current = _load(args.current)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f'{len(regressions)} regression(s) beyond '
+              f'{args.threshold:.0%}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,5 @@
-from temporal.types import Date
+from temporal.types import Date, DateTime, Time, TimeDelta
+from temporal.arrays import DateArray
+from temporal.ranges import DateRange
 
-__all__ = ('Date',)
+__all__ = ('Date', 'DateArray', 'DateRange', 'DateTime', 'Time', 'TimeDelta')
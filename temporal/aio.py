@@ -0,0 +1,159 @@
+""" Incremental parsing of date columns from asyncio streams.
+
+aparse_dates reads a bounded amount of bytes at a time from an
+asyncio.StreamReader, or from any async iterator of bytes, and yields the
+parsed rows in batches. Nothing is read ahead of the consumer, so a slow
+consumer applies backpressure to the stream, and at most one read plus one
+batch of rows is buffered at any time. The layout is detected once from
+the first batch; batches are parsed with parsers.parse_iso_column for it,
+or with parsers.parse_iso_dates when no layout was detected, either in an
+executor or on the event loop in
+slices of INLINE_ROWS rows with a yield to the loop after each slice, so
+parsing never holds the loop for more than a few milliseconds.
+
+Example:
+    >>> reader, writer = await asyncio.open_connection(host, port)
+    >>> async for days, errors in aparse_dates(reader, batch_rows=50_000):
+    ...     store(days)
+
+"""
+
+import asyncio
+from temporal.parsers import (SNIFF_SAMPLE_SIZE, _split_lines,
+                              detect_iso_variant, parse_iso_column,
+                              parse_iso_dates)
+from temporal.types import Date
+
+DEFAULT_READ_SIZE = 64 * 1024
+DEFAULT_BATCH_ROWS = 10_000
+MAX_LINE_SIZE = 64 * 1024
+# Rows parsed on the event loop between two yields to it, about 3 ms
+INLINE_ROWS = 1_000
+
+
+async def _chunks(source, read_size: int):
+    "Yield the bytes of a StreamReader or of an async iterator of bytes."
+    read = getattr(source, 'read', None)
+    if read is not None:
+        while True:
+            chunk = await read(read_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in source:
+            # Split large chunks so that one read never floods the buffer.
+            for start in range(0, len(chunk), read_size):
+                yield chunk[start:start + read_size]
+
+
+async def alines(source, read_size: int = DEFAULT_READ_SIZE,
+                 max_line: int = MAX_LINE_SIZE):
+    """Yields the rows of a byte stream as lists of strings.
+
+    Each list holds the complete lines of one read; a trailing partial line
+    is carried over to the next read.
+
+    Args:
+        source: An asyncio.StreamReader or an async iterator of bytes.
+        read_size: Maximum number of bytes requested per read.
+        max_line: Maximum length of a single line in bytes.
+
+    Raises:
+        ValueError: A line is longer than max_line.
+    """
+
+    if read_size < 1:
+        raise ValueError('read_size must be positive', f'{read_size!r}')
+    pending = b''
+    async for chunk in _chunks(source, read_size):
+        data = pending + bytes(chunk)
+        cut = data.rfind(b'\n') + 1
+        pending = data[cut:]
+        if len(pending) > max_line:
+            raise ValueError(f'line exceeds {max_line} bytes')
+        if cut:
+            yield _split_lines(data[:cut])
+    if pending:
+        yield _split_lines(pending)
+
+
+def _parse_rows(rows, fill: int, variant):
+    "parse_iso_column for a detected layout, parse_iso_dates without one."
+    if variant is None:
+        return parse_iso_dates(rows, fill)
+    return parse_iso_column(rows, fill, variant)
+
+
+async def aparse_dates(source, batch_rows: int = DEFAULT_BATCH_ROWS,
+                       fill: int = 0, dates: bool = False, executor=None,
+                       read_size: int = DEFAULT_READ_SIZE,
+                       max_line: int = MAX_LINE_SIZE):
+    """Parses a stream of newline separated ISO-8601 dates in batches.
+
+    The layout, or the lack of a common one, is detected from the first
+    batch and reused for the rest of the stream; rows that do not match it
+    still fall back to the general parser.
+
+    Args:
+        source: An asyncio.StreamReader or an async iterator of bytes.
+        batch_rows: Number of rows per yielded batch, the last batch may
+            be shorter.
+        fill: Day count stored for rows that failed to parse.
+        dates: Yield lists of Date instances instead of day count arrays.
+        executor: A concurrent.futures executor to parse batches in, or
+            None to parse on the event loop, INLINE_ROWS rows at a time.
+        read_size: Maximum number of bytes requested per read.
+        max_line: Maximum length of a single line in bytes.
+
+    Yields:
+        Tuples of an array('i') of day counts (or a list of Dates) and a
+        list of (index, message) tuples for failed rows, where index is
+        the position of the row in the whole stream.
+    """
+
+    if batch_rows < 1:
+        raise ValueError('batch_rows must be positive', f'{batch_rows!r}')
+    loop = asyncio.get_running_loop()
+    variant = None
+    detected = False
+    offset = 0
+    rows = []
+
+    async def parse(batch):
+        nonlocal variant, detected, offset
+        # An undetected layout is remembered too, so it is not sniffed again
+        # for every slice and batch.
+        if not detected:
+            variant = detect_iso_variant(batch[:SNIFF_SAMPLE_SIZE])
+            detected = True
+        if executor is None:
+            days, errors = _parse_rows(batch[:INLINE_ROWS], fill, variant)
+            for start in range(INLINE_ROWS, len(batch), INLINE_ROWS):
+                # Let other tasks run between two slices.
+                await asyncio.sleep(0)
+                more, more_errors = _parse_rows(
+                    batch[start:start + INLINE_ROWS], fill, variant)
+                days.extend(more)
+                errors.extend((index + start, message)
+                              for index, message in more_errors)
+            await asyncio.sleep(0)
+        else:
+            days, errors = await loop.run_in_executor(
+                executor, _parse_rows, batch, fill, variant)
+        if offset:
+            errors = [(index + offset, message) for index, message in errors]
+        offset += len(batch)
+        if dates:
+            from_days = Date._from_days
+            return [from_days(n) for n in days], errors
+        return days, errors
+
+    async for lines in alines(source, read_size, max_line):
+        rows.extend(lines)
+        while len(rows) >= batch_rows:
+            batch = rows[:batch_rows]
+            del rows[:batch_rows]
+            yield await parse(batch)
+    if rows:
+        yield await parse(rows)
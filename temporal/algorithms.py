@@ -11,6 +11,96 @@ Example:
 
 """
 
+from array import array
+from functools import lru_cache
+import sys
+from temporal.constants import UNIX_EPOCH_DAYS
+
+YEAR_TABLE_FIRST = 1900
+YEAR_TABLE_LAST = 2200
+
+
+class _YearTable:
+    "Per-year values precomputed for a contiguous range of years."
+    __slots__ = ('first', 'last', 'starts', 'leaps', 'weekdays')
+
+    def __init__(self, first: int, last: int) -> None:
+        years = range(first, last + 1)
+        self.first = first
+        self.last = last
+        self.starts = array('i', [_year_start(year) for year in years])
+        self.leaps = bytes(
+            year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            for year in years)
+        # Sunday == 0 ... Saturday == 6, as in day_of_week_from_date
+        self.weekdays = bytes((start + 3) % 7 for start in self.starts)
+
+    def memory_footprint(self) -> int:
+        "Return the number of bytes held by the table and its buffers."
+        return (sys.getsizeof(self) + sys.getsizeof(self.starts)
+                + sys.getsizeof(self.leaps) + sys.getsizeof(self.weekdays))
+
+
+_year_table = None
+
+
+def build_year_table(first: int = YEAR_TABLE_FIRST,
+                     last: int = YEAR_TABLE_LAST) -> _YearTable:
+    """Precomputes per-year values consulted by the calendar algorithms.
+
+    The table holds the day count of January 1, the leap flag and the
+    weekday of January 1 for every year in the range. Years outside the
+    range fall back to arithmetic. A new table replaces the previous one.
+
+    Args:
+        first: The first year covered by the table.
+        last: The last year covered by the table, inclusive.
+
+    Returns:
+        The table now in use.
+
+    Raises:
+        ValueError: first is greater than last.
+    """
+
+    global _year_table
+    if first > last:
+        raise ValueError('first year must not be after last year',
+                         f'{first!r} > {last!r}')
+    _year_table = _YearTable(first, last)
+    return _year_table
+
+
+def clear_year_table() -> None:
+    "Drops the precomputed year table, all lookups use arithmetic."
+    global _year_table
+    _year_table = None
+
+
+def _year_start(year):
+    "Day count of January 1, computed without the table."
+    year -= 1
+    return 365 * year + year // 4 - year // 100 + year // 400 + 306
+
+
+def year_start(year: int) -> int:
+    """Returns the day count of January 1 of the given year.
+
+    Equivalent to date_to_days(year, 1, 1).
+
+    Args:
+        year: The year to look up.
+
+    Returns:
+        An integer representing the amount of days from 0000-03-01 to
+        January 1 of year.
+    """
+
+    table = _year_table
+    if table is not None and table.first <= year <= table.last:
+        return table.starts[year - table.first]
+    return _year_start(year)
+
 
 def is_leap(year: int) -> bool:
     """Determines if the given year is a leap year.
@@ -29,6 +119,9 @@ def is_leap(year: int) -> bool:
     if not isinstance(year, int):
         raise ValueError('Supplied year is not an integer')
 
+    table = _year_table
+    if table is not None and table.first <= year <= table.last:
+        return table.leaps[year - table.first] == 1
     return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
@@ -87,6 +180,14 @@ def date_to_days(year: int, month: int, day: int):
             + (month * 306 + 5) // 10 + (day - 1)
 
 
+def _days_from_fields(year, month, day):
+    "date_to_days without the type checks, for already validated integers."
+    month = (month + 9) % 12
+    year -= month // 10
+    return 365 * year + year // 4 - year // 100 + year // 400 \
+           + (month * 306 + 5) // 10 + (day - 1)
+
+
 def from_ordinal(ordinal: int):
     """Converts a gregorian ordinal to the corresponding date (Year, Month, Day).
 
@@ -156,7 +257,7 @@ def from_unix_time(days: int):
     if not isinstance(days, int):
         raise ValueError('Supplied days is not an integer')
 
-    days += 719468
+    days += UNIX_EPOCH_DAYS
     return days_to_date(days)
 
 
@@ -181,7 +282,7 @@ def to_unix_time(year: int, month: int, day: int):
             raise TypeError(f'Expected {key} to be an int', f'{value!r}')
 
     days = date_to_days(year, month, day)
-    days -= 719468
+    days -= UNIX_EPOCH_DAYS
     return days
 
 
@@ -231,38 +332,105 @@ def to_iso(year: int, month: int, day: int):
     return days
 
 
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
 def day_of_week_from_date(y, m, d):
-    "Return day of the week, where Monday == 0 ... Sunday == 6."
+    "Return day of the week, where Sunday == 0 ... Saturday == 6."
+    table = _year_table
+    if table is not None and table.first <= y <= table.last:
+        index = y - table.first
+        days = _DAYS_BEFORE_MONTH[m - 1] + d - 1
+        if m > 2:
+            days += table.leaps[index]
+        return (table.weekdays[index] + days) % 7
     t = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
     if m < 3:
         y -= 1
     return (y + y//4 - y//100 + y//400 + t[m-1] + d) % 7
 
+
+def days_to_year(days: int) -> int:
+    "Return the calendar year of a day count, without month and day."
+    year = (10000 * days + 14780) // 3652425
+    ddd = days - (365 * year + year // 4 - year // 100 + year // 400)
+    if ddd < 0:
+        year -= 1
+        ddd = days - (365 * year + year // 4 - year // 100 + year // 400)
+    return year + ((100 * ddd + 52) // 3060 + 2) // 12
+
+
+@lru_cache(maxsize=1024)
+def iso_week_start(iso_year: int) -> int:
+    """Returns the day count of the Monday that starts ISO week 1.
+
+    ISO week 1 is the week containing January 4. Results are memoized per
+    year, as every week computation in that year needs them.
+
+    Args:
+        iso_year: The ISO week-numbering year.
+
+    Returns:
+        An integer representing the amount of days from 0000-03-01 to the
+        first day of the ISO year.
+    """
+
+    jan_4 = year_start(iso_year) + 3
+    return jan_4 - (jan_4 + 2) % 7
+
+
+def days_to_iso_week(days: int):
+    """Converts days to the ISO week date (ISO year, week, ISO weekday).
+
+    Args:
+        days: days since 0000-03-01.
+
+    Returns:
+        A tuple of the ISO year, the week number (1-53) and the ISO weekday
+        where Monday == 1 ... Sunday == 7.
+    """
+
+    weekday = (days + 2) % 7
+    thursday = days - weekday + 3
+    iso_year = days_to_year(thursday)
+    week = (thursday - iso_week_start(iso_year)) // 7 + 1
+    return iso_year, week, weekday + 1
+
+
+def iso_week_to_days(y: int, w: int, wd: int) -> int:
+    """Converts an ISO week date (ISO year, week, ISO weekday) to days.
+
+    Args:
+        y: The ISO year.
+        w: The week number, 1 to 52 or 53.
+        wd: The ISO weekday, Monday == 1 ... Sunday == 7.
+
+    Returns:
+        An integer representing the amount of days that has passed since
+        0000-03-01.
+
+    Raises:
+        ValueError: week or weekday is out of range for the ISO year.
+    """
+
+    start = iso_week_start(y)
+    if not 1 <= w <= 52:
+        weeks = (iso_week_start(y + 1) - start) // 7
+        if not 1 <= w <= weeks:
+            raise ValueError(f'week must be between 1 and {weeks}')
+    if not 1 <= wd <= 7:
+        raise ValueError('weekday must be between 1 and 7')
+    return start + (w - 1) * 7 + wd - 1
+
+
 def week_no_from_date(y,m,d):
     "Returns year, week no and day of week for supplied date"
-    dow = day_of_week_from_date(y,m,d)
-    if dow == 0:
-        dow = 7
-    thursday = d + 4 - dow
-    if m == 12 and thursday > 31:
-        return (y+1, 1, dow)
-    if m == 1 and thursday < 1:
-        y -= 1
-        m = 12
-        thursday += 31
-    doy = 275*m//9 + thursday - 31
-    if m > 2:
-        doy += is_leap(y) - 2
-    return (y, 1 + doy//7, dow)
-
-
-def iso_week_to_date(y, w, wd): # might be off by one (2023,1,1) becomes 2023, 1, 2
-    days_of_year = 365 if not is_leap(y) else 366
-    dow = day_of_week_from_date(y,1,4)
-    d = w * 7 + wd - (dow + 3)
-    if d < 1:
-        d += (days_of_year - 1)
-    elif d > days_of_year:
-        d -= days_of_year
-    d += date_to_days(y,1,1) - 1
-    return days_to_date(d)
\ No newline at end of file
+    return days_to_iso_week(_days_from_fields(y, m, d))
+
+
+def iso_week_to_date(y, w, wd):
+    "Returns year, month and day for the supplied ISO year, week and weekday"
+    return days_to_date(iso_week_to_days(y, w, wd))
+
+
+build_year_table()
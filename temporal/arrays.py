@@ -0,0 +1,259 @@
+""" Columnar date storage.
+
+A DateArray keeps a whole column of dates as one compact array('i') of day
+counts, using the same epoch (0000-03-01) as temporal.algorithms. The
+calendar kernels below run the days_to_date/date_to_days arithmetic over the
+entire column in a single loop instead of building one Date per row.
+
+Example:
+    >>> column = DateArray.from_dates([Date(2024, 2, 29), Date(2023, 1, 1)])
+    >>> column.year
+    array('i', [2024, 2023])
+
+"""
+
+from array import array
+from temporal.algorithms import days_to_iso_week, days_to_year, year_start
+from temporal.constants import MICROSECONDS_PER_DAY
+from temporal.types import Date, TimeDelta
+
+
+def _civil_columns(days):
+    "Vectorized days_to_date, returns three array('i') of year, month, day."
+    years = array('i')
+    months = array('i')
+    mdays = array('i')
+    add_year = years.append
+    add_month = months.append
+    add_day = mdays.append
+    for n in days:
+        year = (10000 * n + 14780) // 3652425
+        ddd = n - (365 * year + year // 4 - year // 100 + year // 400)
+        if ddd < 0:
+            year -= 1
+            ddd = n - (365 * year + year // 4 - year // 100 + year // 400)
+        mi = (100 * ddd + 52) // 3060
+        add_year(year + (mi + 2) // 12)
+        add_month((mi + 2) % 12 + 1)
+        add_day(ddd - (mi * 306 + 5) // 10 + 1)
+    return years, months, mdays
+
+
+def _days_columns(years, months, mdays):
+    "Vectorized date_to_days over three equally long columns."
+    result = array('i')
+    add = result.append
+    for year, month, day in zip(years, months, mdays):
+        month = (month + 9) % 12
+        year -= month // 10
+        add(365 * year + year // 4 - year // 100 + year // 400
+            + (month * 306 + 5) // 10 + (day - 1))
+    return result
+
+
+class DateArray:
+    """A compact column of dates stored as day counts.
+
+    Elements are exposed as Date instances when indexed or iterated, but all
+    bulk operations work directly on the underlying array('i'). There is no
+    item assignment or append; build a new DateArray instead. Constructing
+    one from another DateArray copies its day counts.
+    """
+    __slots__ = ('_days',)
+
+    def __init__(self, days=()) -> None:
+        if isinstance(days, DateArray):
+            days = days._days
+        self._days = array('i', days)
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return f'{cls}({[str(date) for date in self]!r})'
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __iter__(self):
+        for n in self._days:
+            yield Date._from_days(n)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return type(self)(self._days[index])
+        return Date._from_days(self._days[index])
+
+    def __eq__(self, other):
+        if not isinstance(other, DateArray):
+            return NotImplemented
+        return self._days == other._days
+
+    __hash__ = None
+
+    # Additional Constructors
+    @classmethod
+    def from_dates(cls, dates) -> 'DateArray':
+        "Construct a column from an iterable of Date instances."
+        return cls(date._days for date in dates)
+
+    @classmethod
+    def from_fields(cls, years, months, days) -> 'DateArray':
+        "Construct a column from three parallel year, month and day columns."
+        return cls(_days_columns(years, months, days))
+
+    # Column access
+    @property
+    def days(self) -> array:
+        "The underlying array('i') of day counts since 0000-03-01."
+        return self._days
+
+    @property
+    def year(self) -> array:
+        return _civil_columns(self._days)[0]
+
+    @property
+    def month(self) -> array:
+        return _civil_columns(self._days)[1]
+
+    @property
+    def day(self) -> array:
+        return _civil_columns(self._days)[2]
+
+    def fields(self):
+        "Return the year, month and day columns computed in a single pass."
+        return _civil_columns(self._days)
+
+    # Calculation methods
+    def weekday(self) -> array:
+        "Return days of the week, where Monday == 0 ... Sunday == 6."
+        return array('b', [(n + 2) % 7 for n in self._days])
+
+    def iso_weekday(self) -> array:
+        "Return days of the week, where Monday == 1 ... Sunday == 7."
+        return array('b', [(n + 2) % 7 + 1 for n in self._days])
+
+    def day_of_year(self) -> array:
+        return array('h', [n - year_start(days_to_year(n)) + 1
+                           for n in self._days])
+
+    def as_iso_calendar(self):
+        "Return the ISO year, week number and ISO weekday columns."
+        iso_years = array('i')
+        weeks = array('b')
+        weekdays = array('b')
+        for n in self._days:
+            weekday = (n + 2) % 7
+            thursday = n - weekday + 3
+            iso_year = days_to_year(thursday)
+            iso_years.append(iso_year)
+            weeks.append((thursday - year_start(iso_year)) // 7 + 1)
+            weekdays.append(weekday + 1)
+        return iso_years, weeks, weekdays
+
+    # Comparison methods
+    def _other_days(self, other):
+        if isinstance(other, Date):
+            return None, other._days
+        if isinstance(other, DateArray):
+            if len(other) != len(self):
+                raise ValueError('DateArray lengths differ',
+                                 f'{len(self)} != {len(other)}')
+            return other._days, None
+        raise TypeError('Expected a Date or DateArray', f'{other!r}')
+
+    def _compare(self, other, op):
+        column, scalar = self._other_days(other)
+        if column is None:
+            return array('b', [op(n, scalar) for n in self._days])
+        return array('b', [op(a, b) for a, b in zip(self._days, column)])
+
+    def eq(self, other) -> array:
+        "Elementwise ==, against a Date or an equally long DateArray."
+        return self._compare(other, int.__eq__)
+
+    def ne(self, other) -> array:
+        return self._compare(other, int.__ne__)
+
+    def lt(self, other) -> array:
+        return self._compare(other, int.__lt__)
+
+    def le(self, other) -> array:
+        return self._compare(other, int.__le__)
+
+    def gt(self, other) -> array:
+        return self._compare(other, int.__gt__)
+
+    def ge(self, other) -> array:
+        return self._compare(other, int.__ge__)
+
+    def compress(self, mask) -> 'DateArray':
+        "Return the elements whose corresponding mask entry is true."
+        return type(self)(n for n, keep in zip(self._days, mask) if keep)
+
+    # Sorting
+    def sort(self, reverse: bool = False) -> None:
+        "Sort the column in place."
+        self._days = array('i', sorted(self._days, reverse=reverse))
+
+    def argsort(self, reverse: bool = False) -> array:
+        "Return the indices that would sort the column."
+        days = self._days
+        return array('l', sorted(range(len(days)), key=days.__getitem__,
+                                 reverse=reverse))
+
+
+def shift(dates, delta: TimeDelta):
+    """Shifts every date in dates by the same delta.
+
+    Only whole days of delta are applied, as with Date + TimeDelta. The
+    offset is computed once and added to each day count, so no intermediate
+    TimeDelta or Date objects are created for a DateArray.
+
+    Args:
+        dates: A DateArray or an iterable of Date instances.
+        delta: The TimeDelta to add; use a negative delta to shift back.
+
+    Returns:
+        A new DateArray when dates is a DateArray, otherwise a list of Date.
+    """
+
+    if not isinstance(delta, TimeDelta):
+        raise TypeError('Expected delta to be a TimeDelta', f'{delta!r}')
+    offset = delta._microseconds // MICROSECONDS_PER_DAY
+    if isinstance(dates, DateArray):
+        return DateArray([n + offset for n in dates._days])
+    from_days = Date._from_days
+    return [from_days(date._days + offset) for date in dates]
+
+
+def group_by_iso_week(dates) -> dict:
+    """Groups dates by ISO week in a single pass.
+
+    The ISO year and week are computed once per distinct Monday and reused
+    for every other date in the same week.
+
+    Args:
+        dates: A DateArray, an iterable of Date instances or an iterable of
+            day counts.
+
+    Returns:
+        A dict mapping (iso_year, week) to the grouped elements, in order of
+        first appearance. Groups are DateArray instances for a DateArray,
+        otherwise lists of the original elements.
+    """
+
+    keys = {}
+    groups = {}
+    is_column = isinstance(dates, DateArray)
+    for item in (dates._days if is_column else dates):
+        n = item if is_column or isinstance(item, int) else item._days
+        monday = n - (n + 2) % 7
+        key = keys.get(monday)
+        if key is None:
+            key = keys[monday] = days_to_iso_week(monday)[:2]
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = []
+        group.append(item)
+    if is_column:
+        return {key: DateArray(group) for key, group in groups.items()}
+    return groups
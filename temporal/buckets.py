@@ -0,0 +1,232 @@
+""" Time bucketing and resampling of date columns.
+
+Every bucket is identified by the day count of its first day, so keys of
+all units are plain integers that sort chronologically and convert back with
+Date._from_days. Bucket bounds come from the days_to_date arithmetic; the
+bounds of the last bucket are remembered, so sorted or clustered columns
+only do calendar arithmetic once per bucket.
+
+Example:
+    >>> days, _ = parse_iso_dates(lines)
+    >>> for start, count, total, *_ in resample(days, 'month', amounts):
+    ...     print(start, count, total)
+    2024-01-01 31 4180
+    2024-02-01 29 3915
+
+"""
+
+from array import array
+from temporal.algorithms import (_days_from_fields, days_to_date,
+                                 days_to_year, year_start)
+from temporal.arrays import DateArray
+from temporal.constants import UNIX_EPOCH_DAYS
+from temporal.types import Date
+
+UNITS = ('day', 'week', 'month', 'quarter', 'year')
+
+
+def bucket_bounds(days: int, unit: str):
+    """Returns the bucket of unit that contains a day count.
+
+    Weeks are ISO weeks, starting on Monday. Quarters start in January,
+    April, July and October.
+
+    Args:
+        days: days since 0000-03-01.
+        unit: One of UNITS.
+
+    Returns:
+        A tuple of the day counts of the first day of the bucket and of the
+        first day after it.
+
+    Raises:
+        ValueError: unit is not one of UNITS.
+    """
+
+    if unit == 'day':
+        return days, days + 1
+    if unit == 'week':
+        start = days - (days + 2) % 7
+        return start, start + 7
+    if unit == 'year':
+        year = days_to_year(days)
+        return year_start(year), year_start(year + 1)
+    if unit not in UNITS:
+        raise ValueError(f'unit must be one of {UNITS}', f'{unit!r}')
+    year, month, day = days_to_date(days)
+    if unit == 'month':
+        start = days - day + 1
+        step = 1
+    else:
+        month -= (month - 1) % 3
+        start = _days_from_fields(year, month, 1)
+        step = 3
+    carry, month = divmod(month - 1 + step, 12)
+    return start, _days_from_fields(year + carry, month + 1, 1)
+
+
+def _day_counts(values):
+    if isinstance(values, DateArray):
+        return values.days
+    return values
+
+
+def bucket_days(days, unit: str) -> array:
+    """Maps a column of day counts to the start of their buckets.
+
+    Args:
+        days: A DateArray or an iterable of day counts.
+        unit: One of UNITS.
+
+    Returns:
+        An array('i') of bucket keys, aligned with days.
+    """
+
+    if unit not in UNITS:
+        raise ValueError(f'unit must be one of {UNITS}', f'{unit!r}')
+    days = _day_counts(days)
+    if unit == 'day':
+        return array('i', days)
+    if unit == 'week':
+        return array('i', [n - (n + 2) % 7 for n in days])
+    result = array('i')
+    add = result.append
+    start = stop = 0
+    for n in days:
+        if not start <= n < stop:
+            start, stop = bucket_bounds(n, unit)
+        add(start)
+    return result
+
+
+def epoch_to_days(values, per_day: int = 86_400) -> array:
+    """Converts a column of Unix epoch values to day counts.
+
+    Args:
+        values: An iterable of integers since 1970-01-01 UTC.
+        per_day: Units per day, 86_400 for seconds or
+            constants.MICROSECONDS_PER_DAY for microseconds.
+
+    Returns:
+        An array('i') of day counts since 0000-03-01.
+    """
+
+    return array('i', [value // per_day + UNIX_EPOCH_DAYS
+                       for value in values])
+
+
+class BucketAccumulator:
+    """Count, sum, min and max of values per bucket over sorted input.
+
+    Only the open bucket is kept in memory, so unbounded streams are
+    aggregated in constant space. add returns the previous bucket when a
+    value starts a new one.
+
+    Args:
+        unit: One of UNITS.
+    """
+    __slots__ = ('unit', '_start', '_stop', 'count', 'total', 'minimum',
+                 'maximum')
+
+    def __init__(self, unit: str) -> None:
+        if unit not in UNITS:
+            raise ValueError(f'unit must be one of {UNITS}', f'{unit!r}')
+        self.unit = unit
+        self._start = self._stop = 0
+        self.count = 0
+        self.total = self.minimum = self.maximum = None
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return f'{cls}({self.unit!r})'
+
+    def _closed(self):
+        return (Date._from_days(self._start), self.count, self.total,
+                self.minimum, self.maximum)
+
+    def add(self, days: int, value=1):
+        """Add value to the bucket of days.
+        Return the closed (start, count, total, minimum, maximum) tuple when
+        days starts a new bucket, otherwise None.
+        """
+        if self._start <= days < self._stop:
+            self.count += 1
+            self.total += value
+            if value < self.minimum:
+                self.minimum = value
+            elif value > self.maximum:
+                self.maximum = value
+            return None
+        if self.count and days < self._start:
+            raise ValueError('input is not sorted',
+                             f'{Date._from_days(days)!r}')
+        closed = self._closed() if self.count else None
+        self._start, self._stop = bucket_bounds(days, self.unit)
+        self.count = 1
+        self.total = self.minimum = self.maximum = value
+        return closed
+
+    def flush(self):
+        "Return the open bucket as a tuple, or None, and reset."
+        closed = self._closed() if self.count else None
+        self._start = self._stop = 0
+        self.count = 0
+        self.total = self.minimum = self.maximum = None
+        return closed
+
+
+def resample(days, unit: str, values=None):
+    """Aggregates a sorted column per bucket in a single streaming pass.
+
+    Args:
+        days: A DateArray or an iterable of day counts in ascending order.
+        unit: One of UNITS.
+        values: An iterable of numbers aligned with days, counted as 1 each
+            when omitted.
+
+    Yields:
+        (start, count, total, minimum, maximum) tuples per non-empty bucket,
+        where start is the first Date of the bucket.
+
+    Raises:
+        ValueError: days is not sorted.
+    """
+
+    accumulator = BucketAccumulator(unit)
+    add = accumulator.add
+    days = _day_counts(days)
+    if values is None:
+        pairs = ((n, 1) for n in days)
+    else:
+        pairs = zip(days, values)
+    for n, value in pairs:
+        closed = add(n, value)
+        if closed is not None:
+            yield closed
+    closed = accumulator.flush()
+    if closed is not None:
+        yield closed
+
+
+def count_by(days, unit: str) -> dict:
+    """Counts the elements of an unsorted column per bucket in one pass.
+
+    Args:
+        days: A DateArray or an iterable of day counts.
+        unit: One of UNITS.
+
+    Returns:
+        A dict mapping bucket start day counts to counts, in order of first
+        appearance.
+    """
+
+    if unit not in UNITS:
+        raise ValueError(f'unit must be one of {UNITS}', f'{unit!r}')
+    counts = {}
+    get = counts.get
+    start = stop = 0
+    for n in _day_counts(days):
+        if not start <= n < stop:
+            start, stop = bucket_bounds(n, unit)
+        counts[start] = get(start, 0) + 1
+    return counts
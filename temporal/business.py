@@ -0,0 +1,138 @@
+""" Business-day calendars.
+
+Every query is answered from the rank of a day: the number of business days
+before it. The rank is computed in closed form from a cumulative count of
+working weekdays within one week, minus a binary search in the sorted array
+of holidays, so counting is O(log h) and offsetting needs only a few such
+lookups regardless of how far apart the dates are.
+
+Example:
+    >>> calendar = BusinessCalendar(holidays=[Date(2024, 12, 25)])
+    >>> calendar.add_business_days(Date(2024, 12, 24), 1)
+    Date(year=2024, month=12, day=26)
+    >>> calendar.count_business_days(Date(2024, 12, 23), Date(2024, 12, 30))
+    4
+
+"""
+
+from array import array
+from bisect import bisect_left
+from temporal.arrays import DateArray
+from temporal.types import Date
+
+# Day count of a Monday, weeks are measured from here
+_MONDAY = 5
+
+
+class BusinessCalendar:
+    """Working days defined by a weekend and a set of holidays.
+
+    Args:
+        holidays: Dates that are never business days.
+        weekend: Weekdays that are never business days, where
+            Monday == 0 ... Sunday == 6.
+    """
+    __slots__ = ('weekend', '_working', '_prefix', '_positions', '_holidays')
+
+    def __init__(self, holidays=(), weekend=(5, 6)) -> None:
+        weekend = frozenset(weekend)
+        if not weekend <= set(range(7)):
+            raise ValueError('weekend days must be between 0 and 6',
+                             f'{sorted(weekend)!r}')
+        if len(weekend) == 7:
+            raise ValueError('at least one weekday must be a working day')
+        working = bytes(weekday not in weekend for weekday in range(7))
+        prefix = array('b', [0])
+        for is_working in working:
+            prefix.append(prefix[-1] + is_working)
+        holidays = sorted({date._days for date in holidays
+                           if working[(date._days + 2) % 7]})
+        self.weekend = weekend
+        self._working = working
+        # _prefix[r] is the number of working weekdays among the first r
+        # days of a week, _positions[k] the weekday of the k-th of them.
+        self._prefix = prefix
+        self._positions = array('b', [weekday for weekday in range(7)
+                                      if working[weekday]])
+        self._holidays = array('i', holidays)
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return (f'{cls}(holidays={len(self._holidays)!r}, '
+                f'weekend={sorted(self.weekend)!r})')
+
+    def _rank(self, days: int) -> int:
+        "Number of business days before days, relative to a fixed Monday."
+        weeks, weekday = divmod(days - _MONDAY, 7)
+        return (weeks * self._prefix[7] + self._prefix[weekday]
+                - bisect_left(self._holidays, days))
+
+    def _from_rank(self, rank: int) -> int:
+        "The business day with the given rank, the inverse of _rank."
+        holidays = self._holidays
+        per_week = self._prefix[7]
+        skipped = 0
+        while True:
+            weeks, index = divmod(rank + skipped, per_week)
+            days = _MONDAY + weeks * 7 + self._positions[index]
+            before = bisect_left(holidays, days)
+            if before < len(holidays) and holidays[before] == days:
+                skipped = before + 1
+            elif before != skipped:
+                skipped = before
+            else:
+                return days
+
+    def _is_business_day(self, days: int) -> bool:
+        if not self._working[(days + 2) % 7]:
+            return False
+        index = bisect_left(self._holidays, days)
+        return index == len(self._holidays) or self._holidays[index] != days
+
+    def _offset(self, days: int, count: int) -> int:
+        if count > 0:
+            return self._from_rank(self._rank(days + 1) + count - 1)
+        return self._from_rank(self._rank(days) + count)
+
+    def is_business_day(self, date: Date) -> bool:
+        return self._is_business_day(date._days)
+
+    def count_business_days(self, start: Date, stop: Date) -> int:
+        "Return the number of business days in [start, stop)."
+        return self._rank(stop._days) - self._rank(start._days)
+
+    def add_business_days(self, date: Date, count: int) -> Date:
+        """Return the business day count business days after date.
+        A negative count moves back and zero rolls forward to the next
+        business day when date is not one itself.
+        """
+        return Date._from_days(self._offset(date._days, count))
+
+    # Bulk variants
+    def is_business_day_many(self, dates) -> array:
+        "Return a mask of business days for a DateArray or Date sequence."
+        return array('b', [self._is_business_day(days)
+                           for days in _day_counts(dates)])
+
+    def count_business_days_many(self, starts, stops) -> array:
+        "Return the business days in [start, stop) for each pair of dates."
+        rank = self._rank
+        return array('i', [rank(stop) - rank(start) for start, stop in
+                           zip(_day_counts(starts), _day_counts(stops))])
+
+    def add_business_days_many(self, dates, count) -> DateArray:
+        """Offset every date by count business days.
+        count is either one int for all dates or a sequence of them.
+        """
+        offset = self._offset
+        if isinstance(count, int):
+            return DateArray([offset(days, count)
+                              for days in _day_counts(dates)])
+        return DateArray([offset(days, n)
+                          for days, n in zip(_day_counts(dates), count)])
+
+
+def _day_counts(dates):
+    if isinstance(dates, DateArray):
+        return dates.days
+    return [date._days for date in dates]
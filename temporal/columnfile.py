@@ -0,0 +1,203 @@
+""" Memory-mapped date column files.
+
+A date column file is a small header followed by a flat little-endian
+int32 array of day counts on the temporal.algorithms epoch (0000-03-01).
+Files are opened with mmap, so large archives can be range-scanned without
+loading them into Python objects. Sorted files support binary search.
+
+Header layout (24 bytes, little-endian):
+    magic          4s   b'TDCF'
+    version        H    COLUMN_FILE_VERSION
+    flags          H    bit 0 set when the days are sorted ascending
+    epoch          hBB  year, month and day of day count 0
+    padding        4x
+    count          Q    number of stored days
+
+Example:
+    >>> write_date_column('dates.tdc', column)
+    >>> with DateColumnFile('dates.tdc') as dates:
+    ...     march = dates.between(Date(2024, 3, 1), Date(2024, 4, 1))
+
+"""
+
+from array import array
+from bisect import bisect_left
+import mmap
+import struct
+import sys
+from temporal.arrays import DateArray
+from temporal.types import Date
+
+COLUMN_FILE_MAGIC = b'TDCF'
+COLUMN_FILE_VERSION = 1
+COLUMN_FILE_EPOCH = (0, 3, 1)
+FLAG_SORTED = 1
+
+_HEADER = struct.Struct('<4sHHhBB4xQ')
+_CHUNK_SIZE = 65536
+
+
+def _day_counts(dates):
+    "Yield the day counts of a DateArray, Date instances or plain integers."
+    if isinstance(dates, DateArray):
+        yield from dates.days
+        return
+    for date in dates:
+        yield date if isinstance(date, int) else date._days
+
+
+def write_date_column(path, dates) -> int:
+    """Writes dates to a date column file, replacing any existing file.
+
+    The input is consumed in chunks, so it may be a generator over more
+    dates than fit in memory. The sorted flag is set when the input turns
+    out to be in ascending order.
+
+    Args:
+        path: Destination file path.
+        dates: A DateArray, or an iterable of Date instances or day counts.
+
+    Returns:
+        The number of dates written.
+    """
+
+    if sys.byteorder != 'little':
+        raise OSError('date column files require a little-endian host')
+    count = 0
+    is_sorted = True
+    previous = None
+    chunk = array('i')
+    with open(path, 'wb') as file:
+        file.write(bytes(_HEADER.size))
+        for days in _day_counts(dates):
+            if previous is not None and days < previous:
+                is_sorted = False
+            previous = days
+            chunk.append(days)
+            if len(chunk) == _CHUNK_SIZE:
+                chunk.tofile(file)
+                count += len(chunk)
+                chunk = array('i')
+        chunk.tofile(file)
+        count += len(chunk)
+        file.seek(0)
+        file.write(_HEADER.pack(COLUMN_FILE_MAGIC, COLUMN_FILE_VERSION,
+                                FLAG_SORTED if is_sorted else 0,
+                                *COLUMN_FILE_EPOCH, count))
+    return count
+
+
+class DateColumnFile:
+    """A read-only, memory-mapped view of a date column file.
+
+    Indexing returns Date instances and slicing returns a DateArray copy of
+    the slice; the days property exposes the mapped int32 buffer itself.
+    """
+    __slots__ = ('_file', '_map', '_days', 'version', 'is_sorted')
+
+    def __init__(self, path) -> None:
+        if sys.byteorder != 'little':
+            raise OSError('date column files require a little-endian host')
+        self._file = open(path, 'rb')
+        try:
+            header = self._file.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError('file is too short for a date column header')
+            magic, version, flags, *epoch, count = _HEADER.unpack(header)
+            if magic != COLUMN_FILE_MAGIC:
+                raise ValueError('not a date column file', f'{magic!r}')
+            if version != COLUMN_FILE_VERSION:
+                raise ValueError('unsupported date column file version',
+                                 f'{version!r}')
+            if tuple(epoch) != COLUMN_FILE_EPOCH:
+                raise ValueError('unsupported date column epoch',
+                                 f'{tuple(epoch)!r}')
+            size = _HEADER.size + count * 4
+            if count:
+                self._map = mmap.mmap(self._file.fileno(), size,
+                                      access=mmap.ACCESS_READ)
+                self._days = memoryview(self._map)[_HEADER.size:].cast('i')
+            else:
+                self._map = None
+                self._days = memoryview(array('i'))
+        except BaseException:
+            self._file.close()
+            raise
+        self.version = version
+        self.is_sorted = bool(flags & FLAG_SORTED)
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return f'{cls}({self._file.name!r}, count={len(self)!r})'
+
+    def __enter__(self) -> 'DateColumnFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __iter__(self):
+        from_days = Date._from_days
+        for days in self._days:
+            yield from_days(days)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DateArray(self._days[index])
+        return Date._from_days(self._days[index])
+
+    def close(self) -> None:
+        """Release the mapping and the underlying file.
+        Views taken from days must be released first; otherwise the mapping
+        stays open, BufferError is raised and close can be called again
+        once they are gone. The file is closed either way.
+        """
+        try:
+            self._days.release()
+            if self._map is not None:
+                try:
+                    self._map.close()
+                except BufferError:
+                    raise BufferError('release views of days before closing '
+                                      'the column file') from None
+        finally:
+            self._file.close()
+
+    @property
+    def days(self) -> memoryview:
+        """The mapped day counts as a read-only memoryview of format 'i'.
+        Slices of it share the mapping and must be released before close.
+        """
+        return self._days
+
+    def to_array(self) -> DateArray:
+        "Copy the whole column into a DateArray."
+        return DateArray(self._days)
+
+    def bounds(self, start: Date, stop: Date):
+        """Return the index range of dates in [start, stop) by binary search.
+        Only valid for sorted files.
+        """
+        if not self.is_sorted:
+            raise ValueError('binary search requires a sorted column file')
+        lo = bisect_left(self._days, start._days)
+        return lo, bisect_left(self._days, stop._days, lo)
+
+    def between(self, start: Date, stop: Date) -> DateArray:
+        """Return the dates in [start, stop).
+        Sorted files are searched in O(log n), others are scanned.
+        """
+        if self.is_sorted:
+            lo, hi = self.bounds(start, stop)
+            return DateArray(self._days[lo:hi])
+        return self.filter(start, stop)
+
+    def filter(self, start: Date, stop: Date) -> DateArray:
+        "Scan the whole column and return the dates in [start, stop)."
+        first = start._days
+        last = stop._days
+        return DateArray([days for days in self._days
+                          if first <= days < last])
@@ -21,3 +21,9 @@ DAYS_IN_MONTH = {
     11: 30,
     12: 31
 }
+
+MICROSECONDS_PER_SECOND = 1_000_000
+MICROSECONDS_PER_DAY = 86_400 * MICROSECONDS_PER_SECOND
+
+# Day count of 1970-01-01, counting from 0000-03-01
+UNIX_EPOCH_DAYS = 719468
@@ -0,0 +1,209 @@
+""" Opt-in call counting and timing of the hot paths.
+
+Nothing is instrumented until enable() is called: it replaces the Date
+constructors, the temporal.parsers functions and the temporal.algorithms
+conversions with wrappers that count calls and accumulate wall time. As
+other modules import these functions by name, the wrappers are also swapped
+into the globals of every loaded temporal module, and disable() puts the
+originals back everywhere. While disabled the library runs its own
+functions, so there is no overhead at all.
+
+Times are inclusive: a Date.from_ordinal call also shows up in
+algorithms.from_ordinal, which it calls.
+
+Only the temporal modules are patched. A name bound elsewhere by
+'from temporal.parsers import parse_iso_dates' before enable() still refers
+to the original function and its calls are not counted, so measured code
+should call through the module, as parsers.parse_iso_dates.
+
+Example:
+    >>> from temporal import parsers
+    >>> with instrumented() as stats:
+    ...     days, errors = parsers.parse_iso_dates(lines)
+    >>> stats['calls']['parsers.parse_iso_dates']
+    {'calls': 1, 'seconds': 0.0412, 'ns_per_call': 41200000.0}
+
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+import sys
+from time import perf_counter
+from temporal import algorithms, parsers
+from temporal.types import Date
+
+DATE_CONSTRUCTORS = ('__init__', 'from_bytes', 'from_timestamp', 'today',
+                     'from_ordinal', 'interned', 'from_iso_format',
+                     'from_iso_calendar', 'from_iso_date')
+PARSER_FUNCTIONS = ('strftime', 'format_many', 'iso_format', 'iso_calendar',
+                    'iso_week', 'iso_ordinal', 'iso_to_days',
+                    'detect_iso_variant', 'parse_iso_column',
+                    'parse_iso_dates', 'iso_time_to_microseconds',
+                    'parse_iso_times', 'parse_iso_duration',
+                    'iso_duration_seconds', 'parse_iso_durations')
+ALGORITHM_FUNCTIONS = ('is_leap', 'year_start', 'days_to_date',
+                       'date_to_days', 'from_ordinal', 'to_ordinal',
+                       'from_unix_time', 'to_unix_time', 'from_iso', 'to_iso',
+                       'day_of_week_from_date', 'days_to_year',
+                       'days_to_iso_week', 'iso_week_to_days',
+                       'week_no_from_date', 'iso_week_to_date')
+
+# label -> [calls, seconds]
+_stats = {}
+# wrapper -> original function, for every installed module level wrapper
+_originals = {}
+# (name, descriptor) of every replaced Date attribute
+_date_originals = []
+_caches = {
+    'parsers.compile_strftime': parsers.compile_strftime.cache_info,
+    'algorithms.iso_week_start': algorithms.iso_week_start.cache_info,
+    'parsers.iso_duration_seconds':
+        parsers._cached_duration_seconds.cache_info,
+    'Date.interned': Date.intern_info,
+}
+
+
+def _wrap(function, label: str):
+    stats = _stats.setdefault(label, [0, 0.0])
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+    return wrapper
+
+
+def _temporal_modules():
+    return [module for name, module in list(sys.modules.items())
+            if (name == 'temporal' or name.startswith('temporal.'))
+            and module is not None and name != __name__]
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable() -> None:
+    "Install the wrappers. Calling it again while enabled does nothing."
+    if _originals:
+        return
+    wrappers = {}
+    for module, names in ((parsers, PARSER_FUNCTIONS),
+                          (algorithms, ALGORITHM_FUNCTIONS)):
+        prefix = module.__name__.rpartition('.')[2]
+        for name in names:
+            function = getattr(module, name)
+            wrappers[function] = _wrap(function, f'{prefix}.{name}')
+    for module in _temporal_modules():
+        namespace = vars(module)
+        for name, value in list(namespace.items()):
+            if callable(value) and value in wrappers:
+                namespace[name] = wrappers[value]
+    _originals.update((wrapper, function)
+                      for function, wrapper in wrappers.items())
+    for name in DATE_CONSTRUCTORS:
+        descriptor = Date.__dict__[name]
+        if isinstance(descriptor, classmethod):
+            wrapper = classmethod(_wrap(descriptor.__func__, f'Date.{name}'))
+        else:
+            wrapper = _wrap(descriptor, f'Date.{name}')
+        _date_originals.append((name, descriptor))
+        type.__setattr__(Date, name, wrapper)
+
+
+def disable() -> None:
+    "Put the original functions back, keeping the collected statistics."
+    if not _originals:
+        return
+    for module in _temporal_modules():
+        namespace = vars(module)
+        for name, value in list(namespace.items()):
+            if callable(value) and value in _originals:
+                namespace[name] = _originals[value]
+    _originals.clear()
+    for name, descriptor in reversed(_date_originals):
+        type.__setattr__(Date, name, descriptor)
+    _date_originals.clear()
+
+
+def reset() -> None:
+    "Zero all call counts and times."
+    for stats in _stats.values():
+        stats[0] = 0
+        stats[1] = 0.0
+
+
+def register_cache(name: str, info) -> None:
+    """Include a cache in snapshots.
+    info is a callable returning a dict or a functools cache info with
+    hits and misses, such as ZoneLoader.cache_info.
+    """
+    _caches[name] = info
+
+
+def _cache_stats(info) -> dict:
+    info = info()
+    if not isinstance(info, dict):
+        info = info._asdict()
+    lookups = info['hits'] + info['misses']
+    return {**info, 'hit_rate': info['hits'] / lookups if lookups else None}
+
+
+def snapshot() -> dict:
+    """Returns the statistics collected so far.
+
+    Returns:
+        A dict with 'enabled', 'calls' mapping each entry point that was
+        called to its calls, seconds and ns_per_call, and 'caches' mapping
+        each registered cache to its counters and hit_rate.
+    """
+
+    calls = {label: {'calls': count, 'seconds': seconds,
+                     'ns_per_call': seconds * 1e9 / count}
+             for label, (count, seconds) in _stats.items() if count}
+    caches = {name: _cache_stats(info) for name, info in _caches.items()}
+    return {'enabled': is_enabled(), 'calls': calls, 'caches': caches}
+
+
+def _difference(before: dict, after: dict) -> dict:
+    calls = {}
+    for label, stats in after['calls'].items():
+        old = before['calls'].get(label, {'calls': 0, 'seconds': 0.0})
+        count = stats['calls'] - old['calls']
+        if count:
+            seconds = stats['seconds'] - old['seconds']
+            calls[label] = {'calls': count, 'seconds': seconds,
+                            'ns_per_call': seconds * 1e9 / count}
+    caches = {}
+    for name, stats in after['caches'].items():
+        old = before['caches'].get(name, {})
+        hits = stats['hits'] - old.get('hits', 0)
+        misses = stats['misses'] - old.get('misses', 0)
+        lookups = hits + misses
+        caches[name] = {**stats, 'hits': hits, 'misses': misses,
+                        'hit_rate': hits / lookups if lookups else None}
+    return {'enabled': after['enabled'], 'calls': calls, 'caches': caches}
+
+
+@contextmanager
+def instrumented():
+    """Measures the enclosed block.
+
+    Instrumentation is enabled for the block if it was not already. The
+    yielded dict is filled on exit with the snapshot() of what happened
+    inside the block only.
+    """
+    was_enabled = is_enabled()
+    enable()
+    result = {}
+    before = snapshot()
+    try:
+        yield result
+    finally:
+        result.update(_difference(before, snapshot()))
+        if not was_enabled:
+            disable()
@@ -0,0 +1,249 @@
+""" Sets of half-open date intervals.
+
+An IntervalSet stores disjoint, non-adjacent [start, stop) intervals as two
+sorted array('i') of day counts. Set operations walk both operands once in a
+linear merge, and finding the interval that holds a date is a binary search
+over the starts.
+
+Example:
+    >>> open_days = IntervalSet([(Date(2024, 1, 1), Date(2024, 2, 1)),
+    ...                          (Date(2024, 1, 15), Date(2024, 3, 1))])
+    >>> closed = IntervalSet([(Date(2024, 2, 10), Date(2024, 2, 12))])
+    >>> list(open_days - closed)
+    [(Date(year=2024, month=1, day=1), Date(year=2024, month=2, day=10)),
+     (Date(year=2024, month=2, day=12), Date(year=2024, month=3, day=1))]
+
+"""
+
+from array import array
+from bisect import bisect_right
+from temporal.arrays import DateArray
+from temporal.types import Date
+
+
+def _normalize(pairs):
+    "Sort (start, stop) day counts and merge overlapping or adjacent ones."
+    starts = array('i')
+    stops = array('i')
+    for start, stop in sorted(pairs):
+        if start >= stop:
+            continue
+        if stops and start <= stops[-1]:
+            if stop > stops[-1]:
+                stops[-1] = stop
+        else:
+            starts.append(start)
+            stops.append(stop)
+    return starts, stops
+
+
+class IntervalSet:
+    """An immutable set of dates held as half-open intervals.
+
+    Args:
+        intervals: (start, stop) pairs of Date instances, where stop is
+            excluded. Empty intervals are dropped and overlapping or
+            adjacent ones are merged.
+    """
+    __slots__ = ('_starts', '_stops')
+
+    def __init__(self, intervals=()) -> None:
+        pairs = []
+        for start, stop in intervals:
+            if not (isinstance(start, Date) and isinstance(stop, Date)):
+                raise TypeError('Expected intervals of Date instances',
+                                f'{(start, stop)!r}')
+            pairs.append((start._days, stop._days))
+        self._set(*_normalize(pairs))
+
+    def _set(self, starts: array, stops: array) -> None:
+        object.__setattr__(self, '_starts', starts)
+        object.__setattr__(self, '_stops', stops)
+
+    # Additional Constructors
+    @classmethod
+    def _from_arrays(cls, starts: array, stops: array) -> 'IntervalSet':
+        "Construct from already normalized arrays, without copying."
+        self = object.__new__(cls)
+        self._set(starts, stops)
+        return self
+
+    @classmethod
+    def from_days(cls, starts, stops) -> 'IntervalSet':
+        "Construct from parallel columns of start and stop day counts."
+        return cls._from_arrays(*_normalize(zip(starts, stops)))
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return f'{cls}({[(str(a), str(b)) for a, b in self]!r})'
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Can't set attribute {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Can't delete attribute {name!r}")
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._stops == other._stops
+
+    def __hash__(self):
+        return hash((self._starts.tobytes(), self._stops.tobytes()))
+
+    def __len__(self) -> int:
+        "Return the number of disjoint intervals."
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __iter__(self):
+        from_days = Date._from_days
+        for start, stop in zip(self._starts, self._stops):
+            yield from_days(start), from_days(stop)
+
+    def __getitem__(self, index):
+        from_days = Date._from_days
+        return from_days(self._starts[index]), from_days(self._stops[index])
+
+    @property
+    def starts(self) -> array:
+        "A copy of the array('i') of interval start day counts."
+        return self._starts[:]
+
+    @property
+    def stops(self) -> array:
+        "A copy of the array('i') of interval stop day counts, excluded."
+        return self._stops[:]
+
+    def total_days(self) -> int:
+        "Return the number of days covered by all intervals."
+        return sum(self._stops) - sum(self._starts)
+
+    # Lookups
+    def _index(self, days: int) -> int:
+        "Return the index of the interval holding days, or -1."
+        index = bisect_right(self._starts, days) - 1
+        if index >= 0 and days < self._stops[index]:
+            return index
+        return -1
+
+    def __contains__(self, date) -> bool:
+        if not isinstance(date, Date):
+            return False
+        return self._index(date._days) >= 0
+
+    def find(self, date: Date):
+        "Return the (start, stop) interval holding date, or None."
+        index = self._index(date._days)
+        return None if index < 0 else self[index]
+
+    def contains_many(self, dates) -> array:
+        """Return a membership mask for a DateArray or Date sequence.
+        The interval of the previous date is tried first, so sorted or
+        clustered columns rarely need a binary search.
+        """
+        if isinstance(dates, DateArray):
+            days = dates.days
+        else:
+            days = [date._days for date in dates]
+        starts = self._starts
+        stops = self._stops
+        count = len(starts)
+        result = array('b')
+        add = result.append
+        low = high = inside = 0
+        for n in days:
+            if not low <= n < high:
+                index = bisect_right(starts, n) - 1
+                if index >= 0 and n < stops[index]:
+                    low, high, inside = starts[index], stops[index], 1
+                else:
+                    # Cache the gap between two intervals as well.
+                    low = stops[index] if index >= 0 else -(1 << 63)
+                    high = starts[index + 1] if index + 1 < count else 1 << 63
+                    inside = 0
+            add(inside)
+        return result
+
+    # Set operations
+    def union(self, other: 'IntervalSet') -> 'IntervalSet':
+        "Return the dates in either set."
+        a_starts, a_stops = self._starts, self._stops
+        b_starts, b_stops = other._starts, other._stops
+        starts = array('i')
+        stops = array('i')
+        i = j = 0
+        count_a = len(a_starts)
+        count_b = len(b_starts)
+        while i < count_a or j < count_b:
+            if j == count_b or (i < count_a and a_starts[i] <= b_starts[j]):
+                start, stop = a_starts[i], a_stops[i]
+                i += 1
+            else:
+                start, stop = b_starts[j], b_stops[j]
+                j += 1
+            if stops and start <= stops[-1]:
+                if stop > stops[-1]:
+                    stops[-1] = stop
+            else:
+                starts.append(start)
+                stops.append(stop)
+        return self._from_arrays(starts, stops)
+
+    def intersection(self, other: 'IntervalSet') -> 'IntervalSet':
+        "Return the dates in both sets."
+        a_starts, a_stops = self._starts, self._stops
+        b_starts, b_stops = other._starts, other._stops
+        starts = array('i')
+        stops = array('i')
+        i = j = 0
+        while i < len(a_starts) and j < len(b_starts):
+            start = max(a_starts[i], b_starts[j])
+            stop = min(a_stops[i], b_stops[j])
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+            if a_stops[i] < b_stops[j]:
+                i += 1
+            else:
+                j += 1
+        return self._from_arrays(starts, stops)
+
+    def difference(self, other: 'IntervalSet') -> 'IntervalSet':
+        "Return the dates in this set but not in other."
+        b_starts, b_stops = other._starts, other._stops
+        starts = array('i')
+        stops = array('i')
+        j = 0
+        count_b = len(b_starts)
+        for start, stop in zip(self._starts, self._stops):
+            while j < count_b and b_stops[j] <= start:
+                j += 1
+            k = j
+            while k < count_b and b_starts[k] < stop:
+                if b_starts[k] > start:
+                    starts.append(start)
+                    stops.append(b_starts[k])
+                start = max(start, b_stops[k])
+                k += 1
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+        return self._from_arrays(starts, stops)
+
+    def __or__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.difference(other)
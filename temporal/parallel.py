@@ -0,0 +1,163 @@
+""" Parallel parsing and formatting of large date columns.
+
+Buffers and files are split into chunks on line boundaries and each chunk
+is handled by a ProcessPoolExecutor worker using temporal.parsers. Workers
+send back compact buffers (int32 day counts or encoded text) rather than
+pickled Date objects.
+
+Example:
+    >>> days, errors = parse_file('export.csv', workers=8)
+    >>> text = format_days(days, '%d/%m/%Y', workers=8)
+
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+from temporal.parsers import format_many, parse_iso_column
+from temporal.types import Date
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def split_lines(data, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    """Splits a buffer into chunks that end on a line boundary.
+
+    Args:
+        data: A bytes, bytearray or mmap buffer of newline separated rows;
+            other buffers are copied to bytes first.
+        chunk_size: Approximate number of bytes per chunk.
+
+    Returns:
+        A list of (start, stop) byte offsets covering the whole buffer.
+    """
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive', f'{chunk_size!r}')
+    if not isinstance(data, (bytes, bytearray, mmap.mmap)):
+        data = bytes(data)
+    size = len(data)
+    bounds = []
+    start = 0
+    while start < size:
+        newline = data.find(b'\n', start + chunk_size - 1)
+        stop = size if newline < 0 else newline + 1
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _parse_chunk(data: bytes, fill: int):
+    days, errors = parse_iso_column(data, fill)
+    return days.tobytes(), errors
+
+
+def _parse_file_chunk(path, start: int, stop: int, fill: int):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return _parse_chunk(file.read(stop - start), fill)
+
+
+def _format_chunk(data: bytes, text: str) -> bytes:
+    days = array('i')
+    days.frombytes(data)
+    from_days = Date._from_days
+    lines = format_many([from_days(n) for n in days], text)
+    lines.append('')
+    return '\n'.join(lines).encode('utf-8')
+
+
+def _run(function, jobs, workers):
+    "Run function over jobs in order, in a process pool unless workers is 1."
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('workers must be positive', f'{workers!r}')
+    if workers == 1 or len(jobs) < 2:
+        return [function(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, *zip(*jobs)))
+
+
+def _merge(results):
+    days = array('i')
+    errors = []
+    for data, chunk_errors in results:
+        offset = len(days)
+        errors.extend((index + offset, message)
+                      for index, message in chunk_errors)
+        days.frombytes(data)
+    return days, errors
+
+
+def parse_buffer(data, workers: int = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, fill: int = 0):
+    """Parses a newline separated buffer of ISO-8601 dates in parallel.
+
+    Args:
+        data: A bytes-like buffer of newline separated dates.
+        workers: Number of worker processes, defaults to os.cpu_count().
+        chunk_size: Approximate number of bytes handed to a worker at once.
+        fill: Day count stored for rows that failed to parse.
+
+    Returns:
+        A tuple of an array('i') of day counts and a list of (index,
+        message) tuples, as returned by parsers.parse_iso_dates.
+    """
+
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    jobs = [(data[start:stop], fill)
+            for start, stop in split_lines(data, chunk_size)]
+    return _merge(_run(_parse_chunk, jobs, workers))
+
+
+def parse_file(path, workers: int = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE, fill: int = 0):
+    """Parses a file of newline separated ISO-8601 dates in parallel.
+
+    Workers read their own byte range of the file, so only offsets and the
+    resulting day count buffers cross process boundaries.
+
+    Args:
+        path: Path of the file to parse.
+        workers: Number of worker processes, defaults to os.cpu_count().
+        chunk_size: Approximate number of bytes handed to a worker at once.
+        fill: Day count stored for rows that failed to parse.
+
+    Returns:
+        A tuple of an array('i') of day counts and a list of (index,
+        message) tuples, as returned by parsers.parse_iso_dates.
+    """
+
+    path = os.fspath(path)
+    with open(path, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            return array('i'), []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            bounds = split_lines(data, chunk_size)
+    jobs = [(path, start, stop, fill) for start, stop in bounds]
+    return _merge(_run(_parse_file_chunk, jobs, workers))
+
+
+def format_days(days, text: str, workers: int = None,
+                chunk_rows: int = 500_000) -> bytes:
+    """Formats a column of day counts with strftime in parallel.
+
+    Args:
+        days: A DateArray or an array('i') of day counts.
+        text: The strftime format string.
+        workers: Number of worker processes, defaults to os.cpu_count().
+        chunk_rows: Number of rows handed to a worker at once.
+
+    Returns:
+        The formatted rows as UTF-8 bytes, one row per line.
+    """
+
+    if chunk_rows < 1:
+        raise ValueError('chunk_rows must be positive', f'{chunk_rows!r}')
+    days = array('i', getattr(days, 'days', days))
+    jobs = [(days[start:start + chunk_rows].tobytes(), text)
+            for start in range(0, len(days), chunk_rows)]
+    return b''.join(_run(_format_chunk, jobs, workers))
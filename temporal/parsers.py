@@ -8,43 +8,104 @@ Example:
 
 """
 
-from temporal.constants import DAY_NAMES, DAY_NAMES_LONG, MONTH_NAMES, MONTH_NAMES_LONG
-from temporal.algorithms import days_to_date
+from array import array
+from functools import lru_cache
+from itertools import chain, islice
+from temporal.constants import (DAY_NAMES, DAY_NAMES_LONG, MONTH_NAMES,
+                                MONTH_NAMES_LONG, DAYS_IN_MONTH,
+                                MICROSECONDS_PER_SECOND)
+from temporal.algorithms import (days_to_date, is_leap, iso_week_to_days,
+                                 year_start, _days_from_fields)
+
+_STRFTIME_FIELDS = {
+    'a': lambda date: DAY_NAMES[date.weekday()],
+    'A': lambda date: DAY_NAMES_LONG[date.weekday()],
+    'w': lambda date: f'{date.weekday()}',
+    'd': lambda date: f'{date.day:02}',
+    '-d': lambda date: f'{date.day}',
+    'b': lambda date: MONTH_NAMES[date.month - 1],
+    'B': lambda date: MONTH_NAMES_LONG[date.month - 1],
+    'm': lambda date: f'{date.month:02}',
+    '-m': lambda date: f'{date.month}',
+    'y': lambda date: f'{date.year % 100:02}',
+    '-y': lambda date: f'{date.year % 100}',
+    'Y': lambda date: f'{date.year}',
+    'j': lambda date: f'{date.day_of_year():03}',
+    '-j': lambda date: f'{date.day_of_year()}',
+}
+
+STRFTIME_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=STRFTIME_CACHE_SIZE)
+def compile_strftime(text: str) -> tuple:
+    """Compiles a strftime format string into a reusable plan.
+
+    The format is scanned once from left to right, so %% and overlapping
+    directives such as %-d and %d resolve deterministically. Directives
+    that are not supported for dates are kept verbatim. Plans are cached
+    per format string with LRU eviction.
+
+    Args:
+        text: The strftime format string.
+
+    Returns:
+        A tuple of segments, each either a literal str or a callable taking
+        the object being formatted and returning its field as a str.
+    """
+
+    plan = []
+    literal = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        char = text[pos]
+        if char != '%' or pos + 1 == length:
+            literal.append(char)
+            pos += 1
+            continue
+        directive = text[pos + 1]
+        if directive == '-' and pos + 2 < length:
+            directive += text[pos + 2]
+        if directive == '%':
+            literal.append('%')
+        elif directive in _STRFTIME_FIELDS:
+            if literal:
+                plan.append(''.join(literal))
+                literal = []
+            plan.append(_STRFTIME_FIELDS[directive])
+        else:
+            directive = directive[0]
+            literal.append('%' + directive)
+        pos += 1 + len(directive)
+    if literal:
+        plan.append(''.join(literal))
+    return tuple(plan)
+
+
+def _apply_plan(plan, object) -> str:
+    return ''.join([segment if segment.__class__ is str else segment(object)
+                    for segment in plan])
+
 
 def strftime(object, text: str) -> str:
-        directives = {
-        '%a', '%A', '%w', '%d', '%-d', '%b', '%B', '%m', '%-m', '%y', '%-y',
-        '%Y', '%H', '%-H', '%I', '%-I', '%p', '%M', '%-M', '%S', '%-S', '%f',
-        '%z', '%Z', '%j', '%-j', '%U', '%W', '%c', '%x', '%X', '%%'}
-        for directive in directives:
-            if directive in text:
-                if directive == '%a':
-                    data = DAY_NAMES[object.weekday()]
-                elif directive == '%A':
-                    data = DAY_NAMES_LONG[object.weekday()]
-                elif directive == '%w':
-                    data = f'{object.weekday()}'
-                elif directive == '%d':
-                    data = f'{object.day:02}'
-                elif directive == '%-d':
-                    data = f'{object.day}'
-                elif directive == '%b':
-                    data = MONTH_NAMES[object.month]
-                elif directive == '%B':
-                    data = MONTH_NAMES_LONG[object.month]
-                elif directive == '%m':
-                    data = f'{object.month:02}'
-                elif directive == '%-m':
-                    data = f'{object.month}'
-                elif directive == '%y':
-                    data = f'{object.year % 100:02}'
-                elif directive == '%-y':
-                    data = f'{object.year % 100}'
-                elif directive == '%Y':
-                    data = f'{object.year}'
-
-                text = text.replace(directive, data)
-        return text
+    return _apply_plan(compile_strftime(text), object)
+
+
+def format_many(dates, text: str) -> list:
+    """Formats every date in dates with the same strftime format.
+
+    Args:
+        dates: An iterable of Date instances, such as a DateArray.
+        text: The strftime format string, compiled once for the batch.
+
+    Returns:
+        A list with one formatted string per date.
+    """
+
+    plan = compile_strftime(text)
+    return [_apply_plan(plan, date) for date in dates]
+
 
 def iso_format(text: str) -> str:
     # Standard formats that can be translated directy to a Date object:
@@ -179,63 +240,494 @@ def iso_ordinal(text: str):
     return year, day_of_year
 
 
+def iso_to_days(text: str) -> int:
+    """Parses a complete ISO-8601 date into days since 0000-03-01.
+
+    Accepts the calendar (YYYY-MM-DD, YYYYMMDD), week (YYYY-Www-D, YYYYWwwD)
+    and ordinal (YYYY-DDD, YYYYDDD) representations. Reduced precision
+    forms such as YYYY-MM or YYYY-Www do not name a single day and are
+    rejected.
+
+    Args:
+        text: The ISO-8601 date string.
+
+    Returns:
+        An integer on the same epoch as temporal.algorithms.date_to_days.
+
+    Raises:
+        ValueError: The text is not a complete ISO-8601 date or names a day
+            that does not exist.
+    """
+
+    length = len(text)
+    # str.isdigit also accepts non-ASCII digits such as '١٢٣٤'
+    if length < 7 or not (text.isascii() and text[0:4].isdigit()):
+        raise ValueError('Not an ISO-8601 date', f'{text!r}')
+    year = int(text[0:4])
+    has_sep = text[4] == '-'
+    pos = 4 + has_sep
+    rest = length - pos
+    if text[pos] == 'W':
+        if rest != 4 + has_sep or (has_sep and text[pos + 3] != '-'):
+            raise ValueError('Not an ISO-8601 week date', f'{text!r}')
+        week = text[pos + 1:pos + 3]
+        weekday = text[-1]
+        if not (week.isdigit() and weekday.isdigit()):
+            raise ValueError('Not an ISO-8601 week date', f'{text!r}')
+        return iso_week_to_days(year, int(week), int(weekday))
+    if rest == 3:
+        day_of_year = text[pos:]
+        if not day_of_year.isdigit():
+            raise ValueError('Not an ISO-8601 ordinal date', f'{text!r}')
+        return _ordinal_days(year, int(day_of_year))
+    if rest != 4 + has_sep or (has_sep and text[pos + 2] != '-'):
+        raise ValueError('Not an ISO-8601 calendar date', f'{text!r}')
+    month = text[pos:pos + 2]
+    day = text[-2:]
+    if not (month.isdigit() and day.isdigit()):
+        raise ValueError('Not an ISO-8601 calendar date', f'{text!r}')
+    return _calendar_days(year, int(month), int(day))
 
-def parse_iso_duration(cls, data: str):
-    if data[0] not in 'Pp':
-        raise ValueError('A valid duration starts with P')
 
-    if 'T' in data:
-        period, sep, time = data[1:].partition('T')
+def _calendar_days(year: int, month: int, day: int) -> int:
+    "Validated date_to_days for parsed calendar fields."
+    if 1 <= day <= 28 and 1 <= month <= 12:
+        return _days_from_fields(year, month, day)
+    if not 1 <= month <= 12:
+        raise ValueError('month must be between 1 and 12')
+    if month == 2 and is_leap(year):
+        max_days = 29
     else:
-        period, sep, time = data[1:].partition('t')
+        max_days = DAYS_IN_MONTH[month]
+    if not 1 <= day <= max_days:
+        raise ValueError(f'day must be between 1 and {max_days}')
+    return _days_from_fields(year, month, day)
+
+
+def _ordinal_days(year: int, day_of_year: int) -> int:
+    "Validated day count for a parsed year and day of year."
+    if 1 <= day_of_year <= 365:
+        return year_start(year) + day_of_year - 1
+    max_days = 366 if is_leap(year) else 365
+    if not 1 <= day_of_year <= max_days:
+        raise ValueError(f'day of year must be between 1 and {max_days}')
+    return year_start(year) + day_of_year - 1
+
+
+def _calendar_extended(text: str) -> int:
+    "Parse exactly YYYY-MM-DD."
+    if len(text) != 10 or text[4] != '-' or text[7] != '-':
+        raise ValueError('Not a YYYY-MM-DD date', f'{text!r}')
+    year, month, day = text[:4], text[5:7], text[8:]
+    if not (text.isascii() and year.isdigit() and month.isdigit()
+            and day.isdigit()):
+        raise ValueError('Not a YYYY-MM-DD date', f'{text!r}')
+    return _calendar_days(int(year), int(month), int(day))
+
+
+def _calendar_basic(text: str) -> int:
+    "Parse exactly YYYYMMDD."
+    if len(text) != 8 or not (text.isascii() and text.isdigit()):
+        raise ValueError('Not a YYYYMMDD date', f'{text!r}')
+    return _calendar_days(int(text[:4]), int(text[4:6]), int(text[6:]))
+
+
+def _week_extended(text: str) -> int:
+    "Parse exactly YYYY-Www-D."
+    if (len(text) != 10 or text[4:6] != '-W' or text[8] != '-'
+            or not (text.isascii() and text[:4].isdigit()
+                    and text[6:8].isdigit() and text[9].isdigit())):
+        raise ValueError('Not a YYYY-Www-D date', f'{text!r}')
+    return iso_week_to_days(int(text[:4]), int(text[6:8]), int(text[9]))
+
+
+def _week_basic(text: str) -> int:
+    "Parse exactly YYYYWwwD."
+    if (len(text) != 8 or text[4] != 'W'
+            or not (text.isascii() and text[:4].isdigit()
+                    and text[5:].isdigit())):
+        raise ValueError('Not a YYYYWwwD date', f'{text!r}')
+    return iso_week_to_days(int(text[:4]), int(text[5:7]), int(text[7]))
+
+
+def _ordinal_extended(text: str) -> int:
+    "Parse exactly YYYY-DDD."
+    if (len(text) != 8 or text[4] != '-'
+            or not (text.isascii() and text[:4].isdigit()
+                    and text[5:].isdigit())):
+        raise ValueError('Not a YYYY-DDD date', f'{text!r}')
+    return _ordinal_days(int(text[:4]), int(text[5:]))
+
+
+def _ordinal_basic(text: str) -> int:
+    "Parse exactly YYYYDDD."
+    if len(text) != 7 or not (text.isascii() and text.isdigit()):
+        raise ValueError('Not a YYYYDDD date', f'{text!r}')
+    return _ordinal_days(int(text[:4]), int(text[4:]))
+
+
+ISO_DATE_VARIANTS = {
+    'YYYY-MM-DD': _calendar_extended,
+    'YYYYMMDD': _calendar_basic,
+    'YYYY-Www-D': _week_extended,
+    'YYYYWwwD': _week_basic,
+    'YYYY-DDD': _ordinal_extended,
+    'YYYYDDD': _ordinal_basic,
+}
+
+SNIFF_SAMPLE_SIZE = 64
+
+
+def detect_iso_variant(samples):
+    """Detects which ISO-8601 date layout a sample of rows uses.
+
+    Args:
+        samples: An iterable of date strings, usually the first rows of a
+            column.
+
+    Returns:
+        The key in ISO_DATE_VARIANTS matching the most samples, or None if
+        no sample matches any layout.
+    """
+
+    samples = list(samples)
+    best = None
+    best_count = 0
+    for variant, parse in ISO_DATE_VARIANTS.items():
+        count = 0
+        for text in samples:
+            try:
+                parse(text)
+            except (TypeError, ValueError):
+                continue
+            count += 1
+        if count > best_count:
+            best, best_count = variant, count
+    return best
+
+
+def _error_message(error: Exception) -> str:
+    "Join the arguments of a parser error, such as (message, repr(text))."
+    return ': '.join(map(str, error.args))
 
-    unit_found = False
-    result = {}
 
-    period_dict = (('Y', 'year'), ('M', 'month'), ('W', 'week'), ('D', 'day'))
-    time_dict = (('H', 'hour'), ('M', 'min'), ('S', 'sec'))
-    for unit, name in period_dict.items():
+def parse_iso_column(data, fill: int = 0, variant: str = None,
+                     sample_size: int = SNIFF_SAMPLE_SIZE):
+    """Parses a column of ISO-8601 dates that share one layout.
+
+    The layout is detected from the first sample_size rows and its
+    specialised parser is applied to every row. Rows it rejects fall back
+    to iso_to_days, so mixed columns are still parsed correctly, only
+    slower. Bad rows are reported by index as in parse_iso_dates.
+
+    Args:
+        data: An iterable of strings, or a bytes, bytearray or memoryview
+            buffer holding newline separated dates.
+        fill: Day count stored for rows that failed to parse.
+        variant: A key of ISO_DATE_VARIANTS to skip detection.
+        sample_size: Number of leading rows used for detection.
+
+    Returns:
+        A tuple of an array('i') of day counts, aligned with the input rows,
+        and a list of (index, message) tuples for the rows that failed.
+    """
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = _split_lines(data)
+    rows = iter(data)
+    if variant is None:
+        head = list(islice(rows, sample_size))
+        rows = chain(head, rows)
+        variant = detect_iso_variant(head)
+    if variant is None:
+        return parse_iso_dates(rows, fill)
+    parse = ISO_DATE_VARIANTS[variant]
+    days = array('i')
+    errors = []
+    add = days.append
+    for index, text in enumerate(rows):
         try:
-            unit_pos = next(index for index, char in enumerate(period) if char.upper() == unit)
-            unit_value = int(period[:unit_pos])
-            result[name] = unit_value
-            period = period[unit_pos + 1:]
-            unit_found = True
-        except StopIteration:
-            result[name] = 0
-        except ValueError:
-            raise ValueError(
-                f'{unit_value} contains non-numeric characters') from None
-
-    if period:
-        raise ValueError(f'Trailing garbage in period: {period}')
-
-    for unit, name in time_dict.items():
+            add(parse(text))
+            continue
+        except (TypeError, ValueError):
+            pass
+        try:
+            add(iso_to_days(text))
+        except (TypeError, ValueError) as error:
+            add(fill)
+            errors.append((index, _error_message(error)))
+    return days, errors
+
+
+def _split_lines(data):
+    "Split a bytes-like buffer of newline separated dates into strings."
+    text = bytes(data).decode('ascii', errors='replace')
+    lines = text.split('\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    if '\r' in text:
+        return [line[:-1] if line.endswith('\r') else line for line in lines]
+    return lines
+
+
+def parse_iso_dates(data, fill: int = 0):
+    """Parses many ISO-8601 dates into day counts in one pass.
+
+    Rows are parsed with the same rules as iso_to_days. A bad row does not
+    stop the batch; its slot in the result holds fill and the failure is
+    recorded by index.
+
+    Args:
+        data: An iterable of strings, or a bytes, bytearray or memoryview
+            buffer holding newline separated dates.
+        fill: Day count stored for rows that failed to parse.
+
+    Returns:
+        A tuple of an array('i') of day counts, aligned with the input rows,
+        and a list of (index, message) tuples for the rows that failed.
+    """
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = _split_lines(data)
+    days = array('i')
+    errors = []
+    add = days.append
+    for index, text in enumerate(data):
+        # Fast path for YYYY-MM-DD, by far the most common layout
         try:
-            unit_pos = next(index for index, char in enumerate(time) if char.upper() == unit)
-            unit_value = int(time[:unit_pos])
-            result[name] = unit_value
-            time = time[unit_pos + 1:]
-            unit_found = True
-        except StopIteration:
-            result[name] = 0
-        except ValueError:
-            raise ValueError(
-                f'{unit_value} contains non-numeric characters') from None
-
-    if time:
-        raise ValueError(f'Trailing garbage in time: {time}')
-
-    if 'week' in result.keys(): # Insufficient test. Need to check presence of week earlier instead
-        temp_dict = {key: value \
-                    for key, value in result.items() if key != 'week'}
-        if sum(temp_dict.values()) > 0:
-            raise ValueError('Week is not allowed with other units')
-
-    if not unit_found:
+            if (len(text) == 10 and text[4] == '-' and text[7] == '-'
+                    and text.isascii() and text[:4].isdigit()
+                    and text[5:7].isdigit() and text[8:].isdigit()):
+                year = int(text[:4])
+                month = int(text[5:7])
+                day = int(text[8:])
+                if 1 <= day <= 28 and 1 <= month <= 12:
+                    month = (month + 9) % 12
+                    year -= month // 10
+                    add(365 * year + year // 4 - year // 100 + year // 400
+                        + (month * 306 + 5) // 10 + (day - 1))
+                    continue
+            add(iso_to_days(text))
+        except (TypeError, ValueError) as error:
+            add(fill)
+            errors.append((index, _error_message(error)))
+    return days, errors
+
+
+def iso_time_to_microseconds(text: str) -> int:
+    """Parses an ISO-8601 time of day into microseconds since midnight.
+
+    Accepts hh, hh:mm, hh:mm:ss and the basic hhmm and hhmmss forms, each
+    with an optional fraction of 1 to 6 digits after the seconds.
+
+    Args:
+        text: The ISO-8601 time string.
+
+    Returns:
+        The number of microseconds since midnight.
+
+    Raises:
+        ValueError: The text is not an ISO-8601 time or a field is out of
+            range.
+    """
+
+    if not text.isascii():
+        raise ValueError('Not an ISO-8601 time', f'{text!r}')
+    main, dot, fraction = text.partition('.')
+    if dot and not (1 <= len(fraction) <= 6 and fraction.isdigit()):
+        raise ValueError('fraction must be 1 to 6 digits', f'{text!r}')
+    if ':' in main:
+        parts = main.split(':')
+        if len(parts) > 3 or any(len(part) != 2 for part in parts):
+            raise ValueError('Not an ISO-8601 time', f'{text!r}')
+    else:
+        if len(main) not in (2, 4, 6):
+            raise ValueError('Not an ISO-8601 time', f'{text!r}')
+        parts = [main[pos:pos + 2] for pos in range(0, len(main), 2)]
+    if dot and len(parts) != 3:
+        raise ValueError('fraction is only allowed on seconds', f'{text!r}')
+    if not all(part.isdigit() for part in parts):
+        raise ValueError('Not an ISO-8601 time', f'{text!r}')
+    hour, minute, second = (list(map(int, parts)) + [0, 0])[:3]
+    if hour > 23:
+        raise ValueError('hour must be between 0 and 23')
+    if minute > 59:
+        raise ValueError('minute must be between 0 and 59')
+    if second > 59:
+        raise ValueError('second must be between 0 and 59')
+    microsecond = int(fraction.ljust(6, '0')) if dot else 0
+    return (((hour * 60 + minute) * 60 + second) * MICROSECONDS_PER_SECOND
+            + microsecond)
+
+
+def parse_iso_times(data, fill: int = 0):
+    """Parses many ISO-8601 times into microseconds since midnight.
+
+    Rows are parsed with the same rules as iso_time_to_microseconds, with a
+    fast path for hh:mm:ss.ffffff and hh:mm:ss. Bad rows are reported by
+    index as in parse_iso_dates.
+
+    Args:
+        data: An iterable of strings, or a bytes, bytearray or memoryview
+            buffer holding newline separated times.
+        fill: Value stored for rows that failed to parse.
+
+    Returns:
+        A tuple of an array('q') of microseconds, aligned with the input
+        rows, and a list of (index, message) tuples for the rows that
+        failed.
+    """
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = _split_lines(data)
+    micros = array('q')
+    errors = []
+    add = micros.append
+    for index, text in enumerate(data):
+        try:
+            length = len(text)
+            if ((length == 15 and text[8] == '.' or length == 8)
+                    and text[2] == ':' and text[5] == ':' and text.isascii()
+                    and text[:2].isdigit() and text[3:5].isdigit()
+                    and text[6:8].isdigit()):
+                hour = int(text[:2])
+                minute = int(text[3:5])
+                second = int(text[6:8])
+                if hour < 24 and minute < 60 and second < 60:
+                    value = (((hour * 60 + minute) * 60 + second)
+                             * MICROSECONDS_PER_SECOND)
+                    if length == 8:
+                        add(value)
+                        continue
+                    if text[9:].isdigit():
+                        add(value + int(text[9:]))
+                        continue
+            add(iso_time_to_microseconds(text))
+        except (TypeError, ValueError) as error:
+            add(fill)
+            errors.append((index, _error_message(error)))
+    return micros, errors
+
+
+_DURATION_UNITS = ('YMWD', 'HMS')
+
+DURATION_CACHE_SIZE = 1024
+
+
+def parse_iso_duration(text: str):
+    """Parses an ISO-8601 duration such as P1DT2H or PT15M in one pass.
+
+    Designators may be upper or lower case and must appear in order. A week
+    component cannot be combined with other components. Every component is
+    a whole number: ISO-8601 also allows a decimal fraction on the smallest
+    one, as in PT1.5S or PT0.5H, but durations here are counted in whole
+    seconds, so such text is rejected.
+
+    Args:
+        text: The ISO-8601 duration string.
+
+    Returns:
+        A tuple of integers (years, months, weeks, days, hours, minutes,
+        seconds).
+
+    Raises:
+        ValueError: The text is not a valid ISO-8601 duration.
+    """
+
+    if not text or text[0] not in 'Pp':
+        raise ValueError('A valid duration starts with P', f'{text!r}')
+    values = [0, 0, 0, 0, 0, 0, 0]
+    units = _DURATION_UNITS[0]
+    offset = 0
+    order = 0
+    start = None
+    in_time = False
+    found = 0
+    for pos in range(1, len(text)):
+        char = text[pos]
+        if '0' <= char <= '9':
+            if start is None:
+                start = pos
+            continue
+        if char in '.,' and start is not None:
+            raise ValueError('Fractional duration components are not '
+                             'supported', f'{text!r}')
+        char = char.upper()
+        if char == 'T' and not in_time and start is None:
+            units = _DURATION_UNITS[1]
+            offset = 4
+            order = 0
+            in_time = True
+            continue
+        index = units.find(char, order)
+        if index < 0 or start is None:
+            raise ValueError('Unexpected character in duration',
+                             f'{text[pos:]!r}')
+        values[offset + index] = int(text[start:pos])
+        found |= 1 << (offset + index)
+        order = index + 1
+        start = None
+    if start is not None:
+        raise ValueError('Trailing garbage in duration', f'{text[start:]!r}')
+    if not found:
         raise ValueError('At least one unit needs to be provided')
+    if in_time and not found >> 4:
+        raise ValueError('At least one time unit needs to follow T')
+    if found & 4 and found != 4:
+        raise ValueError('Week is not allowed with other units')
+    return tuple(values)
+
 
-    # if sum(result.values()) == 0: # This method does not allow valid formats such as PT0S
-    #     raise ValueError('At least one unit needs to be provided')
+def iso_duration_seconds(text: str) -> int:
+    """Parses an ISO-8601 duration into its total number of seconds.
 
-    return data, result
\ No newline at end of file
+    Args:
+        text: The ISO-8601 duration string.
+
+    Returns:
+        The duration in seconds, counting a day as 86400 seconds.
+
+    Raises:
+        ValueError: The text is not a valid duration or has a year or month
+            component, which has no fixed length.
+    """
+
+    years, months, weeks, days, hours, minutes, seconds = \
+        parse_iso_duration(text)
+    if years or months:
+        raise ValueError('Years and months have no fixed length',
+                         f'{text!r}')
+    return ((weeks * 7 + days) * 24 + hours) * 3600 + minutes * 60 + seconds
+
+
+_cached_duration_seconds = lru_cache(maxsize=DURATION_CACHE_SIZE)(
+    iso_duration_seconds)
+
+
+def parse_iso_durations(data, fill: int = 0):
+    """Parses many ISO-8601 durations into a column of seconds.
+
+    Feeds usually repeat a small set of duration strings, so parsed values
+    are cached with LRU eviction. Bad rows are reported by index as in
+    parse_iso_dates.
+
+    Args:
+        data: An iterable of duration strings.
+        fill: Value stored for rows that failed to parse.
+
+    Returns:
+        A tuple of an array('q') of seconds, aligned with the input rows,
+        and a list of (index, message) tuples for the rows that failed.
+    """
+
+    seconds = array('q')
+    errors = []
+    add = seconds.append
+    parse = _cached_duration_seconds
+    for index, text in enumerate(data):
+        try:
+            add(parse(text))
+        except (TypeError, ValueError) as error:
+            add(fill)
+            errors.append((index, _error_message(error)))
+    return seconds, errors
@@ -0,0 +1,168 @@
+""" Lazy ranges of dates.
+
+A DateRange behaves like range() over dates: length, containment, indexing
+and slicing are O(1) and dates are only built while iterating. Day and week
+steps are ranges over day counts; month steps are ranges over month numbers
+(year * 12 + month - 1) with the start day clamped to the length of each
+month.
+
+Example:
+    >>> list(DateRange(Date(2024, 1, 31), Date(2024, 5, 1), 1, 'months'))
+    [Date(year=2024, month=1, day=31), Date(year=2024, month=2, day=29),
+     Date(year=2024, month=3, day=31), Date(year=2024, month=4, day=30)]
+
+"""
+
+from temporal.algorithms import is_leap
+from temporal.constants import DAYS_IN_MONTH
+from temporal.types import Date
+
+UNITS = ('days', 'weeks', 'months')
+
+
+def _clamped_day(month_number: int, day: int) -> int:
+    "Clamp day to the length of the month given as year * 12 + month - 1."
+    year, month = divmod(month_number, 12)
+    if month == 1 and is_leap(year):
+        return min(day, 29)
+    return min(day, DAYS_IN_MONTH[month + 1])
+
+
+class DateRange:
+    """An immutable, lazily evaluated sequence of dates.
+
+    Args:
+        start: The first date of the range.
+        stop: The date the range stops before, as with range().
+        step: Units between two consecutive dates, must not be zero.
+        unit: One of 'days', 'weeks' or 'months'.
+    """
+    __slots__ = ('_range', '_unit', '_day')
+
+    def __init__(self, start: Date, stop: Date, step: int = 1,
+                 unit: str = 'days') -> None:
+        if not (isinstance(start, Date) and isinstance(stop, Date)):
+            raise TypeError('Expected start and stop to be Date instances')
+        if not isinstance(step, int):
+            raise TypeError('Expected step to be an int', f'{step!r}')
+        if step == 0:
+            raise ValueError('step must not be zero')
+        if unit not in UNITS:
+            raise ValueError(f'unit must be one of {UNITS}', f'{unit!r}')
+        if unit == 'months':
+            first = start.year * 12 + start.month - 1
+            last = stop.year * 12 + stop.month - 1
+            # The stop month itself is included when its clamped day is
+            # still before (or, stepping back, after) the stop date.
+            clamped = _clamped_day(last, start.day)
+            if step > 0 and clamped < stop.day:
+                last += 1
+            elif step < 0 and clamped > stop.day:
+                last -= 1
+            values = range(first, last, step)
+        else:
+            if unit == 'weeks':
+                step *= 7
+            values = range(start._days, stop._days, step)
+        self._set(values, unit, start.day)
+
+    def _set(self, values: range, unit: str, day: int) -> None:
+        object.__setattr__(self, '_range', values)
+        object.__setattr__(self, '_unit', unit)
+        object.__setattr__(self, '_day', day)
+
+    @classmethod
+    def _from_range(cls, values: range, unit: str, day: int) -> 'DateRange':
+        self = object.__new__(cls)
+        self._set(values, unit, day)
+        return self
+
+    def _to_date(self, value: int) -> Date:
+        if self._unit != 'months':
+            return Date._from_days(value)
+        year, month = divmod(value, 12)
+        day = _clamped_day(value, self._day)
+        return Date._from_fields(year, month + 1, day)
+
+    def _to_value(self, date: Date):
+        "Return the range value for date, or None if no element can match."
+        if self._unit != 'months':
+            return date._days
+        value = date.year * 12 + date.month - 1
+        if date.day != _clamped_day(value, self._day):
+            return None
+        return value
+
+    def __repr__(self):
+        cls = type(self).__name__
+        values = self._range
+        step = values.step
+        if self._unit == 'weeks':
+            step //= 7
+        if not values:
+            return f'{cls}(<empty>, step={step!r}, unit={self._unit!r})'
+        return (f'{cls}(start={str(self[0])!r}, last={str(self[-1])!r}, '
+                f'step={step!r}, unit={self._unit!r})')
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Can't set attribute {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Can't delete attribute {name!r}")
+
+    def __eq__(self, other):
+        if not isinstance(other, DateRange):
+            return NotImplemented
+        return self._keys() == other._keys()
+
+    def __hash__(self):
+        return hash(self._keys())
+
+    def _keys(self):
+        "The length and the day counts of the first, second and last dates."
+        length = len(self._range)
+        if not length:
+            return (0,)
+        second = self[1]._days if length > 1 else None
+        return (length, self[0]._days, second, self[-1]._days)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __bool__(self) -> bool:
+        return bool(self._range)
+
+    def __iter__(self):
+        to_date = self._to_date
+        for value in self._range:
+            yield to_date(value)
+
+    def __reversed__(self):
+        to_date = self._to_date
+        for value in reversed(self._range):
+            yield to_date(value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_range(self._range[index], self._unit,
+                                    self._day)
+        return self._to_date(self._range[index])
+
+    def __contains__(self, date) -> bool:
+        if not isinstance(date, Date):
+            return False
+        value = self._to_value(date)
+        return value is not None and value in self._range
+
+    def index(self, date: Date) -> int:
+        "Return the position of date in the range."
+        if date not in self:
+            raise ValueError(f'{date!r} is not in range')
+        return self._range.index(self._to_value(date))
+
+    def count(self, date: Date) -> int:
+        return int(date in self)
+
+    @property
+    def unit(self) -> str:
+        return self._unit
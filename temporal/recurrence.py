@@ -0,0 +1,287 @@
+""" Recurrence rules evaluated in closed form.
+
+A rule splits time into periods (weeks or months) with at most one
+occurrence each, and computes the occurrence of a period directly from day
+counts: a weekday offset, an nth weekday of a month or a business-day rank
+from a BusinessCalendar. Finding the next occurrence after a date therefore
+costs a constant number of period evaluations, and listing the occurrences
+between two dates costs one evaluation per period in between, never one per
+day.
+
+Example:
+    >>> rule = MonthlyWeekday(Date(2024, 1, 1), weekday=1, n=2)
+    >>> rule.next_after(Date(2024, 5, 20))
+    Date(year=2024, month=6, day=11)
+    >>> rule.between(Date(2024, 1, 1), Date(2024, 4, 1))
+    DateArray(['2024-01-09', '2024-02-13', '2024-03-12'])
+
+"""
+
+from array import array
+from itertools import count
+from temporal.algorithms import _days_from_fields, days_to_date
+from temporal.arrays import DateArray
+from temporal.business import BusinessCalendar
+from temporal.types import Date
+
+# Months in one 400 year Gregorian cycle, after which the weekday pattern of
+# every month repeats, so a rule without an occurrence by then has none.
+_CYCLE_MONTHS = 4800
+
+
+def _month_number(days: int) -> int:
+    "The month of a day count as year * 12 + month - 1."
+    year, month, _ = days_to_date(days)
+    return year * 12 + month - 1
+
+
+def _month_bounds(month_number: int):
+    "Day counts of the first day of a month and of the month after it."
+    year, month = divmod(month_number, 12)
+    first = _days_from_fields(year, month + 1, 1)
+    year, month = divmod(month_number + 1, 12)
+    return first, _days_from_fields(year, month + 1, 1)
+
+
+class Recurrence:
+    """Base class of recurrence rules.
+
+    Subclasses number their periods from 0 at the period containing start,
+    and implement _period and _occurrence. Occurrences before start are
+    never produced.
+    """
+    __slots__ = ('start', 'interval', '_start')
+
+    def __init__(self, start: Date, interval: int = 1) -> None:
+        if not isinstance(start, Date):
+            raise TypeError('Expected start to be a Date', f'{start!r}')
+        if not isinstance(interval, int):
+            raise TypeError('Expected interval to be an int', f'{interval!r}')
+        if interval < 1:
+            raise ValueError('interval must be positive', f'{interval!r}')
+        self.start = start
+        self.interval = interval
+        self._start = start._days
+
+    def _period(self, days: int) -> int:
+        "Return the index of the period containing days."
+        raise NotImplementedError
+
+    def _period_start(self, period: int) -> int:
+        "Return the day count of the first day of period."
+        raise NotImplementedError
+
+    def _occurrence(self, period: int):
+        "Return the day count of the occurrence in period, or None."
+        raise NotImplementedError
+
+    def _iter_days(self, days: int, stop: int = None):
+        """Yield occurrences on or after days and before stop as day counts.
+        Periods starting at or after stop end the search even when they have
+        no occurrence, so sparse rules stop as soon as the range is covered.
+        """
+        days = max(days, self._start)
+        occurrence_of = self._occurrence
+        period_start = self._period_start
+        empty = 0
+        for period in count(self._period(days)):
+            if stop is not None and period_start(period) >= stop:
+                return
+            occurrence = occurrence_of(period)
+            if occurrence is None or occurrence < days:
+                empty += 1
+                if empty > _CYCLE_MONTHS:
+                    return
+                continue
+            if stop is not None and occurrence >= stop:
+                return
+            empty = 0
+            yield occurrence
+
+    def __iter__(self):
+        for days in self._iter_days(self._start):
+            yield Date._from_days(days)
+
+    def occurrences(self, start: Date = None, stop: Date = None):
+        "Lazily yield the occurrences in [start, stop), unbounded by default."
+        days = self._start if start is None else start._days
+        stop = None if stop is None else stop._days
+        for days in self._iter_days(days, stop):
+            yield Date._from_days(days)
+
+    def next_after(self, date: Date):
+        "Return the first occurrence strictly after date, or None."
+        for days in self._iter_days(date._days + 1):
+            return Date._from_days(days)
+        return None
+
+    def between(self, start: Date, stop: Date) -> DateArray:
+        "Return all occurrences in [start, stop) as a DateArray."
+        return DateArray(array('i', self._iter_days(start._days, stop._days)))
+
+
+class Weekly(Recurrence):
+    """Every interval-th week on one weekday, counted from start.
+
+    Args:
+        start: The first date the rule may produce.
+        weekday: Day of the week, where Monday == 0 ... Sunday == 6.
+        interval: Weeks between two occurrences, 2 for every other week.
+    """
+    __slots__ = ('weekday', '_first', '_step')
+
+    def __init__(self, start: Date, weekday: int, interval: int = 1) -> None:
+        super().__init__(start, interval)
+        if weekday not in range(7):
+            raise ValueError('weekday must be between 0 and 6',
+                             f'{weekday!r}')
+        self.weekday = weekday
+        self._first = self._start + (weekday - (self._start + 2)) % 7
+        self._step = 7 * interval
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return (f'{cls}(start={self.start!r}, weekday={self.weekday!r}, '
+                f'interval={self.interval!r})')
+
+    def _period(self, days: int) -> int:
+        return max((days - self._first) // self._step, 0)
+
+    def _period_start(self, period: int) -> int:
+        return self._first + period * self._step
+
+    def _occurrence(self, period: int):
+        return self._first + period * self._step
+
+
+class _Monthly(Recurrence):
+    "Rules with at most one occurrence every interval-th month."
+    __slots__ = ('_month',)
+
+    def __init__(self, start: Date, interval: int = 1) -> None:
+        super().__init__(start, interval)
+        self._month = start.year * 12 + start.month - 1
+
+    def _period(self, days: int) -> int:
+        return max((_month_number(days) - self._month) // self.interval, 0)
+
+    def _period_start(self, period: int) -> int:
+        return _month_bounds(self._month + period * self.interval)[0]
+
+    def _occurrence(self, period: int):
+        if period < 0:
+            return None
+        first, stop = _month_bounds(self._month + period * self.interval)
+        days = self._in_month(first, stop)
+        if days is None or days < self._start:
+            return None
+        return days
+
+    def _in_month(self, first: int, stop: int):
+        "Return the occurrence between day counts first and stop, or None."
+        raise NotImplementedError
+
+
+class MonthlyDay(_Monthly):
+    """One day of every interval-th month.
+
+    Args:
+        start: The first date the rule may produce.
+        day: Day of the month, 1 to 31, or -1 for the last day, -2 for the
+            one before it and so on. Days past the end of a short month are
+            clamped to its last day.
+        interval: Months between two occurrences.
+    """
+    __slots__ = ('day',)
+
+    def __init__(self, start: Date, day: int, interval: int = 1) -> None:
+        super().__init__(start, interval)
+        if not (1 <= day <= 31 or -31 <= day <= -1):
+            raise ValueError('day must be between 1 and 31 or -31 and -1',
+                             f'{day!r}')
+        self.day = day
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return (f'{cls}(start={self.start!r}, day={self.day!r}, '
+                f'interval={self.interval!r})')
+
+    def _in_month(self, first: int, stop: int):
+        if self.day > 0:
+            return min(first + self.day - 1, stop - 1)
+        return max(stop + self.day, first)
+
+
+class MonthlyWeekday(_Monthly):
+    """The nth weekday of every interval-th month.
+
+    Args:
+        start: The first date the rule may produce.
+        weekday: Day of the week, where Monday == 0 ... Sunday == 6.
+        n: 1 for the first such weekday of the month up to 5, or -1 for the
+            last one down to -5. Months without an nth weekday are skipped.
+        interval: Months between two occurrences.
+    """
+    __slots__ = ('weekday', 'n')
+
+    def __init__(self, start: Date, weekday: int, n: int = 1,
+                 interval: int = 1) -> None:
+        super().__init__(start, interval)
+        if weekday not in range(7):
+            raise ValueError('weekday must be between 0 and 6',
+                             f'{weekday!r}')
+        if not (1 <= n <= 5 or -5 <= n <= -1):
+            raise ValueError('n must be between 1 and 5 or -5 and -1',
+                             f'{n!r}')
+        self.weekday = weekday
+        self.n = n
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return (f'{cls}(start={self.start!r}, weekday={self.weekday!r}, '
+                f'n={self.n!r}, interval={self.interval!r})')
+
+    def _in_month(self, first: int, stop: int):
+        if self.n > 0:
+            days = first + (self.weekday - (first + 2)) % 7 + 7 * (self.n - 1)
+            return days if days < stop else None
+        last = stop - 1
+        days = last - (last + 2 - self.weekday) % 7 + 7 * (self.n + 1)
+        return days if days >= first else None
+
+
+class MonthlyBusinessDay(_Monthly):
+    """The nth business day of every interval-th month.
+
+    Args:
+        start: The first date the rule may produce.
+        calendar: The BusinessCalendar defining business days.
+        n: 1 for the first business day of the month, 2 for the second and
+            so on, or -1 for the last business day, -2 for the one before.
+            Months with fewer business days are skipped.
+        interval: Months between two occurrences.
+    """
+    __slots__ = ('calendar', 'n')
+
+    def __init__(self, start: Date, calendar: BusinessCalendar, n: int = -1,
+                 interval: int = 1) -> None:
+        super().__init__(start, interval)
+        if not isinstance(calendar, BusinessCalendar):
+            raise TypeError('Expected calendar to be a BusinessCalendar',
+                            f'{calendar!r}')
+        if not isinstance(n, int) or n == 0:
+            raise ValueError('n must be a non-zero int', f'{n!r}')
+        self.calendar = calendar
+        self.n = n
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return (f'{cls}(start={self.start!r}, calendar={self.calendar!r}, '
+                f'n={self.n!r}, interval={self.interval!r})')
+
+    def _in_month(self, first: int, stop: int):
+        if self.n > 0:
+            days = self.calendar._offset(first - 1, self.n)
+        else:
+            days = self.calendar._offset(stop, self.n)
+        return days if first <= days < stop else None
@@ -0,0 +1,128 @@
+""" Fixed-width binary encoding for Date and Time.
+
+A Date is stored as its day count in 4 bytes and a Time as its microseconds
+since midnight in 8 bytes, with fold in the top bit, both little-endian.
+The bulk functions move whole columns through array buffers, so no
+per-field Python objects are created on the way.
+
+Example:
+    >>> buffer = pack_many([Date(2024, 1, 1), Date(2024, 1, 2)])
+    >>> unpack_many(buffer, Date)
+    [Date(year=2024, month=1, day=1), Date(year=2024, month=1, day=2)]
+
+"""
+
+from array import array
+from itertools import chain
+import sys
+from temporal.arrays import DateArray
+from temporal.constants import MICROSECONDS_PER_DAY
+from temporal.types import Date, Time, _TIME_MICROSECONDS_MASK
+
+DATE_SIZE = 4
+TIME_SIZE = 8
+
+
+def _to_little_endian(column: array) -> bytes:
+    if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_little_endian(typecode: str, data) -> array:
+    column = array(typecode)
+    column.frombytes(data)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+def pack_many(values) -> bytearray:
+    """Encodes a homogeneous sequence of dates or times into one buffer.
+
+    Args:
+        values: A DateArray, or an iterable of Date or of Time instances.
+
+    Returns:
+        A bytearray with DATE_SIZE or TIME_SIZE bytes per value.
+
+    Raises:
+        TypeError: The values are not all Date or not all Time instances.
+        OverflowError: A date is too far from 0000-03-01 for 4 bytes.
+    """
+
+    if isinstance(values, DateArray):
+        return bytearray(_to_little_endian(values.days))
+    values = iter(values)
+    first = next(values, None)
+    if first is None:
+        return bytearray()
+    values = chain((first,), values)
+    if isinstance(first, Date):
+        try:
+            column = array('i', [value._days for value in values])
+        except AttributeError:
+            raise TypeError('Expected every value to be a Date') from None
+        except OverflowError:
+            raise OverflowError('a date is outside the 4 byte encoding '
+                                'range') from None
+    elif isinstance(first, Time):
+        try:
+            column = array('Q', [value._microseconds | value.fold << 63
+                                 for value in values])
+        except AttributeError:
+            raise TypeError('Expected every value to be a Time') from None
+    else:
+        raise TypeError('Expected Date or Time values', f'{first!r}')
+    return bytearray(_to_little_endian(column))
+
+
+def unpack_many(data, cls) -> list:
+    """Decodes a buffer written by pack_many back into instances.
+
+    Args:
+        data: A bytes, bytearray or memoryview buffer.
+        cls: Date or Time, or a subclass of either.
+
+    Returns:
+        A list of cls instances.
+
+    Raises:
+        ValueError: The buffer size is not a multiple of the value size, or
+            a time is not before midnight.
+        TypeError: cls is neither a Date nor a Time type.
+    """
+
+    if issubclass(cls, Date):
+        size, typecode = DATE_SIZE, 'i'
+    elif issubclass(cls, Time):
+        size, typecode = TIME_SIZE, 'Q'
+    else:
+        raise TypeError('Expected cls to be a Date or Time type', f'{cls!r}')
+    if memoryview(data).nbytes % size:
+        raise ValueError(f'buffer size is not a multiple of {size}')
+    column = _from_little_endian(typecode, data)
+    if typecode == 'i':
+        from_days = cls._from_days
+        return [from_days(days) for days in column]
+    from_microseconds = cls._from_microseconds
+    mask = _TIME_MICROSECONDS_MASK
+    result = []
+    add = result.append
+    for value in column:
+        microseconds = value & mask
+        if microseconds >= MICROSECONDS_PER_DAY:
+            raise ValueError('encoded time is not before midnight',
+                             f'{microseconds!r}')
+        add(from_microseconds(microseconds, value >> 63))
+    return result
+
+
+def unpack_date_array(data) -> DateArray:
+    "Decode a buffer of packed dates straight into a DateArray."
+    if memoryview(data).nbytes % DATE_SIZE:
+        raise ValueError(f'buffer size is not a multiple of {DATE_SIZE}')
+    column = DateArray()
+    column.days.extend(_from_little_endian('i', data))
+    return column
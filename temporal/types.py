@@ -8,18 +8,29 @@ Example:
 
 """
 
+from array import array
+import struct
 import time
 from temporal.algorithms import (is_leap, from_ordinal, from_unix_time,
-                                 from_iso, to_ordinal, date_to_days,
-                                 days_to_date, week_no_from_date,
-                                 day_of_week_from_date)
+                                 days_to_date, days_to_iso_week,
+                                 iso_week_to_days, year_start,
+                                 _days_from_fields)
 from temporal.constants import (DAY_NAMES, DAY_NAMES_LONG, MONTH_NAMES,
-                                MONTH_NAMES_LONG, DAYS_IN_MONTH)
-from temporal.parsers import strftime
+                                MONTH_NAMES_LONG, DAYS_IN_MONTH,
+                                MICROSECONDS_PER_SECOND, MICROSECONDS_PER_DAY,
+                                UNIX_EPOCH_DAYS)
+from temporal.parsers import (iso_duration_seconds, iso_time_to_microseconds,
+                              strftime)
+
+_DATE_STRUCT = struct.Struct('<i')
+_TIME_STRUCT = struct.Struct('<Q')
+_TIME_MICROSECONDS_MASK = (1 << 63) - 1
+
+DEFAULT_INTERN_WINDOW = 366
 
 
 class Date:
-    __slots__ = ('year', 'month', 'day')
+    __slots__ = ('year', 'month', 'day', '_days')
     __match_args__ = ('year', 'month', 'day')
 
     def __init__(self, year: int, month: int, day: int) -> None:
@@ -37,6 +48,7 @@ class Date:
         object.__setattr__(self, 'year', year)
         object.__setattr__(self, 'month', month)
         object.__setattr__(self, 'day', day)
+        object.__setattr__(self, '_days', _days_from_fields(year, month, day))
 
     def __repr__(self):
         cls = type(self).__name__
@@ -48,30 +60,30 @@ class Date:
     def __eq__(self, other):
         if not isinstance(other, Date):
             return NotImplemented
-        return (self.year, self.month, self.day) == (other.year, other.month, other.day)
+        return self._days == other._days
 
     def __le__(self, other) -> bool:
         if not isinstance(other, Date):
             return NotImplemented
-        return (self.year, self.month, self.day) <= (other.year, other.month, other.day)
+        return self._days <= other._days
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, Date):
             return NotImplemented
-        return (self.year, self.month, self.day) < (other.year, other.month, other.day)
+        return self._days < other._days
 
     def __ge__(self, other) -> bool:
         if not isinstance(other, Date):
             return NotImplemented
-        return (self.year, self.month, self.day) >= (other.year, other.month, other.day)
+        return self._days >= other._days
 
     def __gt__(self, other) -> bool:
         if not isinstance(other, Date):
             return NotImplemented
-        return (self.year, self.month, self.day) > (other.year, other.month, other.day)
+        return self._days > other._days
 
     def __hash__(self):
-        return hash((self.year, self.month, self.day))
+        return hash(self._days)
 
     def __setattr__(self, name, value):
         raise AttributeError(f"Can't set attribute {name!r}")
@@ -79,14 +91,6 @@ class Date:
     def __delattr__(self, name):
         raise AttributeError(f"Can't delete attribute {name!r}")
 
-    def __getstate__(self):
-        return (self.year, self.month, self.day)
-
-    def __setstate__(self, state):
-        fields = ('year', 'month', 'day')
-        for field, value in zip(fields, state):
-            object.__setattr__(self, field, value)
-
     def __format__(self, fmt: str):
         if not isinstance(fmt, str):
             raise TypeError(f'must be str, not {type(fmt).__name__}')
@@ -95,30 +99,68 @@ class Date:
         return str(self)
 
     def __reduce__(self):
-        # Only necessary if Pickle is to be supported
-        pass
+        return type(self)._from_days, (self._days,)
 
-    def __add__(self, other) -> bool:
-        # Need the TimeDelta Object
-        pass
+    def __add__(self, other) -> 'Date':
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        days = other._microseconds // MICROSECONDS_PER_DAY
+        return type(self)._from_days(self._days + days)
 
     __radd__ = __add__
 
-    def __sub__(self, other) -> bool:
-        # Need the TimeDelta Object
-        pass
+    def __sub__(self, other):
+        if isinstance(other, TimeDelta):
+            days = other._microseconds // MICROSECONDS_PER_DAY
+            return type(self)._from_days(self._days - days)
+        if isinstance(other, Date):
+            return TimeDelta._from_microseconds(
+                (self._days - other._days) * MICROSECONDS_PER_DAY)
+        return NotImplemented
 
     def __iter__(self):
         yield from (self.year, self.month, self.day)
 
     # Additional Constructors
     @classmethod
-    def from_timestamp(cls, seconds: int) -> 'Date':
-        "Construct a date from a POSIX timestamp."
-        days = int(seconds // 86400)
-        year, month, day, *_ = from_unix_time(days)
-        return cls(year, month, day)
-    
+    def _from_fields(cls, year: int, month: int, day: int) -> 'Date':
+        """Construct a date from fields that are already known to be valid.
+        Skips the checks in __init__, for internal use only.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, 'year', year)
+        object.__setattr__(self, 'month', month)
+        object.__setattr__(self, 'day', day)
+        object.__setattr__(self, '_days', _days_from_fields(year, month, day))
+        return self
+
+    @classmethod
+    def _from_days(cls, days: int) -> 'Date':
+        "Construct a date from days since 0000-03-01, for internal use only."
+        self = object.__new__(cls)
+        year, month, day = days_to_date(days)
+        object.__setattr__(self, 'year', year)
+        object.__setattr__(self, 'month', month)
+        object.__setattr__(self, 'day', day)
+        object.__setattr__(self, '_days', days)
+        return self
+
+    @classmethod
+    def from_bytes(cls, data) -> 'Date':
+        "Construct a date from the 4 byte encoding returned by to_bytes."
+        days, = _DATE_STRUCT.unpack(data)
+        return cls._from_days(days)
+
+    @classmethod
+    def from_timestamp(cls, seconds: int, interned: bool = False) -> 'Date':
+        """Construct a date from a POSIX timestamp.
+        With interned set, dates near today are shared instances.
+        """
+        days = int(seconds // 86400) + UNIX_EPOCH_DAYS
+        if interned:
+            return _intern_pool.get(cls, days)
+        return cls._from_days(days)
+
     @classmethod
     def today(cls) -> 'Date':
         "Construct a date from time.time()."
@@ -126,13 +168,42 @@ class Date:
         return cls.from_timestamp(seconds_since_epoch)
 
     @classmethod
-    def from_ordinal(cls, days: int) -> 'Date':
+    def from_ordinal(cls, days: int, interned: bool = False) -> 'Date':
         """Construct a date from a proleptic Gregorian ordinal.
         0001-01-01 is day 1. Only the year, month and day are
-        non-zero in the result.
+        non-zero in the result. With interned set, dates near today are
+        shared instances.
         """
         year, month, day = from_ordinal(days)
-        return cls(year, month, day)
+        if interned:
+            return _intern_pool.get(cls, _days_from_fields(year, month, day))
+        return cls._from_fields(year, month, day)
+
+    @classmethod
+    def interned(cls, year: int, month: int, day: int) -> 'Date':
+        """Construct a date, sharing one instance per date near today.
+        The window is set with configure_interning.
+        """
+        if (isinstance(year, int) and isinstance(month, int)
+                and isinstance(day, int)):
+            date = _intern_pool.lookup(cls, year, month, day)
+            if date is not None:
+                return date
+        date = cls(year, month, day)
+        _intern_pool.store(date)
+        return date
+
+    @staticmethod
+    def configure_interning(window: int = None) -> None:
+        """Clear the intern cache and its counters and center it on today.
+        window is the number of days on either side of today to share.
+        """
+        _intern_pool.reset(window)
+
+    @staticmethod
+    def intern_info() -> dict:
+        "Return hits, misses, current size and window of the intern cache."
+        return _intern_pool.info()
 
     @classmethod
     def from_iso_format(cls, date: str) -> 'Date':
@@ -141,27 +212,32 @@ class Date:
 
     @classmethod
     def from_iso_calendar(cls, year: int, week: int, day: int) -> 'Date':
-        days = (week - 1) * 7 + day
-        days += date_to_days(year,1,1)
-        year, month, day = days_to_date(days)
-        return cls(year, month, day)
+        "Construct a date from an ISO year, week number and ISO weekday."
+        return cls._from_days(iso_week_to_days(year, week, day))
 
     @classmethod
     def from_iso_date(cls, days: int) -> 'Date':
         "Construct a date from days from ISO. 0000-01-01 is day 0."
-        year, month, day = from_iso(days)
-        return cls(year, month, day)
+        return cls._from_days(days - 60)
 
     # Format methods
     def as_iso_format(self) -> str:
         return f'{self.year:04}-{self.month:02}-{self.day:02}'
 
+    def to_bytes(self) -> bytes:
+        "Return the day count as a 4 byte little-endian signed integer."
+        try:
+            return _DATE_STRUCT.pack(self._days)
+        except struct.error:
+            raise OverflowError('date is outside the 4 byte encoding range',
+                                f'{self!r}') from None
+
     def as_ordinal(self) -> int:
         """Return proleptic Gregorian ordinal for the year, month and day.
         January 1 of year 1 is day 1.  Only the year, month and day values
         contribute to the result.
         """
-        return to_ordinal(*self)
+        return self._days - 305
 
     def as_ctime(self) -> str:
         "Return ctime style string."
@@ -179,33 +255,230 @@ class Date:
     def as_iso_calendar(self):
         # original datetime returns a instance of IsoCalendarDate
         # return (self.year, self.week(), self.iso_weekday())
-        return week_no_from_date(*self)
+        return days_to_iso_week(self._days)
 
     # Calculation methods
     def weekday(self) -> int:
         "Return day of the week, where Monday == 0 ... Sunday == 6."
-        return (self.as_ordinal() + 6) % 7
+        return (self._days + 2) % 7
 
     def iso_weekday(self) -> int:
         "Return day of the week, where Monday == 1 ... Sunday == 7."
-        return self.as_ordinal() % 7 or 7
+        return (self._days + 2) % 7 + 1
 
     def day_of_year(self) -> int:
-        return date_to_days(*self) - date_to_days(self.year, 1, 1) + 1
+        return self._days - year_start(self.year) + 1
 
     def week(self) -> int:
-        _, week, _ = week_no_from_date(*self)
+        _, week, _ = days_to_iso_week(self._days)
         return week
         # return self.day_of_year() // 7 + 1
 
 
+class _InternPool:
+    """Shared Date instances for the days within a window around today.
+    The window follows the clock: a date outside it triggers a check of
+    the current day, and the window moves and drops stale dates on change.
+    """
+    __slots__ = ('window', 'today', 'first', 'last', 'dates', 'hits',
+                 'misses')
+
+    def __init__(self, window: int) -> None:
+        self.reset(window)
+
+    def reset(self, window: int = None) -> None:
+        if window is not None:
+            if not isinstance(window, int) or window < 0:
+                raise ValueError('window must be a non-negative int',
+                                 f'{window!r}')
+            self.window = window
+        self.dates = {}
+        self.today = None
+        self._recenter()
+        self.hits = 0
+        self.misses = 0
+
+    def _recenter(self) -> bool:
+        "Center the window on the current day, return whether it moved."
+        today = int(time.time() // 86400) + UNIX_EPOCH_DAYS
+        if today == self.today:
+            return False
+        self.today = today
+        self.first = first = today - self.window
+        self.last = last = today + self.window
+        self.dates = {days: date for days, date in self.dates.items()
+                      if first <= days <= last}
+        return True
+
+    def _in_window(self, days: int) -> bool:
+        if self.first <= days <= self.last:
+            return True
+        return self._recenter() and self.first <= days <= self.last
+
+    def get(self, cls, days: int) -> Date:
+        date = self.dates.get(days)
+        if date is not None and type(date) is cls:
+            self.hits += 1
+            return date
+        self.misses += 1
+        date = cls._from_days(days)
+        if cls is Date and self._in_window(days):
+            self.dates[days] = date
+        return date
+
+    def lookup(self, cls, year: int, month: int, day: int):
+        "Return the shared date for the fields or None, counting a miss."
+        date = self.dates.get(_days_from_fields(year, month, day))
+        # Invalid fields such as February 30 map onto a valid day count
+        if (date is not None and type(date) is cls and date.day == day
+                and date.month == month):
+            self.hits += 1
+            return date
+        self.misses += 1
+        return None
+
+    def store(self, date: Date) -> None:
+        if type(date) is Date and self._in_window(date._days):
+            self.dates[date._days] = date
+
+    def info(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self.dates), 'window': self.window}
+
+
+_intern_pool = _InternPool(DEFAULT_INTERN_WINDOW)
+
+
+class TimeDelta:
+    __slots__ = ('_microseconds',)
+
+    def __init__(self, days: int = 0, seconds: int = 0, microseconds: int = 0,
+                 milliseconds: int = 0, minutes: int = 0, hours: int = 0,
+                 weeks: int = 0) -> None:
+        for key, value in locals().items():
+            if key != 'self' and not isinstance(value, int):
+                raise TypeError(f'Expected {key} to be an int', f'{value!r}')
+        days += weeks * 7
+        seconds += (days * 24 + hours) * 3600 + minutes * 60
+        microseconds += (seconds * 1000 + milliseconds) * 1000
+        object.__setattr__(self, '_microseconds', microseconds)
+
+    @classmethod
+    def _from_microseconds(cls, microseconds: int) -> 'TimeDelta':
+        "Construct a delta from a total amount of microseconds, unchecked."
+        self = object.__new__(cls)
+        object.__setattr__(self, '_microseconds', microseconds)
+        return self
+
+    @classmethod
+    def from_iso_duration(cls, text: str) -> 'TimeDelta':
+        "Construct a delta from an ISO-8601 duration without years or months."
+        seconds = iso_duration_seconds(text)
+        return cls._from_microseconds(seconds * MICROSECONDS_PER_SECOND)
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return (f'{cls}(days={self.days!r}, seconds={self.seconds!r}, '
+                f'microseconds={self.microseconds!r})')
+
+    def __eq__(self, other):
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return self._microseconds == other._microseconds
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return self._microseconds <= other._microseconds
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return self._microseconds < other._microseconds
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return self._microseconds >= other._microseconds
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return self._microseconds > other._microseconds
+
+    def __hash__(self):
+        return hash(self._microseconds)
+
+    def __bool__(self) -> bool:
+        return self._microseconds != 0
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Can't set attribute {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Can't delete attribute {name!r}")
+
+    def __reduce__(self):
+        return type(self)._from_microseconds, (self._microseconds,)
+
+    def __add__(self, other) -> 'TimeDelta':
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return TimeDelta._from_microseconds(
+            self._microseconds + other._microseconds)
+
+    def __sub__(self, other) -> 'TimeDelta':
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return TimeDelta._from_microseconds(
+            self._microseconds - other._microseconds)
+
+    def __neg__(self) -> 'TimeDelta':
+        return TimeDelta._from_microseconds(-self._microseconds)
+
+    def __abs__(self) -> 'TimeDelta':
+        return TimeDelta._from_microseconds(abs(self._microseconds))
+
+    def __mul__(self, other) -> 'TimeDelta':
+        if not isinstance(other, int):
+            return NotImplemented
+        return TimeDelta._from_microseconds(self._microseconds * other)
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if isinstance(other, TimeDelta):
+            return self._microseconds // other._microseconds
+        if isinstance(other, int):
+            return TimeDelta._from_microseconds(self._microseconds // other)
+        return NotImplemented
+
+    # Component access
+    @property
+    def days(self) -> int:
+        return self._microseconds // MICROSECONDS_PER_DAY
+
+    @property
+    def seconds(self) -> int:
+        remainder = self._microseconds % MICROSECONDS_PER_DAY
+        return remainder // MICROSECONDS_PER_SECOND
+
+    @property
+    def microseconds(self) -> int:
+        return self._microseconds % MICROSECONDS_PER_SECOND
+
+    def total_seconds(self) -> float:
+        return self._microseconds / MICROSECONDS_PER_SECOND
+
+
 class Time:
-    __slots__ = ('hour', 'minute', 'second', 'microsecond', 'fold')
+    __slots__ = ('_microseconds', 'fold')
     __match_args__ = ('hour', 'minute', 'second', 'microsecond', 'fold')
 
-    def __init__(self, hour: int, minute: int, second: int, microsecond: int, fold: int) -> None:
+    def __init__(self, hour: int, minute: int = 0, second: int = 0,
+                 microsecond: int = 0, fold: int = 0) -> None:
         for key, value in locals().items():
-            if key in self.__slots__ and not isinstance(value, int):
+            if key in self.__match_args__ and not isinstance(value, int):
                 raise TypeError(f'Expected {key} to be an int', f'{value!r}')
         if not 0 <= hour <= 23:
             raise ValueError(f'hour must be between 0 and 23')
@@ -217,10 +490,9 @@ class Time:
             raise ValueError(f'microsecond must be between 0 and 999999')
         if not 0 <= fold <= 1:
             raise ValueError(f'fold must be between 0 and 1')
-        object.__setattr__(self, 'hour', hour)
-        object.__setattr__(self, 'minute', minute)
-        object.__setattr__(self, 'second', second)
-        object.__setattr__(self, 'microsecond', microsecond)
+        object.__setattr__(self, '_microseconds',
+                           ((hour * 60 + minute) * 60 + second)
+                           * MICROSECONDS_PER_SECOND + microsecond)
         object.__setattr__(self, 'fold', fold)
 
     def __repr__(self):
@@ -229,13 +501,37 @@ class Time:
                 f'second={self.second!r}, microsecond={self.microsecond!r}, '
                 f'fold={self.fold!r})')
 
+    def __str__(self) -> str:
+        return self.as_iso_format()
+
+    # As with datetime.time, fold does not take part in comparisons
     def __eq__(self, other):
         if not isinstance(other, Time):
             return NotImplemented
-        return (self.hour, self.minute, self.second, self.microsecond, self.fold) == (other.hour, other.minute, other.second, other.microsecond, other.fold)
+        return self._microseconds == other._microseconds
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._microseconds <= other._microseconds
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._microseconds < other._microseconds
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._microseconds >= other._microseconds
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._microseconds > other._microseconds
 
     def __hash__(self):
-        return hash((self.hour, self.minute, self.second, self.microsecond, self.fold))
+        return hash(self._microseconds)
 
     def __setattr__(self, name, value):
         raise AttributeError(f"Can't set attribute {name!r}")
@@ -243,13 +539,293 @@ class Time:
     def __delattr__(self, name):
         raise AttributeError(f"Can't delete attribute {name!r}")
 
-    def __getstate__(self):
-        return (self.hour, self.minute, self.second, self.microsecond, self.fold)
+    def __reduce__(self):
+        return type(self).from_bytes, (self.to_bytes(),)
+
+    def __add__(self, other) -> 'Time':
+        "Add a TimeDelta, wrapping around midnight."
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return type(self)._from_microseconds(
+            (self._microseconds + other._microseconds) % MICROSECONDS_PER_DAY)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, TimeDelta):
+            return type(self)._from_microseconds(
+                (self._microseconds - other._microseconds)
+                % MICROSECONDS_PER_DAY)
+        if isinstance(other, Time):
+            return TimeDelta._from_microseconds(
+                self._microseconds - other._microseconds)
+        return NotImplemented
+
+    # Component access
+    @property
+    def hour(self) -> int:
+        return self._microseconds // 3_600_000_000
+
+    @property
+    def minute(self) -> int:
+        return self._microseconds // 60_000_000 % 60
+
+    @property
+    def second(self) -> int:
+        return self._microseconds // MICROSECONDS_PER_SECOND % 60
+
+    @property
+    def microsecond(self) -> int:
+        return self._microseconds % MICROSECONDS_PER_SECOND
+
+    # Additional Constructors
+    @classmethod
+    def _from_microseconds(cls, microseconds: int, fold: int = 0) -> 'Time':
+        """Construct a time from microseconds since midnight, unchecked.
+        For internal use only.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, '_microseconds', microseconds)
+        object.__setattr__(self, 'fold', fold)
+        return self
+
+    @classmethod
+    def from_bytes(cls, data) -> 'Time':
+        "Construct a time from the 8 byte encoding returned by to_bytes."
+        value, = _TIME_STRUCT.unpack(data)
+        microseconds = value & _TIME_MICROSECONDS_MASK
+        if microseconds >= MICROSECONDS_PER_DAY:
+            raise ValueError('encoded time is not before midnight',
+                             f'{microseconds!r}')
+        return cls._from_microseconds(microseconds, value >> 63)
+
+    @classmethod
+    def from_iso_format(cls, text: str) -> 'Time':
+        "Construct a time from an ISO-8601 string such as 12:30:05.250."
+        return cls._from_microseconds(iso_time_to_microseconds(text))
+
+    # Format methods
+    def as_iso_format(self) -> str:
+        "Return hh:mm:ss, followed by .ffffff when microsecond is not 0."
+        seconds, microsecond = divmod(self._microseconds,
+                                      MICROSECONDS_PER_SECOND)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        if microsecond:
+            return f'{hour:02}:{minute:02}:{second:02}.{microsecond:06}'
+        return f'{hour:02}:{minute:02}:{second:02}'
+
+    def as_microseconds(self) -> int:
+        "Return the number of microseconds since midnight."
+        return self._microseconds
+
+    def to_bytes(self) -> bytes:
+        """Return an 8 byte little-endian encoding of the time.
+        The low 63 bits hold the microseconds since midnight and the top
+        bit holds fold.
+        """
+        return _TIME_STRUCT.pack(self._microseconds | self.fold << 63)
+
+
+class DateTime:
+    __slots__ = ('_microseconds', 'fold')
+    __match_args__ = ('year', 'month', 'day', 'hour', 'minute', 'second',
+                      'microsecond', 'fold')
+
+    def __init__(self, year: int, month: int, day: int, hour: int = 0,
+                 minute: int = 0, second: int = 0, microsecond: int = 0,
+                 fold: int = 0) -> None:
+        date = Date(year, month, day)
+        time = Time(hour, minute, second, microsecond, fold)
+        object.__setattr__(self, '_microseconds',
+                           (date._days - UNIX_EPOCH_DAYS)
+                           * MICROSECONDS_PER_DAY + time._microseconds)
+        object.__setattr__(self, 'fold', fold)
+
+    def __repr__(self):
+        cls = type(self).__name__
+        year, month, day = self._date_fields()
+        time = self.time()
+        return (f'{cls}(year={year!r}, month={month!r}, day={day!r}, '
+                f'hour={time.hour!r}, minute={time.minute!r}, '
+                f'second={time.second!r}, microsecond={time.microsecond!r}, '
+                f'fold={self.fold!r})')
+
+    def __str__(self) -> str:
+        return self.as_iso_format()
+
+    def __eq__(self, other):
+        if not isinstance(other, DateTime):
+            return NotImplemented
+        return self._microseconds == other._microseconds
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, DateTime):
+            return NotImplemented
+        return self._microseconds <= other._microseconds
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, DateTime):
+            return NotImplemented
+        return self._microseconds < other._microseconds
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, DateTime):
+            return NotImplemented
+        return self._microseconds >= other._microseconds
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, DateTime):
+            return NotImplemented
+        return self._microseconds > other._microseconds
+
+    def __hash__(self):
+        return hash(self._microseconds)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Can't set attribute {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Can't delete attribute {name!r}")
+
+    def __reduce__(self):
+        return type(self)._from_microseconds, (self._microseconds, self.fold)
+
+    def __add__(self, other) -> 'DateTime':
+        if not isinstance(other, TimeDelta):
+            return NotImplemented
+        return type(self)._from_microseconds(
+            self._microseconds + other._microseconds)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, TimeDelta):
+            return type(self)._from_microseconds(
+                self._microseconds - other._microseconds)
+        if isinstance(other, DateTime):
+            return TimeDelta._from_microseconds(
+                self._microseconds - other._microseconds)
+        return NotImplemented
+
+    # Component access
+    def _date_fields(self):
+        return from_unix_time(self._microseconds // MICROSECONDS_PER_DAY)
+
+    @property
+    def year(self) -> int:
+        return self._date_fields()[0]
+
+    @property
+    def month(self) -> int:
+        return self._date_fields()[1]
+
+    @property
+    def day(self) -> int:
+        return self._date_fields()[2]
+
+    @property
+    def hour(self) -> int:
+        return self._microseconds % MICROSECONDS_PER_DAY // 3_600_000_000
+
+    @property
+    def minute(self) -> int:
+        return self._microseconds // 60_000_000 % 60
+
+    @property
+    def second(self) -> int:
+        return self._microseconds // MICROSECONDS_PER_SECOND % 60
+
+    @property
+    def microsecond(self) -> int:
+        return self._microseconds % MICROSECONDS_PER_SECOND
+
+    def date(self) -> Date:
+        days = self._microseconds // MICROSECONDS_PER_DAY
+        return Date._from_days(days + UNIX_EPOCH_DAYS)
+
+    def time(self) -> Time:
+        return Time._from_microseconds(
+            self._microseconds % MICROSECONDS_PER_DAY, self.fold)
+
+    # Additional Constructors
+    @classmethod
+    def _from_microseconds(cls, microseconds: int,
+                           fold: int = 0) -> 'DateTime':
+        """Construct from microseconds since 1970-01-01, unchecked.
+        For internal use only.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, '_microseconds', microseconds)
+        object.__setattr__(self, 'fold', fold)
+        return self
+
+    @classmethod
+    def combine(cls, date: Date, time: Time) -> 'DateTime':
+        "Construct a datetime from a Date and a Time."
+        return cls._from_microseconds(
+            (date._days - UNIX_EPOCH_DAYS) * MICROSECONDS_PER_DAY
+            + time._microseconds, time.fold)
+
+    @classmethod
+    def from_timestamp(cls, seconds) -> 'DateTime':
+        "Construct a datetime from a POSIX timestamp, int or float."
+        if isinstance(seconds, int):
+            return cls._from_microseconds(seconds * MICROSECONDS_PER_SECOND)
+        return cls._from_microseconds(
+            round(seconds * MICROSECONDS_PER_SECOND))
+
+    @classmethod
+    def from_timestamps(cls, values, typecode: str = None) -> list:
+        """Construct datetimes from many POSIX timestamps at once.
+        values is an iterable of int or float, an array or memoryview of
+        int64 ('q') or float64 ('d'), or a raw bytes-like buffer of native
+        values whose array typecode, 'q' or 'd', is given as typecode.
+        Raw buffers without a typecode raise TypeError.
+        """
+        if typecode is not None:
+            if typecode not in ('q', 'd'):
+                raise ValueError("typecode must be 'q' or 'd'",
+                                 f'{typecode!r}')
+            column = array(typecode)
+            column.frombytes(values)
+            values = column
+        elif isinstance(values, (bytes, bytearray, memoryview, array)):
+            typecode = (getattr(values, 'typecode', None)
+                        or getattr(values, 'format', None))
+            if typecode not in ('q', 'd'):
+                raise TypeError("Expected an array or memoryview of 'q' or "
+                                "'d' values, or a typecode for raw buffers",
+                                f'{type(values).__name__}')
+        from_microseconds = cls._from_microseconds
+        scale = MICROSECONDS_PER_SECOND
+        if typecode == 'd':
+            return [from_microseconds(round(value * scale))
+                    for value in values]
+        if typecode == 'q':
+            return [from_microseconds(value * scale) for value in values]
+        return [from_microseconds(value * scale if isinstance(value, int)
+                                  else round(value * scale))
+                for value in values]
+
+    @classmethod
+    def now(cls) -> 'DateTime':
+        "Construct a datetime from time.time_ns()."
+        return cls._from_microseconds(time.time_ns() // 1000)
+
+    # Format methods
+    def as_iso_format(self) -> str:
+        year, month, day = self._date_fields()
+        return (f'{year:04}-{month:02}-{day:02}T'
+                f'{self.time().as_iso_format()}')
+
+    def as_microseconds(self) -> int:
+        "Return the number of microseconds since 1970-01-01T00:00:00."
+        return self._microseconds
 
-    def __setstate__(self, state):
-        fields = ('hour', 'minute', 'second', 'microsecond', 'fold')
-        for field, value in zip(fields, state):
-            object.__setattr__(self, field, value)
+    def timestamp(self) -> float:
+        "Return the POSIX timestamp as a float."
+        return self._microseconds / MICROSECONDS_PER_SECOND
 
 # from dataclasses import dataclass
 
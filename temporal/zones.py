@@ -0,0 +1,543 @@
+""" Time zones read from TZif files.
+
+Each zone is parsed once into sorted arrays of UTC transition times and the
+UTC offsets that follow them, and offsets are then resolved by binary
+search. A ZoneLoader finds zones in zoneinfo directories or in in-memory
+mappings of key to TZif bytes, and keeps the loaded zones in an LRU cache.
+Past the last transition the POSIX TZ string in the footer of version 2+
+files takes over: its yearly transitions are appended to the arrays as
+lookups reach them, so slim files and instants after 2037 resolve to the
+offsets the rules define.
+
+Example:
+    >>> loader = ZoneLoader()
+    >>> zone = loader.get('Europe/Stockholm')
+    >>> zone.to_local(DateTime(2024, 7, 1, 12))
+    DateTime(year=2024, month=7, day=1, hour=14, minute=0, second=0, ...)
+
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+import os
+import struct
+from temporal.algorithms import _days_from_fields, days_to_year, year_start
+from temporal.constants import (MICROSECONDS_PER_DAY, MICROSECONDS_PER_SECOND,
+                                UNIX_EPOCH_DAYS)
+from temporal.types import DateTime
+
+TZPATH = ('/usr/share/zoneinfo', '/usr/lib/zoneinfo',
+          '/usr/share/lib/zoneinfo', '/etc/zoneinfo')
+ZONE_CACHE_SIZE = 64
+
+_HEADER = struct.Struct('>4sc15x6l')
+# Rule transitions may be given up to 167 hours from midnight local time, so
+# a year is generated once lookups come within 8 days of it.
+_RULE_MARGIN = 8 * 86_400
+_RULE_LAST_YEAR = 9999
+
+
+def _tz_number(text: str, pos: int):
+    "Read up to three ASCII digits at pos, returning them and the next pos."
+    end = pos
+    while end < len(text) and end - pos < 3 and '0' <= text[end] <= '9':
+        end += 1
+    if end == pos:
+        raise ValueError('expected a number in TZ string', f'{text!r}')
+    return int(text[pos:end]), end
+
+
+def _tz_time(text: str, pos: int):
+    "Read [+-]hh[:mm[:ss]] at pos, returning seconds and the next position."
+    sign = 1
+    if text[pos:pos + 1] in ('+', '-'):
+        sign = -1 if text[pos] == '-' else 1
+        pos += 1
+    hours, pos = _tz_number(text, pos)
+    minutes = seconds = 0
+    if text[pos:pos + 1] == ':':
+        minutes, pos = _tz_number(text, pos + 1)
+        if text[pos:pos + 1] == ':':
+            seconds, pos = _tz_number(text, pos + 1)
+    if hours > 167 or minutes > 59 or seconds > 59:
+        raise ValueError('invalid time in TZ string', f'{text!r}')
+    return sign * (hours * 3600 + minutes * 60 + seconds), pos
+
+
+def _tz_name(text: str, pos: int):
+    "Read an abbreviation at pos, either alphabetic or quoted in <>."
+    if text[pos:pos + 1] == '<':
+        end = text.find('>', pos)
+        name = text[pos + 1:end]
+        pos = end + 1
+        valid = end > 0 and all(c.isalnum() or c in '+-' for c in name)
+    else:
+        end = pos
+        while end < len(text) and text[end].isalpha():
+            end += 1
+        name = text[pos:end]
+        pos = end
+        valid = True
+    if not valid or len(name) < 3 or not name.isascii():
+        raise ValueError('invalid abbreviation in TZ string', f'{text!r}')
+    return name, pos
+
+
+def _tz_date(text: str, pos: int):
+    "Read a Jn, n or Mm.w.d rule and its optional /time at pos."
+    if text[pos:pos + 1] == 'M':
+        month, pos = _tz_number(text, pos + 1)
+        if text[pos:pos + 1] != '.':
+            raise ValueError('invalid date rule in TZ string', f'{text!r}')
+        week, pos = _tz_number(text, pos + 1)
+        if text[pos:pos + 1] != '.':
+            raise ValueError('invalid date rule in TZ string', f'{text!r}')
+        weekday, pos = _tz_number(text, pos + 1)
+        valid = 1 <= month <= 12 and 1 <= week <= 5 and weekday <= 6
+        date = ('M', month, week, weekday)
+    else:
+        julian = text[pos:pos + 1] == 'J'
+        day, pos = _tz_number(text, pos + julian)
+        valid = 1 <= day <= 365 if julian else day <= 365
+        date = ('J' if julian else 'n', day)
+    if not valid:
+        raise ValueError('invalid date rule in TZ string', f'{text!r}')
+    time = 7200
+    if text[pos:pos + 1] == '/':
+        time, pos = _tz_time(text, pos + 1)
+    return date, time, pos
+
+
+def _rule_day(date: tuple, year: int) -> int:
+    "Day count of the day a Jn, n or Mm.w.d rule falls on in year."
+    if date[0] == 'J':
+        days = year_start(year) + date[1] - 1
+        if date[1] >= 60 and year_start(year + 1) - year_start(year) == 366:
+            days += 1
+        return days
+    if date[0] == 'n':
+        return year_start(year) + date[1]
+    _, month, week, weekday = date
+    first = _days_from_fields(year, month, 1)
+    days = first + (weekday - (first + 3)) % 7 + 7 * (week - 1)
+    carry, month = divmod(month, 12)
+    stop = _days_from_fields(year + carry, month + 1, 1)
+    while days >= stop:
+        days -= 7
+    return days
+
+
+class _TZRule:
+    """A POSIX TZ string such as 'CET-1CEST,M3.5.0,M10.5.0/3'.
+
+    Offsets are converted to seconds east of UTC. start and end are the
+    (date rule, local time) pairs of the switch to and from daylight saving
+    time, None for zones without it.
+    """
+    __slots__ = ('text', 'std_offset', 'std_name', 'dst_offset', 'dst_name',
+                 'start', 'end')
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.std_name, pos = _tz_name(text, 0)
+        offset, pos = _tz_time(text, pos)
+        self.std_offset = -offset
+        self.dst_name = self.dst_offset = self.start = self.end = None
+        if pos == len(text):
+            return
+        self.dst_name, pos = _tz_name(text, pos)
+        self.dst_offset = self.std_offset + 3600
+        if text[pos:pos + 1] not in ('', ','):
+            offset, pos = _tz_time(text, pos)
+            self.dst_offset = -offset
+        if text[pos:pos + 1] != ',':
+            raise ValueError('TZ string has no daylight saving rules',
+                             f'{text!r}')
+        date, time, pos = _tz_date(text, pos + 1)
+        self.start = date, time
+        if text[pos:pos + 1] != ',':
+            raise ValueError('invalid TZ string', f'{text!r}')
+        date, time, pos = _tz_date(text, pos + 1)
+        self.end = date, time
+        if pos != len(text):
+            raise ValueError('invalid TZ string', f'{text!r}')
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return f'{cls}({self.text!r})'
+
+    def transitions(self, year: int) -> list:
+        "Return the sorted (utc_seconds, offset, name) switches of a year."
+        result = []
+        if self.start is None:
+            return result
+        for (date, time), before, offset, name in (
+                (self.start, self.std_offset, self.dst_offset, self.dst_name),
+                (self.end, self.dst_offset, self.std_offset, self.std_name)):
+            days = _rule_day(date, year) - UNIX_EPOCH_DAYS
+            result.append((days * 86_400 + time - before, offset, name))
+        result.sort()
+        return result
+
+
+class Zone:
+    """A time zone as sorted arrays of transitions and offsets.
+
+    Offsets are in seconds east of UTC. Conversions work on DateTime
+    instances or on integers of microseconds since the Unix epoch. With
+    daylight saving rules in footer, the transitions they define after the
+    last given one are appended a year at a time, whenever a lookup reaches
+    past the years generated so far.
+    """
+    __slots__ = ('key', '_transitions', '_offsets', '_abbreviations',
+                 '_wall', '_rule', '_year', '_limit')
+
+    def __init__(self, key: str, transitions, offsets, abbreviations,
+                 footer: str = None) -> None:
+        """
+        Args:
+            key: The zone name, such as 'Europe/Stockholm'.
+            transitions: Sorted UTC transition times in seconds.
+            offsets: One more offset than transitions: the offset before the
+                first transition followed by the offset after each one.
+            abbreviations: Abbreviations matching offsets.
+            footer: POSIX TZ string in effect after the last transition.
+        """
+        if len(offsets) != len(transitions) + 1:
+            raise ValueError('Expected one more offset than transitions')
+        self.key = key
+        self._transitions = array('q', transitions)
+        self._offsets = array('l', offsets)
+        self._abbreviations = list(abbreviations)
+        # Local wall times of each transition. With fold=0 an ambiguous or
+        # missing local time resolves to the offset before the transition,
+        # with fold=1 to the offset after it (PEP 495).
+        self._wall = (
+            array('q', [time + max(offsets[index], offsets[index + 1])
+                        for index, time in enumerate(transitions)]),
+            array('q', [time + min(offsets[index], offsets[index + 1])
+                        for index, time in enumerate(transitions)]))
+        self._rule = rule = None if not footer else _TZRule(footer)
+        # Lookups at or past _limit seconds extend the arrays first.
+        self._limit = 1 << 63
+        if rule is not None and rule.start is not None:
+            if transitions:
+                self._year = days_to_year(
+                    transitions[-1] // 86_400 + UNIX_EPOCH_DAYS) - 1
+            else:
+                self._year = 1969
+            self._extend(self._year + 1)
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return f'{cls}({self.key!r})'
+
+    def __len__(self) -> int:
+        "Return the number of transitions generated so far."
+        return len(self._transitions)
+
+    def _append(self, time: int, offset: int, name: str) -> None:
+        transitions = self._transitions
+        offsets = self._offsets
+        if transitions and time < transitions[-1]:
+            return
+        if transitions and time == transitions[-1]:
+            # Rules such as 'EST5EDT,0/0,J365/25' end one year's daylight
+            # saving time at the instant the next year's starts.
+            transitions.pop()
+            offsets.pop()
+            self._abbreviations.pop()
+            self._wall[0].pop()
+            self._wall[1].pop()
+        if offset == offsets[-1] and name == self._abbreviations[-1]:
+            return
+        transitions.append(time)
+        self._wall[0].append(time + max(offsets[-1], offset))
+        self._wall[1].append(time + min(offsets[-1], offset))
+        offsets.append(offset)
+        self._abbreviations.append(name)
+
+    def _extend(self, year: int) -> None:
+        "Append the rule transitions up to and including year."
+        if year > _RULE_LAST_YEAR:
+            raise ValueError('TZ rules are only evaluated up to year '
+                             f'{_RULE_LAST_YEAR}', f'{year!r}')
+        while self._year < year:
+            self._year += 1
+            for time, offset, name in self._rule.transitions(self._year):
+                self._append(time, offset, name)
+        self._limit = ((year_start(self._year + 1) - UNIX_EPOCH_DAYS)
+                       * 86_400 - _RULE_MARGIN)
+
+    def _reach(self, seconds: int) -> None:
+        "Make sure the arrays hold every transition up to seconds."
+        self._extend(days_to_year((seconds + _RULE_MARGIN) // 86_400
+                                  + UNIX_EPOCH_DAYS))
+
+    # Scalar lookups
+    def utcoffset(self, seconds: int) -> int:
+        "Return the UTC offset in seconds at a POSIX timestamp."
+        if seconds >= self._limit:
+            self._reach(seconds)
+        return self._offsets[bisect_right(self._transitions, seconds)]
+
+    def abbreviation(self, seconds: int) -> str:
+        "Return the abbreviation, such as CET, in use at a POSIX timestamp."
+        if seconds >= self._limit:
+            self._reach(seconds)
+        return self._abbreviations[bisect_right(self._transitions, seconds)]
+
+    def local_offset(self, seconds: int, fold: int = 0) -> int:
+        "Return the UTC offset in seconds for a local wall time."
+        if seconds >= self._limit:
+            self._reach(seconds)
+        return self._offsets[bisect_right(self._wall[fold], seconds)]
+
+    def to_local(self, value: DateTime) -> DateTime:
+        """Convert a UTC DateTime to local wall time.
+        fold is set on the second occurrence of a repeated wall time.
+        """
+        utc = value.as_microseconds()
+        seconds = utc // MICROSECONDS_PER_SECOND
+        if seconds >= self._limit:
+            self._reach(seconds)
+        index = bisect_right(self._transitions, seconds)
+        offset = self._offsets[index]
+        local = seconds + offset
+        fold = int(index > 0 and offset < self._offsets[index - 1]
+                   and local < self._wall[0][index - 1])
+        return DateTime._from_microseconds(
+            utc + offset * MICROSECONDS_PER_SECOND, fold)
+
+    def to_utc(self, value: DateTime) -> DateTime:
+        "Convert a local DateTime to UTC, using its fold for ambiguities."
+        local = value.as_microseconds()
+        offset = self.local_offset(local // MICROSECONDS_PER_SECOND,
+                                   value.fold)
+        return DateTime._from_microseconds(
+            local - offset * MICROSECONDS_PER_SECOND)
+
+    # Bulk conversions
+    def _convert_many(self, values, boundaries, sign: int) -> array:
+        """Shift each value by the offset of the interval it falls in.
+        The interval of the previous value is tried first, so sorted or
+        clustered columns rarely need a binary search. Intervals are capped
+        at _limit, where the rule transitions generated so far end.
+        """
+        offsets = self._offsets
+        count = len(boundaries)
+        limit = self._limit
+        scale = MICROSECONDS_PER_SECOND
+        result = array('q')
+        add = result.append
+        low = high = shift = 0
+        for value in values:
+            seconds = value // scale
+            if not low <= seconds < high:
+                if seconds >= limit:
+                    self._reach(seconds)
+                    count = len(boundaries)
+                    limit = self._limit
+                index = bisect_right(boundaries, seconds)
+                low = boundaries[index - 1] if index else -(1 << 63)
+                high = min(boundaries[index] if index < count else 1 << 63,
+                           limit)
+                shift = offsets[index] * scale * sign
+            add(value + shift)
+        return result
+
+    def utc_to_local_many(self, values) -> array:
+        "Convert a column of UTC epoch microseconds to local wall time."
+        return self._convert_many(values, self._transitions, 1)
+
+    def local_to_utc_many(self, values, fold: int = 0) -> array:
+        "Convert a column of local epoch microseconds to UTC."
+        return self._convert_many(values, self._wall[fold], -1)
+
+    def local_days_many(self, values) -> array:
+        """Return the local calendar day of each UTC epoch microsecond value,
+        as day counts on the temporal.algorithms epoch.
+        """
+        return array('i', [local // MICROSECONDS_PER_DAY + UNIX_EPOCH_DAYS
+                           for local in self.utc_to_local_many(values)])
+
+
+def parse_tzif(data, key: str = None) -> Zone:
+    """Parses the contents of a TZif file (RFC 8536) into a Zone.
+
+    Version 2 and later files are read from their 64-bit data block and
+    their footer, the POSIX TZ string used after the last transition. Leap
+    second records are skipped.
+
+    Args:
+        data: The bytes of the TZif file.
+        key: Name given to the zone.
+
+    Returns:
+        The parsed Zone.
+
+    Raises:
+        ValueError: data is not a valid TZif file or its footer is not a
+            supported TZ string.
+    """
+
+    data = bytes(data)
+    if len(data) < _HEADER.size:
+        raise ValueError('data is too short for a TZif header')
+    magic, version, *counts = _HEADER.unpack_from(data)
+    if magic != b'TZif':
+        raise ValueError('not a TZif file', f'{magic!r}')
+    pos = _HEADER.size
+    time_size = 4
+    if version >= b'2':
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+        pos += (timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8
+                + isstdcnt + isutcnt)
+        magic, version, *counts = _HEADER.unpack_from(data, pos)
+        if magic != b'TZif':
+            raise ValueError('missing TZif version 2 header')
+        pos += _HEADER.size
+        time_size = 8
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+    if typecnt < 1:
+        raise ValueError('TZif file defines no local time types')
+    try:
+        transitions = struct.unpack_from(
+            f'>{timecnt}{"q" if time_size == 8 else "l"}', data, pos)
+        pos += timecnt * time_size
+        indices = data[pos:pos + timecnt]
+        pos += timecnt
+        types = [struct.unpack_from('>lBB', data, pos + index * 6)
+                 for index in range(typecnt)]
+        pos += typecnt * 6
+        names = data[pos:pos + charcnt]
+        pos += charcnt
+    except struct.error as error:
+        raise ValueError('truncated TZif file') from error
+    footer = None
+    if time_size == 8:
+        pos += leapcnt * 12 + isstdcnt + isutcnt
+        if data[pos:pos + 1] != b'\n':
+            raise ValueError('missing TZif footer')
+        end = data.find(b'\n', pos + 1)
+        if end < 0:
+            raise ValueError('unterminated TZif footer')
+        footer = data[pos + 1:end].decode('ascii')
+
+    def abbreviation(index):
+        end = names.find(b'\0', index)
+        return names[index:end if end >= 0 else None].decode('ascii')
+
+    if any(index >= typecnt for index in indices):
+        raise ValueError('TZif transition refers to an unknown type')
+    offsets = [types[0][0]] + [types[index][0] for index in indices]
+    abbreviations = ([abbreviation(types[0][2])]
+                     + [abbreviation(types[index][2]) for index in indices])
+    return Zone(key, transitions, offsets, abbreviations, footer)
+
+
+def make_tzif(initial, transitions=(), footer: str = '') -> bytes:
+    """Builds a version 2 TZif file, mainly as an in-memory test fixture.
+
+    Args:
+        initial: (offset, is_dst, abbreviation) in effect before the first
+            transition, offset in seconds east of UTC.
+        transitions: Sorted (utc_seconds, offset, is_dst, abbreviation)
+            tuples.
+        footer: POSIX TZ string for the instants after the last transition,
+            such as 'CET-1CEST,M3.5.0,M10.5.0/3'.
+
+    Returns:
+        The TZif file contents.
+    """
+
+    types = [tuple(initial)]
+    indices = []
+    for _, *kind in transitions:
+        kind = tuple(kind)
+        if kind not in types:
+            types.append(kind)
+        indices.append(types.index(kind))
+    names = b''
+    positions = {}
+    for _, _, name in types:
+        if name not in positions:
+            positions[name] = len(names)
+            names += name.encode('ascii') + b'\0'
+    v1 = _HEADER.pack(b'TZif', b'2', 0, 0, 0, 0, 1, len(names))
+    v1 += struct.pack('>lBB', types[0][0], types[0][1],
+                      positions[types[0][2]]) + names
+    v2 = _HEADER.pack(b'TZif', b'2', 0, 0, 0, len(indices), len(types),
+                      len(names))
+    v2 += struct.pack(f'>{len(indices)}q', *(time for time, *_ in transitions))
+    v2 += bytes(indices)
+    for offset, is_dst, name in types:
+        v2 += struct.pack('>lBB', offset, is_dst, positions[name])
+    return v1 + v2 + names + b'\n' + footer.encode('ascii') + b'\n'
+
+
+class ZoneLoader:
+    """Loads zones by key and keeps them in an LRU cache.
+
+    Args:
+        sources: Directories to search for TZif files and mappings of key
+            to TZif bytes, tried in order. Defaults to TZPATH.
+        maxsize: Maximum number of zones kept in the cache.
+    """
+    __slots__ = ('sources', 'maxsize', '_zones', 'hits', 'misses')
+
+    def __init__(self, sources=None, maxsize: int = ZONE_CACHE_SIZE) -> None:
+        if sources is None:
+            sources = TZPATH
+        elif isinstance(sources, (str, os.PathLike, dict)):
+            sources = (sources,)
+        self.sources = tuple(sources)
+        self.maxsize = maxsize
+        self._zones = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        cls = type(self).__name__
+        return f'{cls}({self.sources!r}, maxsize={self.maxsize!r})'
+
+    def _read(self, key: str) -> bytes:
+        parts = key.split('/')
+        if os.path.isabs(key) or '' in parts or '..' in parts:
+            raise ValueError('invalid zone key', f'{key!r}')
+        for source in self.sources:
+            if isinstance(source, dict):
+                if key in source:
+                    return source[key]
+                continue
+            path = os.path.join(source, *parts)
+            if os.path.isfile(path):
+                with open(path, 'rb') as file:
+                    return file.read()
+        raise KeyError(f'No time zone found with key {key!r}')
+
+    def get(self, key: str) -> Zone:
+        "Return the zone for key, reading and parsing it on first use."
+        zones = self._zones
+        zone = zones.get(key)
+        if zone is not None:
+            self.hits += 1
+            zones.move_to_end(key)
+            return zone
+        self.misses += 1
+        zone = parse_tzif(self._read(key), key)
+        zones[key] = zone
+        if len(zones) > self.maxsize:
+            zones.popitem(last=False)
+        return zone
+
+    def clear(self) -> None:
+        "Drop all cached zones and reset the counters."
+        self._zones.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._zones), 'maxsize': self.maxsize}
@@ -0,0 +1,58 @@
+from concurrent.futures import ProcessPoolExecutor
+import unittest
+from unittest import mock
+from temporal import aio
+from temporal.parsers import detect_iso_variant, parse_iso_dates
+
+
+async def _source(data: bytes, size: int = 1_000):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _collect(source, **kwargs):
+    days, errors = [], []
+    async for batch_days, batch_errors in aio.aparse_dates(source, **kwargs):
+        days.extend(batch_days)
+        errors.extend(batch_errors)
+    return days, errors
+
+
+class AparseDatesTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        # No layout matches most of the sampled rows
+        self.rows = (['x'] * 70 + ['2024-03-05', '20240305', '2024-W10-2',
+                                   '2024065'] * 800)
+        self.data = '\n'.join(self.rows).encode('ascii') + b'\n'
+        days, errors = parse_iso_dates(self.rows, -1)
+        self.expected = list(days), errors
+
+    async def test_undetected_layout_is_sniffed_once(self):
+        self.assertIsNone(
+            detect_iso_variant(self.rows[:aio.SNIFF_SAMPLE_SIZE]))
+        with mock.patch.object(aio, 'detect_iso_variant',
+                               wraps=detect_iso_variant) as detect, \
+                mock.patch.object(aio, 'parse_iso_column') as column:
+            result = await _collect(_source(self.data), batch_rows=1_500,
+                                    fill=-1)
+        self.assertEqual(result, self.expected)
+        self.assertEqual(detect.call_count, 1)
+        column.assert_not_called()
+
+    async def test_detected_layout(self):
+        rows = ['2024-03-05'] * 2_500 + ['20240305', 'x']
+        data = '\n'.join(rows).encode('ascii')
+        days, errors = parse_iso_dates(rows, -1)
+        self.assertEqual(await _collect(_source(data), batch_rows=1_000,
+                                        fill=-1), (list(days), errors))
+
+    async def test_executor(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = await _collect(_source(self.data), batch_rows=1_500,
+                                    fill=-1, executor=executor)
+        self.assertEqual(result, self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import calendar
+import datetime
+import random
+import unittest
+from temporal import Date, algorithms
+from temporal.algorithms import (build_year_table, clear_year_table,
+                                 date_to_days, day_of_week_from_date,
+                                 days_to_date, days_to_iso_week, is_leap,
+                                 iso_week_start, iso_week_to_date,
+                                 iso_week_to_days, week_no_from_date,
+                                 year_start)
+
+# Day count of 0001-01-01, ordinal 1 in datetime
+_ORDINAL_OFFSET = 305
+
+
+def _days(date: datetime.date) -> int:
+    return date.toordinal() + _ORDINAL_OFFSET
+
+
+class IsoWeekTest(unittest.TestCase):
+
+    def test_days_to_iso_week_every_day(self):
+        first = datetime.date(1890, 1, 1).toordinal()
+        last = datetime.date(2110, 12, 31).toordinal()
+        for ordinal in range(first, last + 1):
+            date = datetime.date.fromordinal(ordinal)
+            self.assertEqual(days_to_iso_week(_days(date)),
+                             tuple(date.isocalendar()), date)
+
+    def test_days_to_iso_week_random(self):
+        rng = random.Random(8)
+        for _ in range(20_000):
+            date = datetime.date.fromordinal(rng.randint(1, 3_652_059))
+            self.assertEqual(days_to_iso_week(_days(date)),
+                             tuple(date.isocalendar()), date)
+
+    def test_iso_week_to_days_round_trip(self):
+        for year in range(1, 10_000, 7):
+            for week in (1, 2, 26, 52, 53):
+                for weekday in (1, 4, 7):
+                    try:
+                        expected = datetime.date.fromisocalendar(
+                            year, week, weekday)
+                    except ValueError:
+                        with self.assertRaises(ValueError):
+                            iso_week_to_days(year, week, weekday)
+                        continue
+                    days = iso_week_to_days(year, week, weekday)
+                    self.assertEqual(days, _days(expected))
+                    self.assertEqual(days_to_iso_week(days),
+                                     (year, week, weekday))
+
+    def test_iso_week_to_days_rejects_out_of_range(self):
+        for args in ((2024, 0, 1), (2024, 53, 1), (2020, 54, 1),
+                     (2024, 1, 0), (2024, 1, 8)):
+            with self.assertRaises(ValueError):
+                iso_week_to_days(*args)
+        self.assertEqual(iso_week_to_days(2020, 53, 7),
+                         _days(datetime.date(2021, 1, 3)))
+
+    def test_iso_week_start_is_monday_of_week_one(self):
+        for year in range(1900, 2101):
+            monday = datetime.date.fromisocalendar(year, 1, 1)
+            self.assertEqual(iso_week_start(year), _days(monday))
+
+    def test_wrappers(self):
+        for date in (datetime.date(2023, 1, 1), datetime.date(2020, 12, 31),
+                     datetime.date(2021, 1, 3), datetime.date(2024, 12, 30)):
+            self.assertEqual(week_no_from_date(*date.timetuple()[:3]),
+                             tuple(date.isocalendar()))
+            self.assertEqual(iso_week_to_date(*date.isocalendar()),
+                             (date.year, date.month, date.day))
+
+    def test_date_methods(self):
+        rng = random.Random(88)
+        for _ in range(5_000):
+            date = datetime.date.fromordinal(rng.randint(400, 3_600_000))
+            value = Date(date.year, date.month, date.day)
+            self.assertEqual(value.as_iso_calendar(),
+                             tuple(date.isocalendar()))
+            self.assertEqual(value.week(), date.isocalendar()[1])
+            self.assertEqual(Date.from_iso_calendar(*date.isocalendar()),
+                             value)
+
+    def test_days_to_date_round_trip(self):
+        rng = random.Random(80)
+        for _ in range(20_000):
+            date = datetime.date.fromordinal(rng.randint(1, 3_652_059))
+            days = date_to_days(date.year, date.month, date.day)
+            self.assertEqual(days, _days(date))
+            self.assertEqual(days_to_date(days),
+                             (date.year, date.month, date.day))
+
+
+class YearTableTest(unittest.TestCase):
+
+    def tearDown(self):
+        build_year_table()
+
+    def lookups(self, years):
+        return [(year_start(year), is_leap(year),
+                 day_of_week_from_date(year, month, 28))
+                for year in years for month in (1, 2, 3, 12)]
+
+    def expected(self, years):
+        return [(_days(datetime.date(year, 1, 1)), calendar.isleap(year),
+                 (datetime.date(year, month, 28).weekday() + 1) % 7)
+                for year in years for month in (1, 2, 3, 12)]
+
+    def test_table_matches_arithmetic(self):
+        years = range(1800, 2301)
+        clear_year_table()
+        self.assertIsNone(algorithms._year_table)
+        arithmetic = self.lookups(years)
+        self.assertEqual(arithmetic, self.expected(years))
+        for first, last in ((1900, 2200), (1999, 2001), (2000, 2000),
+                            (1, 9999)):
+            table = build_year_table(first, last)
+            self.assertIs(algorithms._year_table, table)
+            self.assertEqual((table.first, table.last), (first, last))
+            self.assertEqual(len(table.starts), last - first + 1)
+            self.assertEqual(self.lookups(years), arithmetic)
+            # The bounds themselves and the years just outside them
+            edges = [year for year in (first - 1, first, last, last + 1)
+                     if 1 <= year <= 9999]
+            self.assertEqual(self.lookups(edges), self.expected(edges))
+        clear_year_table()
+        self.assertIsNone(algorithms._year_table)
+        self.assertEqual(self.lookups(years), arithmetic)
+
+    def test_rejects_reversed_bounds(self):
+        with self.assertRaises(ValueError):
+            build_year_table(2000, 1999)
+
+
+if __name__ == '__main__':
+    unittest.main()
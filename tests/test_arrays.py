@@ -0,0 +1,30 @@
+import unittest
+from temporal import Date, DateArray
+
+
+class DateArrayTest(unittest.TestCase):
+
+    def test_copy_constructor(self):
+        dates = [Date(2024, 2, 29), Date(1900, 3, 1), Date(2000, 12, 31)]
+        column = DateArray.from_dates(dates)
+        copy = DateArray(column)
+        self.assertEqual(copy, column)
+        self.assertEqual(list(copy), dates)
+        self.assertIsNot(copy.days, column.days)
+        copy.days[0] += 1
+        self.assertEqual(column[0], Date(2024, 2, 29))
+        self.assertEqual(DateArray(DateArray()), DateArray())
+
+    def test_columns(self):
+        column = DateArray.from_fields([2024, 1900], [2, 3], [29, 1])
+        self.assertEqual(list(column), [Date(2024, 2, 29), Date(1900, 3, 1)])
+        self.assertEqual(column.fields(), (column.year, column.month,
+                                           column.day))
+        self.assertEqual(list(column.year), [2024, 1900])
+        self.assertEqual(column[1:], DateArray.from_dates([Date(1900, 3, 1)]))
+        with self.assertRaises(TypeError):
+            column[0] = Date(2024, 1, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
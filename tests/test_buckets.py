@@ -0,0 +1,123 @@
+import datetime
+import random
+import unittest
+from temporal import Date, DateArray
+from temporal.buckets import (UNITS, BucketAccumulator, bucket_bounds,
+                              bucket_days, count_by, epoch_to_days, resample)
+from temporal.constants import MICROSECONDS_PER_DAY
+
+
+def _naive_start(date: datetime.date, unit: str) -> datetime.date:
+    "The first day of the bucket of date, from datetime arithmetic."
+    if unit == 'day':
+        return date
+    if unit == 'week':
+        return date - datetime.timedelta(days=date.weekday())
+    if unit == 'month':
+        return date.replace(day=1)
+    if unit == 'quarter':
+        return date.replace(month=date.month - (date.month - 1) % 3, day=1)
+    return date.replace(month=1, day=1)
+
+
+def _naive_stop(date: datetime.date, unit: str) -> datetime.date:
+    "The first day of the bucket after the bucket of date."
+    start = _naive_start(date, unit)
+    if unit in ('day', 'week'):
+        return start + datetime.timedelta(days=1 if unit == 'day' else 7)
+    months = {'month': 1, 'quarter': 3, 'year': 12}[unit]
+    year, month = divmod(start.month - 1 + months, 12)
+    return datetime.date(start.year + year, month + 1, 1)
+
+
+def _days(date: datetime.date) -> int:
+    return Date(date.year, date.month, date.day)._days
+
+
+def _date(days: int) -> datetime.date:
+    date = Date._from_days(days)
+    return datetime.date(date.year, date.month, date.day)
+
+
+class BucketTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(23)
+        first = datetime.date(1899, 1, 1).toordinal()
+        self.dates = sorted(
+            datetime.date.fromordinal(rng.randint(first, first + 80_000))
+            for _ in range(3_000))
+        self.days = [_days(date) for date in self.dates]
+        self.values = [rng.randint(-50, 50) for _ in self.dates]
+
+    def test_bucket_bounds(self):
+        first = datetime.date(1999, 11, 1)
+        for offset in range(800):
+            date = first + datetime.timedelta(offset)
+            for unit in UNITS:
+                self.assertEqual(bucket_bounds(_days(date), unit),
+                                 (_days(_naive_start(date, unit)),
+                                  _days(_naive_stop(date, unit))),
+                                 (date, unit))
+
+    def test_bucket_days_and_count_by(self):
+        shuffled = self.days[:]
+        random.Random(230).shuffle(shuffled)
+        for unit in UNITS:
+            expected = [_days(_naive_start(_date(n), unit))
+                        for n in shuffled]
+            self.assertEqual(list(bucket_days(shuffled, unit)), expected)
+            self.assertEqual(list(bucket_days(DateArray(shuffled), unit)),
+                             expected)
+            counts = {}
+            for start in expected:
+                counts[start] = counts.get(start, 0) + 1
+            self.assertEqual(count_by(shuffled, unit), counts)
+            self.assertEqual(list(count_by(shuffled, unit)), list(counts))
+
+    def test_resample_matches_grouping(self):
+        for unit in UNITS:
+            groups = {}
+            for date, value in zip(self.dates, self.values):
+                groups.setdefault(_naive_start(date, unit), []).append(value)
+            expected = [(Date(start.year, start.month, start.day),
+                         len(values), sum(values), min(values), max(values))
+                        for start, values in groups.items()]
+            self.assertEqual(list(resample(self.days, unit, self.values)),
+                             expected)
+            self.assertEqual(
+                list(resample(DateArray(self.days), unit)),
+                [(start, count, count, 1, 1)
+                 for start, count, *_ in expected])
+
+    def test_accumulator(self):
+        accumulator = BucketAccumulator('month')
+        self.assertIsNone(accumulator.flush())
+        self.assertIsNone(accumulator.add(Date(2024, 1, 5)._days, 3))
+        self.assertIsNone(accumulator.add(Date(2024, 1, 31)._days, 7))
+        self.assertEqual(accumulator.add(Date(2024, 2, 1)._days, -1),
+                         (Date(2024, 1, 1), 2, 10, 3, 7))
+        with self.assertRaises(ValueError):
+            accumulator.add(Date(2024, 1, 31)._days)
+        self.assertEqual(accumulator.flush(), (Date(2024, 2, 1), 1, -1, -1,
+                                               -1))
+        self.assertIsNone(accumulator.flush())
+        with self.assertRaises(ValueError):
+            list(resample([5, 4], 'day'))
+        with self.assertRaises(ValueError):
+            BucketAccumulator('hour')
+        with self.assertRaises(ValueError):
+            bucket_bounds(0, 'hour')
+
+    def test_epoch_to_days(self):
+        seconds = [-86_401, -1, 0, 86_399, 86_400, 1_700_000_000]
+        expected = [_days(datetime.datetime.fromtimestamp(
+            value, datetime.timezone.utc).date()) for value in seconds]
+        self.assertEqual(list(epoch_to_days(seconds)), expected)
+        self.assertEqual(
+            list(epoch_to_days([value * 1_000_000 for value in seconds],
+                               MICROSECONDS_PER_DAY)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import random
+import unittest
+from temporal import Date, DateArray
+from temporal.business import BusinessCalendar
+
+WEEKENDS = ((5, 6), (4, 5), (6,), (0, 1, 2, 3, 4, 5), ())
+
+
+def _is_business_day(days, weekend, holidays):
+    return (days + 2) % 7 not in weekend and days not in holidays
+
+
+def _add(days, count, weekend, holidays):
+    "Step one day at a time, the reference for add_business_days."
+    step = 1 if count > 0 else -1
+    if count == 0:
+        while not _is_business_day(days, weekend, holidays):
+            days += 1
+        return days
+    while count:
+        days += step
+        if _is_business_day(days, weekend, holidays):
+            count -= step
+    return days
+
+
+class BusinessCalendarTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(14)
+        self.base = Date(2021, 9, 1)._days
+        self.calendars = []
+        for weekend in WEEKENDS:
+            for _ in range(6):
+                holidays = {self.base + rng.randint(-200, 200)
+                            for _ in range(rng.randint(0, 80))}
+                calendar = BusinessCalendar(map(Date._from_days, holidays),
+                                            weekend)
+                self.calendars.append((calendar, weekend, holidays))
+        self.rng = rng
+
+    def test_from_rank_inverts_rank(self):
+        for calendar, weekend, holidays in self.calendars:
+            business = [n for n in range(self.base - 400, self.base + 400)
+                        if _is_business_day(n, weekend, holidays)]
+            first = calendar._rank(business[0])
+            for i, days in enumerate(business):
+                self.assertEqual(calendar._rank(days), first + i)
+                self.assertEqual(calendar._from_rank(first + i), days)
+
+    def test_queries_match_day_by_day(self):
+        rng = self.rng
+        for calendar, weekend, holidays in self.calendars:
+            for _ in range(200):
+                a = self.base + rng.randint(-300, 300)
+                b = self.base + rng.randint(-300, 300)
+                count = rng.randint(-15, 15)
+                start, stop = Date._from_days(a), Date._from_days(b)
+                expected = (
+                    sum(_is_business_day(n, weekend, holidays)
+                        for n in range(a, b))
+                    - sum(_is_business_day(n, weekend, holidays)
+                          for n in range(b, a)))
+                self.assertEqual(calendar.count_business_days(start, stop),
+                                 expected)
+                self.assertEqual(calendar.is_business_day(start),
+                                 _is_business_day(a, weekend, holidays))
+                self.assertEqual(
+                    calendar.add_business_days(start, count)._days,
+                    _add(a, count, weekend, holidays), (weekend, a, count))
+
+    def test_many(self):
+        calendar = BusinessCalendar([Date(2024, 12, 25)])
+        dates = DateArray.from_dates([Date(2024, 12, 24)] * 2)
+        self.assertEqual(calendar.add_business_days_many(dates, [1, -1]),
+                         DateArray.from_dates([Date(2024, 12, 26),
+                                               Date(2024, 12, 23)]))
+        self.assertEqual(list(calendar.count_business_days_many(
+            [Date(2024, 12, 1)], [Date(2025, 1, 1)])), [21])
+        self.assertEqual(list(calendar.is_business_day_many(
+            [Date(2024, 12, 24), Date(2024, 12, 25), Date(2024, 12, 28)])),
+            [1, 0, 0])
+
+    def test_rejects_invalid_weekend(self):
+        with self.assertRaises(ValueError):
+            BusinessCalendar(weekend=range(7))
+        with self.assertRaises(ValueError):
+            BusinessCalendar(weekend=(7,))
+
+
+if __name__ == '__main__':
+    unittest.main()
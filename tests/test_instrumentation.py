@@ -0,0 +1,28 @@
+import unittest
+import temporal
+from temporal import instrumentation, parsers
+from temporal.parsers import parse_iso_dates
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_counts_calls_through_the_module(self):
+        with instrumentation.instrumented() as stats:
+            parsers.parse_iso_dates(['2024-01-01'])
+            temporal.Date.from_ordinal(1)
+        calls = stats['calls']
+        self.assertEqual(calls['parsers.parse_iso_dates']['calls'], 1)
+        self.assertEqual(calls['Date.from_ordinal']['calls'], 1)
+        self.assertIs(parsers.parse_iso_dates, parse_iso_dates)
+
+    def test_names_bound_before_enable_are_not_counted(self):
+        with instrumentation.instrumented() as stats:
+            parse_iso_dates(['2024-01-01'])
+        self.assertNotIn('parsers.parse_iso_dates', stats['calls'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+from temporal import Date, DateArray
+from temporal.intervals import IntervalSet
+
+BASE = Date(2021, 9, 1)._days
+
+
+def _random_pairs(rng):
+    "Overlapping, touching and empty (start, stop) day count pairs."
+    pairs = []
+    for _ in range(rng.randint(0, 12)):
+        start = BASE + rng.randint(0, 200)
+        pairs.append((start, start + rng.randint(-3, 30)))
+    return pairs
+
+
+def _interval_set(pairs):
+    if not pairs:
+        return IntervalSet()
+    return IntervalSet.from_days(*zip(*pairs))
+
+
+def _day_set(pairs):
+    return {n for start, stop in pairs for n in range(start, stop)}
+
+
+class IntervalSetTest(unittest.TestCase):
+
+    def assertNormalized(self, intervals):
+        starts, stops = intervals.starts, intervals.stops
+        self.assertTrue(all(a < b for a, b in zip(starts, stops)))
+        self.assertTrue(all(b < a for b, a in zip(stops, starts[1:])))
+
+    def test_operations_match_sets(self):
+        rng = random.Random(22)
+        for _ in range(2_000):
+            p, q = _random_pairs(rng), _random_pairs(rng)
+            a, b = _interval_set(p), _interval_set(q)
+            days_a, days_b = _day_set(p), _day_set(q)
+            for result, expected in ((a, days_a),
+                                     (a | b, days_a | days_b),
+                                     (a & b, days_a & days_b),
+                                     (a - b, days_a - days_b),
+                                     (b - a, days_b - days_a)):
+                self.assertNormalized(result)
+                self.assertEqual(_day_set(zip(result.starts, result.stops)),
+                                 expected)
+                self.assertEqual(result.total_days(), len(expected))
+            self.assertEqual(a.union(b), b | a)
+            self.assertEqual(a.intersection(b), b & a)
+            self.assertEqual(a.difference(b), a - b)
+
+    def test_lookups_match_sets(self):
+        rng = random.Random(220)
+        for _ in range(500):
+            pairs = _random_pairs(rng)
+            intervals = _interval_set(pairs)
+            days = _day_set(pairs)
+            column = [BASE + rng.randint(-10, 240) for _ in range(50)]
+            if rng.random() < 0.5:
+                column.sort()
+            self.assertEqual(list(intervals.contains_many(DateArray(column))),
+                             [int(n in days) for n in column])
+            for n in column[:10]:
+                date = Date._from_days(n)
+                self.assertEqual(date in intervals, n in days)
+                found = intervals.find(date)
+                self.assertEqual(found is not None, n in days)
+                if found is not None:
+                    self.assertTrue(found[0] <= date < found[1])
+
+    def test_merges_on_construction(self):
+        intervals = IntervalSet([(Date(2024, 1, 1), Date(2024, 2, 1)),
+                                 (Date(2024, 1, 15), Date(2024, 3, 1)),
+                                 (Date(2024, 3, 1), Date(2024, 3, 5))])
+        self.assertEqual(list(intervals),
+                         [(Date(2024, 1, 1), Date(2024, 3, 5))])
+        hole = IntervalSet([(Date(2024, 2, 10), Date(2024, 2, 12))])
+        self.assertEqual(list(intervals - hole),
+                         [(Date(2024, 1, 1), Date(2024, 2, 10)),
+                          (Date(2024, 2, 12), Date(2024, 3, 5))])
+        self.assertEqual(hash(intervals), hash(IntervalSet(list(intervals))))
+
+    def test_columns_are_copies(self):
+        intervals = IntervalSet([(Date(2024, 1, 1), Date(2024, 2, 1))])
+        before = hash(intervals)
+        starts, stops = intervals.starts, intervals.stops
+        starts[0] += 40
+        stops.append(0)
+        self.assertEqual(list(intervals),
+                         [(Date(2024, 1, 1), Date(2024, 2, 1))])
+        self.assertEqual(hash(intervals), before)
+        self.assertIn(Date(2024, 1, 1), intervals)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import random
+import tempfile
+import unittest
+from temporal import Date
+from temporal.parallel import (format_days, parse_buffer, parse_file,
+                               split_lines)
+from temporal.parsers import format_many, parse_iso_dates
+
+
+class ParallelTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(19)
+        base = Date(2000, 1, 1)._days
+        self.days = [base + rng.randint(0, 20_000) for _ in range(1_001)]
+        lines = [str(Date._from_days(n)) for n in self.days]
+        for index in (0, 7, 500, 1_000):
+            lines[index] = 'bad row'
+        self.lines = lines
+        self.data = '\n'.join(lines).encode('ascii')
+
+    def test_split_lines(self):
+        for chunk_size in (1, 7, 11, 100, 1 << 20):
+            bounds = split_lines(self.data, chunk_size)
+            self.assertEqual(bounds[0][0], 0)
+            self.assertEqual(bounds[-1][1], len(self.data))
+            for (_, stop), (start, _) in zip(bounds, bounds[1:]):
+                self.assertEqual(stop, start)
+                self.assertEqual(self.data[stop - 1:stop], b'\n')
+
+    def test_parse_matches_serial(self):
+        expected = parse_iso_dates(self.lines, fill=-1)
+        for workers, chunk_size in ((1, 97), (2, 97), (3, 1_000)):
+            self.assertEqual(
+                parse_buffer(self.data, workers, chunk_size, fill=-1),
+                expected)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dates.txt')
+            with open(path, 'wb') as file:
+                file.write(self.data + b'\n')
+            self.assertEqual(parse_file(path, 2, 333, fill=-1), expected)
+            open(path, 'wb').close()
+            self.assertEqual(parse_file(path, 2), parse_iso_dates([]))
+
+    def test_format_matches_serial(self):
+        dates = [Date._from_days(n) for n in self.days]
+        expected = ''.join(line + '\n'
+                           for line in format_many(dates, '%d/%m/%Y'))
+        for workers, chunk_rows in ((1, 100), (2, 100), (2, 1_001)):
+            self.assertEqual(
+                format_days(self.days, '%d/%m/%Y', workers, chunk_rows),
+                expected.encode('utf-8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from temporal import TimeDelta
+from temporal.algorithms import date_to_days
+from temporal.parsers import (ISO_DATE_VARIANTS, _cached_duration_seconds,
+                              detect_iso_variant, iso_duration_seconds,
+                              parse_iso_column, parse_iso_dates,
+                              parse_iso_duration, parse_iso_durations,
+                              parse_iso_times)
+
+
+class RowErrorTest(unittest.TestCase):
+
+    def test_parse_iso_dates(self):
+        data = ['2024-01-31', 'x', '2024-02-30', '٢٠٢٤-01-01']
+        days, errors = parse_iso_dates(data, fill=-1)
+        self.assertEqual(list(days), [date_to_days(2024, 1, 31), -1, -1, -1])
+        self.assertEqual(errors, [(1, "Not an ISO-8601 date: 'x'"),
+                                  (2, 'day must be between 1 and 29'),
+                                  (3, "Not an ISO-8601 date: '٢٠٢٤-01-01'")])
+        self.assertEqual(parse_iso_dates(b'2024-01-31\r\nx\r\n')[1],
+                         [(1, "Not an ISO-8601 date: 'x'")])
+
+    def test_parse_iso_column(self):
+        days, errors = parse_iso_column(['2024-01-31', '2024-02-01', 'x'])
+        self.assertEqual(errors, [(2, "Not an ISO-8601 date: 'x'")])
+
+    def test_parse_iso_times(self):
+        _, errors = parse_iso_times(['12:00', '25:00', 'noon'])
+        self.assertEqual([index for index, _ in errors], [1, 2])
+        self.assertEqual(errors[1], (2, "Not an ISO-8601 time: 'noon'"))
+
+    def test_parse_iso_durations(self):
+        _, errors = parse_iso_durations(['PT1H', 'P'])
+        self.assertEqual(errors,
+                         [(1, 'At least one unit needs to be provided')])
+
+
+# 2024-03-05 in every layout of ISO_DATE_VARIANTS
+LAYOUTS = {'YYYY-MM-DD': '2024-03-05', 'YYYYMMDD': '20240305',
+           'YYYY-Www-D': '2024-W10-2', 'YYYYWwwD': '2024W102',
+           'YYYY-DDD': '2024-065', 'YYYYDDD': '2024065'}
+
+
+class VariantTest(unittest.TestCase):
+
+    def test_detect_iso_variant(self):
+        self.assertEqual(set(LAYOUTS), set(ISO_DATE_VARIANTS))
+        for variant, text in LAYOUTS.items():
+            self.assertEqual(detect_iso_variant([text, 'x']), variant)
+        self.assertEqual(
+            detect_iso_variant(['20240305', '2024-03-05', '20240306']),
+            'YYYYMMDD')
+        self.assertIsNone(detect_iso_variant(['x', '', '2024/03/05']))
+        self.assertIsNone(detect_iso_variant([]))
+
+    def test_mixed_variants_fall_back(self):
+        expected = date_to_days(2024, 3, 5)
+        rows = list(LAYOUTS.values()) * 3 + ['2024-02-30', 'x']
+        for variant in (None, *LAYOUTS):
+            days, errors = parse_iso_column(rows, -1, variant)
+            self.assertEqual(list(days), [expected] * 18 + [-1, -1])
+            self.assertEqual([index for index, _ in errors], [18, 19])
+            self.assertEqual((days, errors), parse_iso_dates(rows, -1))
+        days, errors = parse_iso_column(['x', 'y', '2024-03-05'],
+                                        sample_size=2)
+        self.assertEqual((list(days), len(errors)), ([0, 0, expected], 2))
+
+
+class DurationTest(unittest.TestCase):
+
+    def test_valid(self):
+        for text, expected in (
+                ('P1Y2M3DT4H5M6S', (1, 2, 0, 3, 4, 5, 6)),
+                ('P2W', (0, 0, 2, 0, 0, 0, 0)),
+                ('PT36H', (0, 0, 0, 0, 36, 0, 0)),
+                ('p1dt2h', (0, 0, 0, 1, 2, 0, 0)),
+                ('P0D', (0, 0, 0, 0, 0, 0, 0)),
+                ('PT90M', (0, 0, 0, 0, 0, 90, 0)),
+                ('P10Y', (10, 0, 0, 0, 0, 0, 0)),
+                ('PT0S', (0, 0, 0, 0, 0, 0, 0))):
+            self.assertEqual(parse_iso_duration(text), expected, text)
+        self.assertEqual(iso_duration_seconds('P1DT2H3M4S'), 93_784)
+        self.assertEqual(iso_duration_seconds('P2W'), 1_209_600)
+        self.assertEqual(TimeDelta.from_iso_duration('PT1M'),
+                         TimeDelta(minutes=1))
+
+    def test_invalid(self):
+        for text in ('', '1D', 'P', 'PT', 'P1DT', 'PD', 'P1H', 'PT1D',
+                     'P1D2M', 'PT1S1M', 'P1W1D', 'P1DD', 'P1D ', 'P1X',
+                     'P-1D', 'P1'):
+            with self.assertRaises(ValueError, msg=text):
+                parse_iso_duration(text)
+        for text in ('P1Y', 'P1M', 'PT1.5S'):
+            with self.assertRaises(ValueError, msg=text):
+                iso_duration_seconds(text)
+
+    def test_fractions_are_rejected(self):
+        for text in ('PT1.5S', 'PT0.5H', 'P1,5D', 'PT1H0.5M'):
+            with self.assertRaises(ValueError) as context:
+                parse_iso_duration(text)
+            self.assertEqual(context.exception.args,
+                             ('Fractional duration components are not '
+                              'supported', repr(text)))
+
+    def test_batch(self):
+        _cached_duration_seconds.cache_clear()
+        data = ['PT15M', 'P1D', 'PT15M', 'P1M', 'PT1.5S', 'PT15M', 'P1D']
+        seconds, errors = parse_iso_durations(data, fill=-1)
+        self.assertEqual(list(seconds),
+                         [900, 86_400, 900, -1, -1, 900, 86_400])
+        self.assertEqual([index for index, _ in errors], [3, 4])
+        self.assertEqual(errors[0],
+                         (3, "Years and months have no fixed length: 'P1M'"))
+        info = _cached_duration_seconds.cache_info()
+        self.assertEqual((info.hits, info.misses), (3, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import calendar
+import datetime
+import random
+import unittest
+from temporal import Date
+from temporal.ranges import DateRange
+
+
+def _naive(start: datetime.date, stop: datetime.date, step: int, unit: str):
+    "Step one element at a time, the reference for DateRange."
+    result = []
+    for k in range(10_000):
+        if unit == 'months':
+            month = start.year * 12 + start.month - 1 + k * step
+            year, month = divmod(month, 12)
+            day = min(start.day, calendar.monthrange(year, month + 1)[1])
+            date = datetime.date(year, month + 1, day)
+        else:
+            days = k * step * (7 if unit == 'weeks' else 1)
+            date = start + datetime.timedelta(days=days)
+        if (date >= stop) if step > 0 else (date <= stop):
+            break
+        result.append(Date(date.year, date.month, date.day))
+    return result
+
+
+def _date(date: datetime.date) -> Date:
+    return Date(date.year, date.month, date.day)
+
+
+class DateRangeTest(unittest.TestCase):
+
+    def test_matches_naive_loop(self):
+        rng = random.Random(13)
+        for _ in range(600):
+            unit = rng.choice(('days', 'weeks', 'months'))
+            start = datetime.date(rng.randint(1999, 2001), rng.randint(1, 12),
+                                  rng.randint(1, 28))
+            if rng.random() < 0.4:
+                # Month ends exercise the clamping of month steps
+                start = start.replace(day=calendar.monthrange(
+                    start.year, start.month)[1])
+            stop = start + datetime.timedelta(rng.randint(-800, 800))
+            step = rng.choice((1, 2, 3, 5, 12)) * rng.choice((1, -1))
+            expected = _naive(start, stop, step, unit)
+            dates = DateRange(_date(start), _date(stop), step, unit)
+            self.assertEqual(list(dates), expected, (start, stop, step, unit))
+            self.assertEqual(len(dates), len(expected))
+            self.assertEqual(bool(dates), bool(expected))
+            self.assertEqual(list(reversed(dates)), expected[::-1])
+            for index in range(-len(expected), len(expected)):
+                self.assertEqual(dates[index], expected[index])
+                self.assertEqual(dates.index(expected[index]),
+                                 index % len(expected))
+            with self.assertRaises(IndexError):
+                dates[len(expected)]
+            for piece in (slice(1, None), slice(None, None, -1),
+                          slice(2, -1, 3)):
+                self.assertEqual(list(dates[piece]), expected[piece])
+            members = set(expected)
+            low, high = sorted((start, stop))
+            for offset in range(0, (high - low).days + 1, 3):
+                date = _date(low + datetime.timedelta(offset))
+                self.assertEqual(date in dates, date in members, date)
+                self.assertEqual(dates.count(date), int(date in members))
+
+    def test_month_end_clamping(self):
+        dates = DateRange(Date(2024, 1, 31), Date(2024, 6, 1), 1, 'months')
+        self.assertEqual([date.day for date in dates], [31, 29, 31, 30, 31])
+        self.assertIn(Date(2024, 2, 29), dates)
+        self.assertNotIn(Date(2024, 2, 28), dates)
+        back = DateRange(Date(2024, 3, 31), Date(2023, 12, 31), -1, 'months')
+        self.assertEqual(list(back), [Date(2024, 3, 31), Date(2024, 2, 29),
+                                      Date(2024, 1, 31)])
+
+    def test_empty(self):
+        for start, stop, step in ((Date(2024, 1, 1), Date(2024, 1, 1), 1),
+                                  (Date(2024, 1, 2), Date(2024, 1, 1), 1),
+                                  (Date(2024, 1, 1), Date(2024, 1, 2), -1)):
+            for unit in ('days', 'weeks', 'months'):
+                dates = DateRange(start, stop, step, unit)
+                self.assertEqual((len(dates), list(dates), bool(dates)),
+                                 (0, [], False))
+                self.assertNotIn(start, dates)
+                with self.assertRaises(IndexError):
+                    dates[0]
+        self.assertEqual(DateRange(Date(2024, 1, 1), Date(2024, 1, 1)),
+                         DateRange(Date(2020, 5, 1), Date(2020, 1, 1)))
+
+    def test_rejects_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            DateRange(Date(2024, 1, 1), Date(2024, 2, 1), 0)
+        with self.assertRaises(ValueError):
+            DateRange(Date(2024, 1, 1), Date(2024, 2, 1), 1, 'years')
+        with self.assertRaises(TypeError):
+            DateRange(Date(2024, 1, 1), '2024-02-01')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import calendar
+import datetime
+import itertools
+import random
+import unittest
+from temporal import Date
+from temporal.business import BusinessCalendar
+from temporal.recurrence import (MonthlyBusinessDay, MonthlyDay,
+                                 MonthlyWeekday, Weekly)
+
+HOLIDAYS = (datetime.date(2024, 12, 31), datetime.date(2025, 1, 31),
+            datetime.date(2024, 5, 1))
+
+
+def _date(date: datetime.date) -> Date:
+    return Date(date.year, date.month, date.day)
+
+
+def _last_day(date: datetime.date) -> int:
+    return calendar.monthrange(date.year, date.month)[1]
+
+
+def _is_business_day(date: datetime.date) -> bool:
+    return date.weekday() < 5 and date not in HOLIDAYS
+
+
+def _brute(matches, start, stop):
+    "Every date in [start, stop) that matches, checked one by one."
+    result = []
+    date = start
+    while date < stop:
+        if matches(date):
+            result.append(_date(date))
+        date += datetime.timedelta(days=1)
+    return result
+
+
+class RecurrenceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(map(_date, HOLIDAYS))
+
+    def _rules(self, rng, start):
+        "Random rules paired with a day-by-day predicate."
+        interval = rng.randint(1, 4)
+        weekday = rng.randint(0, 6)
+        n = rng.choice((1, 2, 3, 4, 5, -1, -2, -5))
+        day = rng.choice((1, 15, 29, 30, 31, -1, -3, -31))
+        business_n = rng.choice((1, 2, 23, -1, -2))
+        start_month = start.year * 12 + start.month
+
+        def in_period(date):
+            month = date.year * 12 + date.month - start_month
+            return date >= start and month % interval == 0
+
+        def is_day(date):
+            last = _last_day(date)
+            target = min(day, last) if day > 0 else max(last + day + 1, 1)
+            return date.day == target
+
+        def is_nth_weekday(date):
+            if date.weekday() != weekday:
+                return False
+            if n > 0:
+                return (date.day - 1) // 7 + 1 == n
+            return (_last_day(date) - date.day) // 7 + 1 == -n
+
+        def is_nth_business_day(date):
+            if not _is_business_day(date):
+                return False
+            month = [date.replace(day=k)
+                     for k in range(1, _last_day(date) + 1)]
+            business = [d for d in month if _is_business_day(d)]
+            if business_n > len(business) or -business_n > len(business):
+                return False
+            index = business_n - 1 if business_n > 0 else business_n
+            return business[index] == date
+
+        first = start + datetime.timedelta((weekday - start.weekday()) % 7)
+        return [
+            (Weekly(_date(start), weekday, interval),
+             lambda d: d >= first and (d - first).days % (7 * interval) == 0),
+            (MonthlyDay(_date(start), day, interval),
+             lambda d: in_period(d) and is_day(d)),
+            (MonthlyWeekday(_date(start), weekday, n, interval),
+             lambda d: in_period(d) and is_nth_weekday(d)),
+            (MonthlyBusinessDay(_date(start), self.calendar, business_n,
+                                interval),
+             lambda d: in_period(d) and is_nth_business_day(d)),
+        ]
+
+    def test_rules_match_day_by_day(self):
+        rng = random.Random(21)
+        for _ in range(60):
+            start = datetime.date(rng.randint(1990, 2030), rng.randint(1, 12),
+                                  rng.randint(1, 28))
+            low = start + datetime.timedelta(rng.randint(-100, 400))
+            high = low + datetime.timedelta(rng.randint(0, 900))
+            for rule, matches in self._rules(rng, start):
+                expected = _brute(matches, low, high)
+                self.assertEqual(list(rule.between(_date(low), _date(high))),
+                                 expected, rule)
+                self.assertEqual(
+                    list(rule.occurrences(_date(low), _date(high))),
+                    expected, rule)
+                horizon = low + datetime.timedelta(1500)
+                following = _brute(matches, low + datetime.timedelta(1),
+                                   horizon)
+                result = rule.next_after(_date(low))
+                if following:
+                    self.assertEqual(result, following[0], rule)
+                else:
+                    self.assertTrue(result is None
+                                    or result >= _date(horizon), rule)
+                first = list(itertools.islice(rule, 3))
+                last = datetime.date(first[-1].year, first[-1].month,
+                                     first[-1].day)
+                self.assertEqual(
+                    first,
+                    _brute(matches, start, last + datetime.timedelta(1)),
+                    rule)
+
+    def test_in_month_matches_day_by_day(self):
+        for year in (2023, 2024):
+            for month in range(1, 13):
+                first = Date(year, month, 1)._days
+                stop = first + calendar.monthrange(year, month)[1]
+                start = Date(1990, 1, 1)
+                for day in (*range(1, 32), *range(-31, 0)):
+                    last = stop - first
+                    target = min(day, last) if day > 0 else max(
+                        last + day + 1, 1)
+                    self.assertEqual(
+                        MonthlyDay(start, day)._in_month(first, stop),
+                        first + target - 1)
+                for weekday, n in itertools.product(range(7), (1, 5, -1, -5)):
+                    days = [d for d in range(first, stop)
+                            if (d + 2) % 7 == weekday]
+                    expected = days[n - 1 if n > 0 else n] if (
+                        n > 0 and n <= len(days)
+                        or n < 0 and -n <= len(days)) else None
+                    self.assertEqual(
+                        MonthlyWeekday(start, weekday, n)._in_month(first,
+                                                                    stop),
+                        expected)
+
+    def test_between_stops_at_the_end_of_the_range(self):
+        visited = []
+
+        class Counted(MonthlyBusinessDay):
+            __slots__ = ()
+
+            def _occurrence(self, period):
+                visited.append(period)
+                return super()._occurrence(period)
+
+        # No month has 40 business days, so no period yields an occurrence
+        rule = Counted(Date(2024, 1, 1), self.calendar, n=40)
+        self.assertEqual(list(rule.between(Date(2024, 3, 10),
+                                           Date(2024, 6, 1))), [])
+        self.assertEqual(visited, [2, 3, 4])
+        visited.clear()
+        self.assertEqual(list(rule.occurrences(Date(2024, 1, 1),
+                                               Date(2024, 1, 1))), [])
+        self.assertEqual(visited, [])
+
+    def test_rejects_invalid_arguments(self):
+        start = Date(2024, 1, 1)
+        for build in (lambda: Weekly(start, 7),
+                      lambda: Weekly(start, 0, 0),
+                      lambda: MonthlyDay(start, 0),
+                      lambda: MonthlyDay(start, 32),
+                      lambda: MonthlyWeekday(start, 0, 6),
+                      lambda: MonthlyBusinessDay(start, self.calendar, 0)):
+            with self.assertRaises(ValueError):
+                build()
+        with self.assertRaises(TypeError):
+            MonthlyBusinessDay(start, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import pickle
+import random
+import unittest
+from temporal import Date, DateArray, Time
+from temporal.constants import MICROSECONDS_PER_DAY
+from temporal.serialization import (pack_many, unpack_date_array,
+                                    unpack_many)
+
+
+class SerializationTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(9)
+        self.dates = [Date._from_days(rng.randint(-10**6, 10**7))
+                      for _ in range(1_000)]
+        self.times = [Time._from_microseconds(
+            rng.randrange(MICROSECONDS_PER_DAY), rng.randint(0, 1))
+            for _ in range(1_000)]
+
+    def test_round_trip(self):
+        self.assertEqual(unpack_many(pack_many(self.dates), Date), self.dates)
+        self.assertEqual(unpack_date_array(pack_many(self.dates)),
+                         DateArray.from_dates(self.dates))
+        times = unpack_many(pack_many(self.times), Time)
+        self.assertEqual(times, self.times)
+        self.assertEqual([time.fold for time in times],
+                         [time.fold for time in self.times])
+        for value in self.dates[:50]:
+            self.assertEqual(Date.from_bytes(value.to_bytes()), value)
+            self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+        for value in self.times[:50]:
+            self.assertEqual(Time.from_bytes(value.to_bytes()), value)
+            self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+
+    def test_rejects_out_of_range(self):
+        with self.assertRaises(OverflowError):
+            Date._from_days(1 << 31).to_bytes()
+        with self.assertRaises(OverflowError):
+            pack_many([Date(2024, 1, 1), Date._from_days(1 << 31)])
+        for value in (MICROSECONDS_PER_DAY, 10**12, (1 << 63) - 1):
+            for fold in (0, 1):
+                data = (value | fold << 63).to_bytes(8, 'little')
+                with self.assertRaises(ValueError):
+                    Time.from_bytes(data)
+                with self.assertRaises(ValueError):
+                    unpack_many(pack_many(self.times[:3]) + data, Time)
+        with self.assertRaises(ValueError):
+            unpack_many(b'\0' * 7, Time)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+from array import array
+import copy
+import datetime
+import pickle
+import random
+import unittest
+from temporal import Date, DateTime, TimeDelta
+
+
+def _date(date: datetime.date) -> Date:
+    return Date(date.year, date.month, date.day)
+
+
+def _fields(date):
+    return date.year, date.month, date.day
+
+
+def _random_dates(seed, count=5_000):
+    rng = random.Random(seed)
+    return [datetime.date.fromordinal(rng.randint(400, 3_600_000))
+            for _ in range(count)]
+
+
+class DateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dates = _random_dates(5)
+
+    def test_weekday_and_ordinal(self):
+        for date in self.dates:
+            value = _date(date)
+            self.assertEqual(value.weekday(), date.weekday())
+            self.assertEqual(value.iso_weekday(), date.isoweekday())
+            self.assertEqual(value.as_ordinal(), date.toordinal())
+            self.assertEqual(value.day_of_year(), date.timetuple().tm_yday)
+            self.assertEqual(_fields(Date.from_ordinal(date.toordinal())),
+                             _fields(date))
+
+    def test_ordering_matches_datetime(self):
+        pairs = list(zip(self.dates, self.dates[1:] + self.dates[:1]))
+        pairs += [(date, date) for date in self.dates[:100]]
+        for a, b in pairs:
+            x, y = _date(a), _date(b)
+            self.assertEqual((x < y, x <= y, x == y, x != y, x >= y, x > y),
+                             (a < b, a <= b, a == b, a != b, a >= b, a > b))
+            if a == b:
+                self.assertEqual(hash(x), hash(y))
+        self.assertEqual([_fields(d) for d in sorted(map(_date, self.dates))],
+                         [_fields(d) for d in sorted(self.dates)])
+
+
+class TimeDeltaTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(6)
+        self.pairs = []
+        for date in _random_dates(6):
+            delta = datetime.timedelta(
+                days=rng.randint(-300, 300),
+                seconds=rng.randint(-86_400, 86_400),
+                microseconds=rng.randint(-10**6, 10**6))
+            self.pairs.append((date, delta))
+
+    @staticmethod
+    def _delta(delta: datetime.timedelta) -> TimeDelta:
+        return TimeDelta(days=delta.days, seconds=delta.seconds,
+                         microseconds=delta.microseconds)
+
+    def test_components(self):
+        for _, delta in self.pairs:
+            value = self._delta(delta)
+            self.assertEqual((value.days, value.seconds, value.microseconds),
+                             (delta.days, delta.seconds, delta.microseconds))
+            self.assertEqual(value.total_seconds(), delta.total_seconds())
+
+    def test_date_arithmetic(self):
+        for date, delta in self.pairs:
+            value = self._delta(delta)
+            self.assertEqual(_fields(_date(date) + value),
+                             _fields(date + delta))
+            self.assertEqual(_fields(value + _date(date)),
+                             _fields(delta + date))
+            self.assertEqual(_fields(_date(date) - value),
+                             _fields(date - delta))
+
+    def test_sub_date(self):
+        for (a, _), (b, _) in zip(self.pairs, self.pairs[1:]):
+            result = _date(a) - _date(b)
+            self.assertIsInstance(result, TimeDelta)
+            self.assertEqual((result.days, result.seconds),
+                             ((a - b).days, 0))
+
+    def test_pickle_and_copy(self):
+        for _, delta in self.pairs[:100]:
+            value = self._delta(delta)
+            for result in (pickle.loads(pickle.dumps(value)),
+                           copy.copy(value), copy.deepcopy(value)):
+                self.assertIs(type(result), TimeDelta)
+                self.assertEqual(result, value)
+
+
+class DateTimeTest(unittest.TestCase):
+
+    def test_from_timestamps(self):
+        seconds = [-86_400 * 365, -1, 0, 1, 1_700_000_000, 4_102_444_800]
+        expected = [DateTime.from_timestamp(value) for value in seconds]
+        floats = array('d', [value + 0.25 for value in seconds])
+        for values in (seconds, array('q', seconds),
+                       memoryview(array('q', seconds))):
+            self.assertEqual(DateTime.from_timestamps(values), expected)
+        self.assertEqual(
+            DateTime.from_timestamps(array('q', seconds).tobytes(), 'q'),
+            expected)
+        self.assertEqual(DateTime.from_timestamps(memoryview(floats)),
+                         [DateTime.from_timestamp(value) for value in floats])
+        self.assertEqual(DateTime.from_timestamps(floats.tobytes(), 'd'),
+                         [DateTime.from_timestamp(value) for value in floats])
+
+    def test_from_timestamps_rejects_raw_buffers(self):
+        data = array('q', [0, 1]).tobytes()
+        for values in (data, bytearray(data), memoryview(data),
+                       array('i', [0, 1])):
+            with self.assertRaises(TypeError):
+                DateTime.from_timestamps(values)
+        with self.assertRaises(ValueError):
+            DateTime.from_timestamps(data, 'B')
+
+
+if __name__ == '__main__':
+    unittest.main()
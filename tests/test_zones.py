@@ -0,0 +1,224 @@
+import datetime
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import unittest
+import zoneinfo
+from temporal.constants import MICROSECONDS_PER_SECOND
+from temporal.types import DateTime
+from temporal.zones import TZPATH, ZoneLoader, _TZRule, make_tzif, parse_tzif
+
+KEYS = ('Europe/Stockholm', 'America/New_York', 'Europe/Dublin',
+        'America/Nuuk', 'Australia/Lord_Howe', 'Australia/Sydney',
+        'America/Santiago', 'Africa/Casablanca', 'Asia/Tokyo')
+
+UTC = datetime.timezone.utc
+EPOCH = datetime.datetime(1970, 1, 1)
+# 1900-01-01 to 2200-01-01 UTC
+FIRST, LAST = -2_208_988_800, 7_258_118_400
+
+# zic source for zones whose slim files have a single transition
+ZIC_SOURCE = '''\
+Rule\tEU\t1981\tmax\t-\tMar\tlastSun\t1:00u\t1:00\tS
+Rule\tEU\t1996\tmax\t-\tOct\tlastSun\t1:00u\t0\t-
+Zone\tTest/Stockholm\t1:00\tEU\tCE%sT
+Rule\tUS\t2007\tmax\t-\tMar\tSun>=8\t2:00\t1:00\tD
+Rule\tUS\t2007\tmax\t-\tNov\tSun>=1\t2:00\t0\tS
+Zone\tTest/New_York\t-5:00\tUS\tE%sT
+'''
+
+
+def _has_system_zones():
+    try:
+        return all(zoneinfo.ZoneInfo(key) for key in KEYS) and any(
+            os.path.isfile(os.path.join(path, KEYS[0])) for path in TZPATH)
+    except zoneinfo.ZoneInfoNotFoundError:
+        return False
+
+
+def _timestamp(year, month, day, hour=0):
+    return int(datetime.datetime(year, month, day, hour,
+                                 tzinfo=UTC).timestamp())
+
+
+def _slim(zone, footer, until):
+    "TZif bytes of zone with the transitions from until on left to footer."
+    initial = (zone._offsets[0], 0, zone._abbreviations[0])
+    transitions = [(time, zone._offsets[index + 1], 0,
+                    zone._abbreviations[index + 1])
+                   for index, time in enumerate(zone._transitions)
+                   if time < until]
+    return make_tzif(initial, transitions, footer)
+
+
+class TZRuleTest(unittest.TestCase):
+
+    def test_parse(self):
+        for text, std, dst in (
+                ('CET-1CEST,M3.5.0,M10.5.0/3', 3600, 7200),
+                ('<+03>-3', 10800, None),
+                ('IST-1GMT0,M10.5.0,M3.5.0/1', 3600, 0),
+                ('<-02>2<-01>,M3.5.0/-1,M10.5.0/0', -7200, -3600),
+                ('<+1030>-10:30<+11>-11,M10.1.0,M4.1.0', 37800, 39600),
+                ('EST5EDT,0/0,J365/25', -18000, -14400),
+                ('AAA3BBB,J60/2:30:15,300/-167', -10800, -7200)):
+            rule = _TZRule(text)
+            self.assertEqual((rule.std_offset, rule.dst_offset), (std, dst))
+
+    def test_transitions(self):
+        rule = _TZRule('CET-1CEST,M3.5.0,M10.5.0/3')
+        self.assertEqual(rule.transitions(2024),
+                         [(_timestamp(2024, 3, 31, 1), 7200, 'CEST'),
+                          (_timestamp(2024, 10, 27, 1), 3600, 'CET')])
+        # J60 skips February 29, 59 counts it
+        rule = _TZRule('AAA0BBB0,J60/0,59/0')
+        self.assertEqual([time for time, *_ in rule.transitions(2024)],
+                         [_timestamp(2024, 2, 29), _timestamp(2024, 3, 1)])
+
+    def test_rejects_invalid(self):
+        for text in ('', 'CET', 'CET-1CEST', 'CET-1CEST,M3.5.0',
+                     'CET-1CEST,M13.1.0,M1.1.0', 'CET-1CEST,J0,J1',
+                     'CET-1CEST,M3.5.0,M10.5.0/168', '<AB>1', 'CET-1x',
+                     'CET-1CEST,M3.5.7,M10.5.0'):
+            with self.assertRaises(ValueError, msg=text):
+                _TZRule(text)
+
+
+@unittest.skipUnless(_has_system_zones(), 'system zoneinfo files not found')
+class ZoneInfoTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = ZoneLoader()
+
+    def assertMatches(self, zone, key, seconds):
+        "Compare every lookup of zone at seconds with zoneinfo."
+        info = zoneinfo.ZoneInfo(key)
+        local = datetime.datetime.fromtimestamp(seconds, UTC).astimezone(info)
+        offset = int(local.utcoffset().total_seconds())
+        self.assertEqual(zone.utcoffset(seconds), offset, (key, seconds))
+        self.assertEqual(zone.abbreviation(seconds), local.tzname())
+        wall = local.replace(tzinfo=None) - EPOCH
+        wall = int(wall.total_seconds())
+        self.assertEqual(zone.local_offset(wall, local.fold), offset)
+        for fold in (0, 1):
+            naive = (EPOCH + datetime.timedelta(seconds=wall)).replace(
+                tzinfo=info, fold=fold)
+            self.assertEqual(zone.local_offset(wall, fold),
+                             int(naive.utcoffset().total_seconds()),
+                             (key, wall, fold))
+
+    def check(self, zone, key, rng, first=FIRST, last=LAST):
+        for _ in range(2_000):
+            self.assertMatches(zone, key, rng.randrange(first, last))
+        for year in (2024, 2037, 2038, 2100, 9998):
+            for month in (1, 3, 4, 7, 10, 11):
+                self.assertMatches(zone, key, _timestamp(year, month, 15, 12))
+
+    def test_fat_files(self):
+        rng = random.Random(17)
+        for key in KEYS:
+            self.check(self.loader.get(key), key, rng)
+
+    def test_truncated_files(self):
+        rng = random.Random(170)
+        for key in KEYS:
+            if key == 'Africa/Casablanca':
+                # Its listed transitions run to 2087 and the footer only
+                # holds the offset that follows them.
+                continue
+            data = self.loader._read(key)
+            footer = data.rstrip(b'\n').rsplit(b'\n', 1)[1].decode('ascii')
+            zone = parse_tzif(data)
+            # The footers describe the rules in force since 2024 at most
+            for year in (2025, 2030, 2037):
+                until = _timestamp(year, 1, 1)
+                slim = parse_tzif(_slim(zone, footer, until), key)
+                self.check(slim, key, rng, first=until)
+
+    @unittest.skipUnless(shutil.which('zic'), 'zic not found')
+    def test_zic_slim_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'source')
+            with open(source, 'w') as file:
+                file.write(ZIC_SOURCE)
+            subprocess.run(['zic', '-b', 'slim', '-d', directory, source],
+                           check=True)
+            loader = ZoneLoader(directory)
+            stockholm = loader.get('Test/Stockholm')
+            new_york = loader.get('Test/New_York')
+        self.assertEqual(len(stockholm), 1)
+        self.assertEqual(
+            stockholm.to_local(DateTime(2024, 1, 15, 12)),
+            DateTime(2024, 1, 15, 13))
+        self.assertEqual(
+            new_york.to_local(DateTime(2024, 1, 15, 12)),
+            DateTime(2024, 1, 15, 7))
+        rng = random.Random(1700)
+        self.check(stockholm, 'Europe/Stockholm', rng,
+                   first=_timestamp(1997, 1, 1))
+        self.check(new_york, 'America/New_York', rng,
+                   first=_timestamp(2008, 1, 1))
+
+    def test_bulk_conversions_match_scalar(self):
+        rng = random.Random(1717)
+        for key in KEYS:
+            zone = parse_tzif(self.loader._read(key), key)
+            values = sorted(rng.randrange(FIRST, 2 * LAST)
+                            * MICROSECONDS_PER_SECOND
+                            + rng.randrange(MICROSECONDS_PER_SECOND)
+                            for _ in range(3_000))
+            local = zone.utc_to_local_many(values)
+            self.assertEqual(list(local), [
+                value + zone.utcoffset(value // MICROSECONDS_PER_SECOND)
+                * MICROSECONDS_PER_SECOND for value in values])
+            for fold in (0, 1):
+                self.assertEqual(list(zone.local_to_utc_many(local, fold)), [
+                    value - zone.local_offset(value // MICROSECONDS_PER_SECOND,
+                                              fold) * MICROSECONDS_PER_SECOND
+                    for value in local])
+
+
+class FooterTest(unittest.TestCase):
+
+    def test_footer_only(self):
+        data = make_tzif((3600, 0, 'CET'),
+                         footer='CET-1CEST,M3.5.0,M10.5.0/3')
+        zone = parse_tzif(data, 'CET')
+        self.assertEqual(zone.to_local(DateTime(2024, 1, 15, 12)),
+                         DateTime(2024, 1, 15, 13))
+        self.assertEqual(zone.to_local(DateTime(2024, 7, 15, 12)),
+                         DateTime(2024, 7, 15, 14))
+        self.assertEqual(zone.abbreviation(_timestamp(2050, 7, 1)), 'CEST')
+        self.assertEqual(zone.to_utc(DateTime(2024, 10, 27, 2, 30, fold=1)),
+                         DateTime(2024, 10, 27, 1, 30))
+
+    def test_without_footer_keeps_last_offset(self):
+        zone = parse_tzif(make_tzif((0, 0, 'UTC'), [(0, 3600, 0, 'ONE')]))
+        self.assertEqual(zone.utcoffset(_timestamp(9000, 1, 1)), 3600)
+
+    def test_all_year_daylight_saving_time(self):
+        zone = parse_tzif(make_tzif((-18000, 0, 'EST'),
+                                    footer='EST5EDT,0/0,J365/25'))
+        for year in (2024, 2025, 2100):
+            for month in (1, 6, 12):
+                self.assertEqual(
+                    zone.utcoffset(_timestamp(year, month, 15)), -14400)
+
+    def test_rejects_years_past_9999(self):
+        zone = parse_tzif(make_tzif((3600, 0, 'CET'),
+                                    footer='CET-1CEST,M3.5.0,M10.5.0/3'))
+        with self.assertRaises(ValueError):
+            zone.utcoffset(_timestamp(9999, 12, 31) + 10 * 86_400)
+
+    def test_invalid_footer(self):
+        data = make_tzif((3600, 0, 'CET'), footer='CET-1CEST')
+        with self.assertRaises(ValueError):
+            parse_tzif(data)
+        with self.assertRaises(ValueError):
+            parse_tzif(data[:-1])
+
+
+if __name__ == '__main__':
+    unittest.main()